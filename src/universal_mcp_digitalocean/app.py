@@ -1,11 +1,1068 @@
-from typing import Any, Optional, List
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Iterator, Optional, List
+
+import httpx
+from loguru import logger
 from universal_mcp.applications import APIApplication
+from universal_mcp.exceptions import ToolError
 from universal_mcp.integrations import Integration
+from universal_mcp.tools.tools import Tool
+
+try:
+    import orjson
+except ImportError:  # faster JSON is optional: pip install universal-mcp-digitalocean[speedups]
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode()
+
+try:
+    from prometheus_client import Counter, Histogram
+except ImportError:  # metrics are optional: pip install universal-mcp-digitalocean[metrics]
+    Counter = Histogram = None
+
+if Histogram is not None:
+    TOOL_LATENCY = Histogram(
+        "do_mcp_tool_duration_seconds",
+        "Latency of DigitalOcean MCP tool calls.",
+        ["tool"],
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10),
+    )
+    TOOL_CALLS = Counter("do_mcp_tool_calls_total", "DigitalOcean MCP tool calls by outcome.", ["tool", "result"])
+else:
+    TOOL_LATENCY = TOOL_CALLS = None
+
+_TOOL_NAMES: tuple[str, ...] = (
+    "one_clicks_list",
+    "one_clicks_install_kubernetes",
+    "account_get",
+    "ssh_keys_list",
+    "ssh_keys_create",
+    "ssh_keys_get",
+    "ssh_keys_update",
+    "ssh_keys_delete",
+    "actions_list",
+    "actions_get",
+    "apps_list",
+    "apps_create",
+    "apps_delete",
+    "apps_get",
+    "apps_update",
+    "apps_restart",
+    "get_app_component_logs",
+    "get_component_execution_details",
+    "apps_get_instances",
+    "apps_list_deployments",
+    "apps_create_deployment",
+    "apps_get_deployment",
+    "apps_cancel_deployment",
+    "apps_get_logs",
+    "apps_get_logs_aggregate",
+    "apps_get_exec",
+    "get_app_logs",
+    "apps_list_instance_sizes",
+    "apps_get_instance_size",
+    "apps_list_regions",
+    "apps_validate_app_spec",
+    "apps_list_alerts",
+    "apps_assign_alert_destinations",
+    "apps_create_rollback",
+    "apps_validate_rollback",
+    "apps_commit_rollback",
+    "apps_revert_rollback",
+    "get_app_bandwidth_daily",
+    "create_daily_bandwidth_metrics",
+    "apps_get_health",
+    "cdn_list_endpoints",
+    "cdn_create_endpoint",
+    "cdn_get_endpoint",
+    "cdn_update_endpoints",
+    "cdn_delete_endpoint",
+    "cdn_purge_cache",
+    "cdn_purge_cache_many",
+    "certificates_list",
+    "certificates_create",
+    "certificates_get",
+    "certificates_delete",
+    "balance_get",
+    "billing_history_list",
+    "invoices_list",
+    "invoices_get_by_uuid",
+    "invoices_get_csv_by_uuid",
+    "invoices_get_pdf_by_uuid",
+    "invoices_get_summary_by_uuid",
+    "databases_list_options",
+    "databases_list_clusters",
+    "databases_create_cluster",
+    "databases_get_cluster",
+    "databases_get_cluster_overview",
+    "databases_destroy_cluster",
+    "databases_get_config",
+    "databases_patch_config",
+    "databases_get_ca",
+    "databases_get_migration_status",
+    "start_online_migration",
+    "delete_online_migration_by_id",
+    "databases_update_region",
+    "databases_update_cluster_size",
+    "databases_list_firewall_rules",
+    "update_database_cluster_firewall",
+    "update_database_maintenance",
+    "databases_install_update",
+    "databases_list_backups",
+    "databases_list_replicas",
+    "databases_list_replicas_detailed",
+    "databases_create_replica",
+    "databases_list_events_logs",
+    "databases_get_replica",
+    "databases_destroy_replica",
+    "databases_promote_replica",
+    "databases_list_users",
+    "databases_add_user",
+    "databases_get_user",
+    "databases_get_users_many",
+    "databases_delete_user",
+    "databases_update_user",
+    "databases_reset_auth",
+    "databases_list",
+    "databases_add",
+    "databases_get",
+    "databases_delete",
+    "databases_list_connection_pools",
+    "databases_add_connection_pool",
+    "databases_get_connection_pool",
+    "update_database_pool",
+    "delete_pool",
+    "databases_get_eviction_policy",
+    "update_eviction_policy",
+    "databases_get_sql_mode",
+    "databases_update_sql_mode",
+    "databases_update_major_version",
+    "databases_list_kafka_topics",
+    "databases_create_kafka_topic",
+    "databases_get_kafka_topic",
+    "databases_update_kafka_topic",
+    "databases_delete_kafka_topic",
+    "databases_list_logsink",
+    "databases_create_logsink",
+    "databases_get_logsink",
+    "databases_update_logsink",
+    "databases_delete_logsink",
+    "get_database_metrics_credentials",
+    "update_database_credentials",
+    "list_database_indexes",
+    "delete_database_index_by_name",
+    "domains_list",
+    "domains_create",
+    "domains_get",
+    "domains_delete",
+    "domains_list_records",
+    "domains_create_record",
+    "domains_get_record",
+    "domains_patch_record",
+    "domains_update_record",
+    "domains_delete_record",
+    "droplets_list",
+    "droplets_create",
+    "droplets_destroy_by_tag",
+    "droplets_get",
+    "droplets_destroy",
+    "droplets_list_backups",
+    "droplets_get_backup_policy",
+    "droplets_list_backup_policies",
+    "list_supported_policies",
+    "droplets_list_snapshots",
+    "droplet_actions_list",
+    "droplet_actions_post",
+    "droplet_actions_post_by_tag",
+    "droplet_actions_get",
+    "droplets_list_kernels",
+    "droplets_list_firewalls",
+    "droplets_list_neighbors",
+    "destroy_droplet_with_resources",
+    "destroy_select",
+    "delete_droplet_resources",
+    "get_droplet_status",
+    "retry_droplet_with_resources",
+    "autoscalepools_list",
+    "autoscalepools_create",
+    "autoscalepools_get",
+    "autoscalepools_update",
+    "autoscalepools_delete",
+    "delete_autoscale_pool_dangerously",
+    "autoscalepools_list_members",
+    "autoscalepools_list_history",
+    "firewalls_list",
+    "firewalls_create",
+    "firewalls_get",
+    "firewalls_update",
+    "firewalls_delete",
+    "firewalls_assign_droplets",
+    "firewalls_delete_droplets",
+    "firewalls_add_tags",
+    "firewalls_delete_tags",
+    "firewalls_add_rules",
+    "firewalls_delete_rules",
+    "floating_ips_list",
+    "floating_ips_create",
+    "floating_ips_get",
+    "floating_ips_delete",
+    "floating_ips_action_list",
+    "floating_ips_action_post",
+    "floating_ips_action_get",
+    "functions_list_namespaces",
+    "functions_create_namespace",
+    "functions_get_namespace",
+    "functions_delete_namespace",
+    "functions_list_triggers",
+    "functions_create_trigger",
+    "functions_get_trigger",
+    "functions_update_trigger",
+    "functions_delete_trigger",
+    "images_list",
+    "images_create_custom",
+    "images_get",
+    "images_update",
+    "images_delete",
+    "image_actions_list",
+    "image_actions_post",
+    "image_actions_get",
+    "kubernetes_list_clusters",
+    "kubernetes_create_cluster",
+    "kubernetes_get_cluster",
+    "kubernetes_update_cluster",
+    "kubernetes_delete_cluster",
+    "destroy_cluster_resources",
+    "delete_cluster_resources",
+    "destroy_cluster_with_resources",
+    "kubernetes_get_kubeconfig",
+    "kubernetes_get_credentials",
+    "get_cluster_upgrades",
+    "kubernetes_upgrade_cluster",
+    "kubernetes_list_node_pools",
+    "kubernetes_add_node_pool",
+    "kubernetes_get_node_pool",
+    "kubernetes_update_node_pool",
+    "kubernetes_delete_node_pool",
+    "kubernetes_delete_node",
+    "kubernetes_recycle_node_pool",
+    "kubernetes_get_cluster_user",
+    "kubernetes_list_options",
+    "kubernetes_run_cluster_lint",
+    "get_cluster_lint",
+    "kubernetes_add_registry",
+    "kubernetes_remove_registry",
+    "kubernetes_get_status_messages",
+    "load_balancers_create",
+    "load_balancers_list",
+    "load_balancers_get",
+    "load_balancers_update",
+    "load_balancers_delete",
+    "load_balancers_delete_cache",
+    "load_balancers_add_droplets",
+    "load_balancers_remove_droplets",
+    "add_forwarding_rule",
+    "delete_lb_forwarding_rules",
+    "monitoring_list_alert_policy",
+    "monitoring_create_alert_policy",
+    "monitoring_get_alert_policy",
+    "monitoring_update_alert_policy",
+    "monitoring_delete_alert_policy",
+    "get_droplet_bandwidth_metrics",
+    "get_droplet_cpu_metrics",
+    "get_droplet_filesystem_free",
+    "get_droplet_filesystem_size",
+    "get_droplet_load_metrics",
+    "get_droplet_load5_metrics",
+    "get_droplet_load_metric",
+    "get_droplet_memory_cached",
+    "get_droplet_memory_free",
+    "get_droplet_memory_total",
+    "get_droplet_memory_available",
+    "get_app_memory_percentage",
+    "get_app_cpu_metrics",
+    "get_app_restart_count",
+    "get_frontend_connections",
+    "get_lb_frontend_connections_limit",
+    "get_frontend_cpu_utilization",
+    "get_frontend_firewall_bytes",
+    "get_lb_frontend_fw_dropped_pkts",
+    "get_load_balancer_responses",
+    "fetch_frontend_request_rate",
+    "get_frontend_network_throughput",
+    "get_frontend_udp_throughput",
+    "get_frontend_tcp_throughput",
+    "get_frontend_nlb_tcp_throughput",
+    "get_nlb_udp_throughput",
+    "get_frontend_tls_connections",
+    "get_frontend_tls_connections_limit",
+    "get_tls_exceeding_rate_limit",
+    "get_droplet_session_duration_avg",
+    "get_droplet_session_duration_50p",
+    "get_droplet_session_duration_95p",
+    "get_droplet_response_time",
+    "get_droplet_http_response_time",
+    "get_droplets_http_response_timep_95p",
+    "get_droplets_http_response_timep_99p",
+    "get_droplet_queue_size",
+    "get_droplet_responses",
+    "get_droplet_connections",
+    "get_droplet_health_checks",
+    "get_load_balancer_downtime",
+    "get_current_autoscale_instances",
+    "list_target_instances",
+    "get_droplet_cpu_utilization",
+    "get_droplet_target_cpu_utilization",
+    "get_droplet_memory_utilization",
+    "get_autoscale_memory_target",
+    "monitoring_get_batch",
+    "monitoring_create_destination",
+    "monitoring_list_destinations",
+    "monitoring_get_destination",
+    "monitoring_update_destination",
+    "monitoring_delete_destination",
+    "monitoring_create_sink",
+    "monitoring_list_sinks",
+    "monitoring_get_sink",
+    "monitoring_delete_sink",
+    "partner_attachments_list",
+    "partner_attachments_create",
+    "partner_attachments_get",
+    "partner_attachments_patch",
+    "partner_attachments_delete",
+    "get_bgp_auth_key_by_pa_id",
+    "get_partner_network_remote_routes",
+    "update_remote_routes",
+    "get_partner_service_key",
+    "create_service_key",
+    "projects_list",
+    "projects_create",
+    "projects_get_default",
+    "projects_update_default",
+    "projects_patch_default",
+    "projects_get",
+    "projects_update",
+    "projects_patch",
+    "projects_delete",
+    "projects_list_resources",
+    "projects_assign_resources",
+    "list_project_resources",
+    "create_default_project_resource",
+    "regions_list",
+    "registry_get",
+    "registry_create",
+    "registry_delete",
+    "registry_get_subscription",
+    "registry_update_subscription",
+    "registry_get_docker_credentials",
+    "registry_validate_name",
+    "registry_list_repositories",
+    "registry_list_repositories_v",
+    "registry_list_repository_tags",
+    "registry_delete_repository_tag",
+    "get_repository_digests",
+    "delete_manifest_digest",
+    "registry_run_garbage_collection",
+    "registry_get_garbage_collection",
+    "list_registry_garbage_collections",
+    "update_garbage_collection",
+    "registry_get_options",
+    "droplets_list_neighbors_ids",
+    "reserved_ips_list",
+    "reserved_ips_create",
+    "reserved_ips_get",
+    "reserved_ips_delete",
+    "reserved_ips_actions_list",
+    "reserved_ips_actions_post",
+    "reserved_ips_actions_get",
+    "reserved_ipv_list",
+    "reserved_ipv_create",
+    "reserved_ipv_get",
+    "reserved_ipv_delete",
+    "reserved_ipv_actions_post",
+    "sizes_list",
+    "snapshots_list",
+    "snapshots_get",
+    "snapshots_delete",
+    "spaces_key_list",
+    "spaces_key_create",
+    "spaces_key_get",
+    "spaces_key_delete",
+    "spaces_key_update",
+    "spaces_key_patch",
+    "tags_list",
+    "tags_create",
+    "tags_get",
+    "tags_delete",
+    "tags_assign_resources",
+    "tags_unassign_resources",
+    "volumes_list",
+    "volumes_create",
+    "volumes_delete_by_name",
+    "volume_actions_post",
+    "volume_snapshots_get_by_id",
+    "volume_snapshots_delete_by_id",
+    "volumes_get",
+    "volumes_delete",
+    "volume_actions_list",
+    "volume_actions_post_by_id",
+    "volume_actions_get",
+    "volume_snapshots_list",
+    "volume_snapshots_create",
+    "vpcs_list",
+    "vpcs_create",
+    "vpcs_get",
+    "vpcs_update",
+    "vpcs_patch",
+    "vpcs_delete",
+    "vpcs_list_members",
+    "vpcs_list_peerings",
+    "vpcs_create_peerings",
+    "vpcs_patch_peerings",
+    "vpc_peerings_list",
+    "vpc_peerings_create",
+    "vpc_peerings_get",
+    "vpc_peerings_patch",
+    "vpc_peerings_delete",
+    "uptime_list_checks",
+    "uptime_create_check",
+    "uptime_get_check",
+    "uptime_update_check",
+    "uptime_delete_check",
+    "uptime_get_check_state",
+    "uptime_list_alerts",
+    "uptime_create_alert",
+    "uptime_get_alert",
+    "uptime_update_alert",
+    "uptime_delete_alert",
+    "genai_list_agents",
+    "genai_create_agent",
+    "genai_list_agent_api_keys",
+    "genai_create_agent_api_key",
+    "genai_update_agent_api_key",
+    "genai_delete_agent_api_key",
+    "genai_regenerate_agent_api_key",
+    "genai_attach_agent_function",
+    "genai_update_agent_function",
+    "genai_detach_agent_function",
+    "genai_attach_knowledge_bases",
+    "genai_attach_knowledge_base",
+    "genai_detach_knowledge_base",
+    "genai_attach_agent",
+    "genai_update_attached_agent",
+    "genai_detach_agent",
+    "genai_get_agent",
+    "genai_update_agent",
+    "genai_delete_agent",
+    "genai_get_agent_children",
+    "update_deployment_visibility",
+    "genai_list_agent_versions",
+    "update_agent_version_by_uuid",
+    "genai_list_anthropic_api_keys",
+    "genai_create_anthropic_api_key",
+    "genai_get_anthropic_api_key",
+    "genai_update_anthropic_api_key",
+    "genai_delete_anthropic_api_key",
+    "list_agents_by_key_uuid",
+    "genai_list_indexing_jobs",
+    "genai_create_indexing_job",
+    "list_job_data_sources",
+    "genai_get_indexing_job",
+    "genai_cancel_indexing_job",
+    "genai_list_knowledge_bases",
+    "genai_create_knowledge_base",
+    "list_data_source_by_knowledge_base",
+    "add_data_source",
+    "delete_data_source_by_uuid",
+    "genai_get_knowledge_base",
+    "genai_update_knowledge_base",
+    "genai_delete_knowledge_base",
+    "genai_list_models",
+    "genai_list_model_api_keys",
+    "genai_create_model_api_key",
+    "genai_update_model_api_key",
+    "genai_delete_model_api_key",
+    "genai_regenerate_model_api_key",
+    "genai_list_openai_api_keys",
+    "genai_create_openai_api_key",
+    "genai_get_openai_api_key",
+    "genai_update_openai_api_key",
+    "genai_delete_openai_api_key",
+    "get_agents_by_key_uuid",
+    "genai_list_datacenter_regions",
+    "inventory_scan",
+    "flush_cache",
+)
+
+
+_INVENTORY_KINDS = {
+    "apps": "apps_list",
+    "cdn_endpoints": "cdn_list_endpoints",
+    "certificates": "certificates_list",
+    "databases": "databases_list_clusters",
+    "domains": "domains_list",
+    "droplets": "droplets_list",
+    "firewalls": "firewalls_list",
+    "kubernetes_clusters": "kubernetes_list_clusters",
+    "load_balancers": "load_balancers_list",
+    "projects": "projects_list",
+    "reserved_ips": "reserved_ips_list",
+    "snapshots": "snapshots_list",
+    "ssh_keys": "ssh_keys_list",
+    "tags": "tags_list",
+    "uptime_checks": "uptime_list_checks",
+    "volumes": "volumes_list",
+    "vpcs": "vpcs_list",
+}
+
+_CATALOG_TTL = 3600.0
+_LISTING_TTL = 60.0
+_DETAIL_TTL = 20.0
+_HOT_TTL = 5.0
+_TTL_CACHE_MAXSIZE = 256
+_ETAG_CACHE_MAXSIZE = 256
+_FETCH_CONCURRENCY = 20
+_MAX_PER_PAGE = 200
+_BANDWIDTH_BATCH_SIZE = 50
+_PURGE_BATCH_SIZE = 250
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+_JSON_CONTENT_TYPE = {'Content-Type': 'application/json'}
+_DANGEROUS_HEADERS = {'X-Dangerous': 'true'}
+_CONNECT_TIMEOUT = 5.0
+_MAX_CONNECTIONS = 64
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_JITTER = 0.2
+_MAX_RETRY_DELAY = 30.0
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE'})
+_RATE_LIMIT_FLOOR = 10
+_PEM_BLOCK = re.compile(r'-----BEGIN ([A-Z0-9 ]+)-----\s.*?-----END \1-----', re.DOTALL)
+_WEEKDAYS = frozenset(('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'))
+_MAINTENANCE_HOUR = re.compile(r'(?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d)?')
+_DATABASE_NODE_RANGE = range(1, 4)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    return value
+
+
+def _require(**params: Any) -> None:
+    """
+    Raises ValueError naming the first of `params` that is None.
+    """
+    for name, value in params.items():
+        if value is None:
+            raise ValueError(f"Missing required parameter '{name}'.")
+
+
+def _check_pem(name: str, value: str | None, label: str) -> None:
+    """
+    Raises ValueError unless `value` is None or made up only of PEM blocks, at least one of which has a label ending with `label`, so a pasted wrong string fails before the request is sent.
+
+    Other blocks, such as the `EC PARAMETERS` block `openssl ecparam -genkey` writes before an EC key, and RFC 1421 header lines such as `Proc-Type:` inside a block are accepted.
+    """
+    if value is None:
+        return
+    labels = _PEM_BLOCK.findall(value)
+    if not any(found.endswith(label) for found in labels) or _PEM_BLOCK.sub('', value).strip():
+        raise ValueError(f"Parameter '{name}' is not a PEM-encoded {label.lower()}.")
+
+
+def _retry_delay(method: str, response: httpx.Response | None, attempt: int) -> float | None:
+    """
+    Returns how long to wait before retrying `response`, or None when it should be returned as is.
+
+    429 Too Many Requests means the request was not processed, so it is retried for every verb; 502/503/504 and failed or dropped connections (`response` is None) only for idempotent verbs. Read timeouts are not retried, since each one has already waited out the full client timeout. The server's numeric Retry-After wins over jittered exponential backoff, and a wait longer than `_MAX_RETRY_DELAY` is not worth blocking a tool call for.
+    """
+    status = response.status_code if response is not None else None
+    if attempt >= _MAX_RETRIES or not (status == 429 or method in _IDEMPOTENT_METHODS and (status is None or status in _RETRY_STATUSES)):
+        return None
+    retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+    if retry_after.isdigit():
+        delay = float(retry_after)
+    else:
+        delay = _RETRY_BACKOFF * 2 ** attempt + random.uniform(0, _RETRY_JITTER)
+    return delay if delay <= _MAX_RETRY_DELAY else None
+
+
+def _rate_limit_pause(response: httpx.Response) -> float:
+    """
+    Returns how long to hold back the next request so the calls left in DigitalOcean's rate-limit window are spread evenly until it resets.
+
+    Pacing only starts once fewer than `_RATE_LIMIT_FLOOR` requests remain, so normal traffic is never delayed.
+    """
+    remaining = response.headers.get('RateLimit-Remaining', '')
+    reset = response.headers.get('RateLimit-Reset', '')
+    if not (remaining.isdigit() and reset.isdigit()) or int(remaining) >= _RATE_LIMIT_FLOOR:
+        return 0.0
+    return min(max(int(reset) - time.time(), 0.0) / (int(remaining) + 1), _MAX_RETRY_DELAY)
+
+
+def _instrumented(name: str, tool: Callable) -> Callable:
+    """
+    Wraps a tool so its latency and outcome are recorded in Prometheus, when prometheus_client is installed.
+    """
+    if TOOL_LATENCY is None:
+        return tool
+    if inspect.iscoroutinefunction(tool):
+        @functools.wraps(tool)
+        async def async_wrapper(*args, **kwargs):
+            with TOOL_LATENCY.labels(name).time():
+                try:
+                    result = await tool(*args, **kwargs)
+                except Exception:
+                    TOOL_CALLS.labels(name, 'error').inc()
+                    raise
+            TOOL_CALLS.labels(name, 'success').inc()
+            return result
+        return async_wrapper
+
+    @functools.wraps(tool)
+    def wrapper(*args, **kwargs):
+        with TOOL_LATENCY.labels(name).time():
+            try:
+                result = tool(*args, **kwargs)
+            except Exception:
+                TOOL_CALLS.labels(name, 'error').inc()
+                raise
+        TOOL_CALLS.labels(name, 'success').inc()
+        return result
+    return wrapper
+
 
 class DigitaloceanApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    _TOOL_NAMES: ClassVar[tuple[str, ...]] = _TOOL_NAMES
+    _TOOL_NAME_SET: ClassVar[frozenset[str]] = frozenset(_TOOL_NAMES)
+    _tools_schema_json: ClassVar[bytes | None] = None
+    _shared_clients: ClassVar[dict[tuple[str, str], httpx.Client]] = {}
+    _shared_client_refs: ClassVar[dict[tuple[str, str], int]] = {}
+    _shared_clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, integration: Integration = None, prewarm: bool = False, **kwargs) -> None:
         super().__init__(name='digitalocean', integration=integration, **kwargs)
         self.base_url = "https://api.digitalocean.com"
+        self._async_client: httpx.AsyncClient | None = None
+        self._shared_key: tuple[str, str] | None = None
+        self._ttl_cache: dict[tuple, tuple[float, Any]] = {}
+        self._ttl_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight: dict[tuple, asyncio.Future] = {}
+        self._async_slots: asyncio.Semaphore | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._paced_until = 0.0
+        self._etag_cache: OrderedDict[tuple, tuple[str, Any]] = OrderedDict()
+        self._etag_lock = threading.Lock()
+        if prewarm:
+            self.prewarm()
+
+    def prewarm(self) -> threading.Thread:
+        """
+        Opens the pooled connection and validates credentials in a background thread, so the first tool call does not pay for DNS, TLS and credential lookup.
+        """
+        thread = threading.Thread(target=self._prewarm, name='digitalocean-prewarm', daemon=True)
+        thread.start()
+        return thread
+
+    def _prewarm(self) -> None:
+        try:
+            self.client.get(f"{self.base_url}/v2/account").raise_for_status()
+        except Exception as exc:
+            logger.warning(f"Prewarming the DigitalOcean connection failed: {exc}")
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Lazily built HTTP/2 client whose keep-alive connection pool is shared by every tool call.
+
+        Credentials are resolved once here and sent as default headers, rather than rebuilt for every request.
+        Instances with the same base URL and credentials reuse one class-level client, so short-lived
+        instances pick up warm connections instead of opening new ones. Each instance holds a reference,
+        and the client is closed when the last instance using it is closed.
+        """
+        if not self._client:
+            headers = self._default_headers()
+            key = (self.base_url, hashlib.sha256(repr(sorted(headers.items())).encode()).hexdigest())
+            cls = type(self)
+            with cls._shared_clients_lock:
+                client = cls._shared_clients.get(key)
+                if client is None or client.is_closed:
+                    client = cls._shared_clients[key] = httpx.Client(
+                        base_url=self.base_url,
+                        headers=headers,
+                        timeout=httpx.Timeout(self.default_timeout, connect=_CONNECT_TIMEOUT),
+                        http2=True,
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=_MAX_CONNECTIONS, keepalive_expiry=60),
+                    )
+                    cls._shared_client_refs[key] = 0
+                cls._shared_client_refs[key] += 1
+            self._client = client
+            self._shared_key = key
+        return self._client
+
+    def _default_headers(self) -> dict[str, str]:
+        """
+        Credentials plus `Accept`, without the base class's blanket `Content-Type`; requests that carry a JSON body set it themselves.
+        """
+        headers = {k: v for k, v in self._get_headers().items() if k.lower() != 'content-type'}
+        headers['Accept'] = 'application/json'
+        return headers
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Lazily built asynchronous HTTP client used for concurrent fan-out requests.
+        """
+        if not self._async_client:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._default_headers(),
+                timeout=httpx.Timeout(self.default_timeout, connect=_CONNECT_TIMEOUT),
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=_MAX_CONNECTIONS, keepalive_expiry=60),
+            )
+        return self._async_client
+
+    @property
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='digitalocean')
+        return self._executor
+
+    def _coalesce(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Runs `fetch` once for concurrent callers sharing `key`; the others wait for and share its result.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _send(self, method: str, url: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        """
+        Sends a request on the pooled client, pacing it against the API rate limit and retrying rate-limited requests, transient gateway failures and failed or dropped connections as `_retry_delay` allows.
+
+        With `stream`, the returned response body is left unread and the caller must close it.
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            wait = self._paced_until - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                response = self.client.send(self.client.build_request(method, url, **kwargs), stream=stream)
+            except _RETRY_TRANSPORT_ERRORS:
+                delay = _retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                self._pace(response)
+                delay = _retry_delay(method, response, attempt)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+        return response
+
+    def _pace(self, response: httpx.Response) -> None:
+        pause = _rate_limit_pause(response)
+        if pause:
+            self._paced_until = time.monotonic() + pause
+
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """
+        Coalesces concurrent identical GET requests into one HTTP transaction.
+        """
+        def fetch() -> httpx.Response:
+            response = self._send('GET', url, params=params)
+            response.raise_for_status()
+            return response
+
+        return self._coalesce(('GET', url, _freeze(params or {})), fetch)
+
+    def _conditional_get(self, url: str, params: dict[str, Any] | None) -> Any:
+        """
+        Sends If-None-Match for a previously seen ETag and, on 304 Not Modified, returns the body decoded last time without parsing it again.
+        """
+        key = (url, _freeze(params or {}))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self._send('GET', url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+        data = self._handle_response(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, copy.deepcopy(data))
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > _ETAG_CACHE_MAXSIZE:
+                    self._etag_cache.popitem(last=False)
+        return data
+
+    def _call(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        conditional: bool = False,
+        ttl: float | None = None,
+    ) -> Any:
+        """
+        Sends a request to `path` under the API base URL and decodes the response.
+
+        `None` values are dropped from `query` and `body`, so tools can pass their optional arguments straight through. Plain GETs are coalesced by `_get`, are served from memory for `ttl` seconds when given, and with `conditional` are revalidated against the last ETag seen. Every other verb sends `body` as JSON encoded with orjson when installed, DELETE included, and invalidates the cached reads it may have changed. Requests to the irreversible `/dangerous` endpoints carry the `X-Dangerous: true` confirmation header the API requires.
+        """
+        url = f"{self.base_url}{path}"
+        params = {k: v for k, v in query.items() if v is not None} if query else None
+        if path.endswith('/dangerous'):
+            headers = {**_DANGEROUS_HEADERS, **(headers or {})}
+        if method != 'GET' or headers is not None:
+            content = None
+            if body is not None:
+                content = _dumps({k: v for k, v in body.items() if v is not None})
+                headers = {**_JSON_CONTENT_TYPE, **(headers or {})}
+            response = self._send(method, url, params=params, content=content, headers=headers)
+            if method != 'GET':
+                self.invalidate(path)
+            return self._handle_response(response)
+        key = (path, _freeze(params or {}))
+        if ttl:
+            hit, data = self._cached(key)
+            if hit:
+                return data
+        if conditional:
+            data = self._coalesce(('ETAG', url, key[1]), lambda: self._conditional_get(url, params))
+        else:
+            data = self._handle_response(self._get(url, params=params))
+        if ttl:
+            self._store(key, data, ttl)
+        return data
+
+    def _cached(self, key: tuple) -> tuple[bool, Any]:
+        """
+        Looks up an unexpired TTL cache entry, returning whether it was found and a private copy of it so callers cannot alter what later calls receive.
+        """
+        with self._ttl_lock:
+            entry = self._ttl_cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return False, None
+        return True, copy.deepcopy(entry[1])
+
+    def _store(self, key: tuple, data: Any, ttl: float) -> None:
+        entry = (time.monotonic() + ttl, copy.deepcopy(data))
+        with self._ttl_lock:
+            if key not in self._ttl_cache and len(self._ttl_cache) >= _TTL_CACHE_MAXSIZE:
+                self._ttl_cache.pop(next(iter(self._ttl_cache)), None)
+            self._ttl_cache[key] = entry
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drops cached reads of `path`, of the collections above it and of everything below it, e.g. `/v2/apps/{id}` clears `/v2/apps`, `/v2/apps/{id}` and `/v2/apps/{id}/deployments`.
+        """
+        path = path.rstrip('/')
+        with self._ttl_lock:
+            for key in list(self._ttl_cache):
+                cached = key[0]
+                if cached == path or path.startswith(f"{cached}/") or cached.startswith(f"{path}/"):
+                    del self._ttl_cache[key]
+
+    def _download(self, path: str, accept: str) -> httpx.Response:
+        """
+        Fetches a non-JSON document such as an invoice CSV or PDF, leaving the body undecoded.
+        """
+        response = self._send('GET', f"{self.base_url}{path}", headers={'Accept': accept})
+        response.raise_for_status()
+        return response
+
+    def _handle_response(self, response: httpx.Response) -> Any:
+        response.raise_for_status()
+        if response.status_code == 204 or not response.content or response.content.isspace():
+            return None
+        return _loads(response.content)
+
+    async def _acall(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        ttl: float | None = None,
+    ) -> Any:
+        """
+        Asynchronous counterpart of `_call`, sent through the pooled `async_client`.
+
+        Concurrent identical GETs share one in-flight request, each joining caller receiving its own copy of the result, and share the TTL cache with `_call`, storing their result for `ttl` seconds when given; every other verb invalidates the cached reads it may have changed.
+        """
+        self._bind_loop()
+        params = {k: v for k, v in query.items() if v is not None} if query else None
+        if method != 'GET':
+            data = await self._asend(method, path, params, body)
+            self.invalidate(path)
+            return data
+        key = (path, _freeze(params or {}))
+        hit, data = self._cached(key)
+        if hit:
+            return data
+        task = self._ainflight.get(key)
+        leader = task is None
+        if leader:
+            task = self._ainflight[key] = asyncio.ensure_future(self._asend(method, path, params, None))
+            task.add_done_callback(lambda _: self._ainflight.pop(key, None))
+        data = await asyncio.shield(task)
+        if not leader:
+            return copy.deepcopy(data)
+        if ttl:
+            self._store(key, data, ttl)
+        return data
+
+    def _bind_loop(self) -> None:
+        """
+        Drops the asynchronous client, semaphore and in-flight tasks when called from a different event loop than the one they were created on, since none of them can be used across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            if self._async_loop is not None:
+                self._async_client = None
+                self._async_slots = None
+                self._ainflight = {}
+            self._async_loop = loop
+
+    async def _asend(self, method: str, path: str, params: dict[str, Any] | None, body: dict[str, Any] | None) -> Any:
+        content = headers = None
+        if body is not None:
+            content = _dumps({k: v for k, v in body.items() if v is not None})
+            headers = _JSON_CONTENT_TYPE
+        if path.endswith('/dangerous'):
+            headers = {**_DANGEROUS_HEADERS, **(headers or {})}
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(_MAX_CONNECTIONS)
+        for attempt in range(_MAX_RETRIES + 1):
+            wait = self._paced_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self._async_slots:
+                    response = await self.async_client.request(method, f"{self.base_url}{path}", params=params, content=content, headers=headers)
+            except _RETRY_TRANSPORT_ERRORS:
+                delay = _retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                self._pace(response)
+                delay = _retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+        return self._handle_response(response)
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled HTTP clients and releases their keep-alive connections.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._async_slots = None
+        self._async_loop = None
+        self._ainflight = {}
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the pooled synchronous HTTP client and worker threads; use `aclose` to release the asynchronous client as well.
+
+        A client shared with other instances is closed once the last of them releases it.
+        """
+        if self._client is not None:
+            if self._shared_key is None:
+                self._client.close()
+            else:
+                self._release_shared_client(self._shared_key, self._client)
+                self._shared_key = None
+            self._client = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @classmethod
+    def _release_shared_client(cls, key: tuple[str, str], client: httpx.Client) -> None:
+        with cls._shared_clients_lock:
+            if cls._shared_clients.get(key) is not client:
+                return
+            cls._shared_client_refs[key] -= 1
+            if cls._shared_client_refs[key] > 0:
+                return
+            del cls._shared_clients[key], cls._shared_client_refs[key]
+        client.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Closes every class-level shared HTTP client regardless of how many instances still use it, for use in process shutdown hooks.
+        """
+        with cls._shared_clients_lock:
+            clients = list(cls._shared_clients.values())
+            cls._shared_clients.clear()
+            cls._shared_client_refs.clear()
+        for client in clients:
+            client.close()
+
+    def __enter__(self) -> "DigitaloceanApp":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _get_metric(self, metric: str, params: dict[str, Any] | None = None) -> Any:
+        return self._call('GET', f"/v2/monitoring/metrics/{metric}", query=params)
 
     def one_clicks_list(self, type: Optional[str] = None) -> Any:
         """
@@ -24,16 +1081,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             1-Click Applications
         """
-        url = f"{self.base_url}/v2/1-clicks"
-        query_params = {k: v for k, v in [('type', type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/1-clicks", query={'type': type}, ttl=_HOT_TTL)
 
     def one_clicks_install_kubernetes(self, addon_slugs: List[str], cluster_uuid: str) -> dict[str, Any]:
         """
@@ -56,22 +1104,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             1-Click Applications
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/1-clicks/kubernetes", body={
             'addon_slugs': addon_slugs,
             'cluster_uuid': cluster_uuid,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/1-clicks/kubernetes"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def account_get(self) -> Any:
         """
@@ -87,16 +1123,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Account
         """
-        url = f"{self.base_url}/v2/account"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/account", conditional=True, ttl=_HOT_TTL)
 
     def ssh_keys_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -116,16 +1143,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             SSH Keys
         """
-        url = f"{self.base_url}/v2/account/keys"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/account/keys", query={'per_page': per_page, 'page': page}, ttl=_HOT_TTL)
 
     def ssh_keys_create(self, public_key: str, name: str, id: Optional[int] = None, fingerprint: Optional[str] = None) -> Any:
         """
@@ -147,24 +1165,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             SSH Keys
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/account/keys", body={
             'id': id,
             'fingerprint': fingerprint,
             'public_key': public_key,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/account/keys"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def ssh_keys_get(self, ssh_key_identifier: str) -> Any:
         """
@@ -183,18 +1189,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             SSH Keys
         """
-        if ssh_key_identifier is None:
-            raise ValueError("Missing required parameter 'ssh_key_identifier'.")
-        url = f"{self.base_url}/v2/account/keys/{ssh_key_identifier}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(ssh_key_identifier=ssh_key_identifier)
+        return self._call('GET', f"/v2/account/keys/{ssh_key_identifier}", conditional=True)
 
     def ssh_keys_update(self, ssh_key_identifier: str, name: Optional[str] = None) -> Any:
         """
@@ -214,23 +1210,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             SSH Keys
         """
-        if ssh_key_identifier is None:
-            raise ValueError("Missing required parameter 'ssh_key_identifier'.")
-        request_body_data = None
-        request_body_data = {
+        _require(ssh_key_identifier=ssh_key_identifier)
+        return self._call('PUT', f"/v2/account/keys/{ssh_key_identifier}", body={
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/account/keys/{ssh_key_identifier}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def ssh_keys_delete(self, ssh_key_identifier: str) -> Any:
         """
@@ -249,18 +1232,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             SSH Keys
         """
-        if ssh_key_identifier is None:
-            raise ValueError("Missing required parameter 'ssh_key_identifier'.")
-        url = f"{self.base_url}/v2/account/keys/{ssh_key_identifier}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(ssh_key_identifier=ssh_key_identifier)
+        return self._call('DELETE', f"/v2/account/keys/{ssh_key_identifier}")
 
     def actions_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -280,16 +1253,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Actions
         """
-        url = f"{self.base_url}/v2/actions"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/actions", query={'per_page': per_page, 'page': page})
 
     def actions_get(self, action_id: str) -> Any:
         """
@@ -308,18 +1272,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Actions
         """
-        if action_id is None:
-            raise ValueError("Missing required parameter 'action_id'.")
-        url = f"{self.base_url}/v2/actions/{action_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(action_id=action_id)
+        return self._call('GET', f"/v2/actions/{action_id}", conditional=True)
 
     def apps_list(self, page: Optional[int] = None, per_page: Optional[int] = None, with_projects: Optional[bool] = None) -> Any:
         """
@@ -340,16 +1294,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps, important
         """
-        url = f"{self.base_url}/v2/apps"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page), ('with_projects', with_projects)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/apps", query={'page': page, 'per_page': per_page, 'with_projects': with_projects})
 
     def apps_create(self, spec: dict[str, Any], project_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -369,22 +1314,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/apps", body={
             'spec': spec,
             'project_id': project_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_delete(self, id: str) -> dict[str, Any]:
         """
@@ -403,18 +1336,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if id is None:
-            raise ValueError("Missing required parameter 'id'.")
-        url = f"{self.base_url}/v2/apps/{id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(id=id)
+        return self._call('DELETE', f"/v2/apps/{id}")
 
     def apps_get(self, id: str, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -434,18 +1357,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if id is None:
-            raise ValueError("Missing required parameter 'id'.")
-        url = f"{self.base_url}/v2/apps/{id}"
-        query_params = {k: v for k, v in [('name', name)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(id=id)
+        return self._call('GET', f"/v2/apps/{id}", query={'name': name}, conditional=True)
 
     def apps_update(self, id: str, spec: dict[str, Any], update_all_source_versions: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -466,24 +1379,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if id is None:
-            raise ValueError("Missing required parameter 'id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(id=id)
+        return self._call('PUT', f"/v2/apps/{id}", body={
             'spec': spec,
             'update_all_source_versions': update_all_source_versions,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/{id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_restart(self, app_id: str, components: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -503,23 +1403,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(app_id=app_id)
+        return self._call('POST', f"/v2/apps/{app_id}/restart", body={
             'components': components,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/{app_id}/restart"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def get_app_component_logs(self, app_id: str, component_name: str, type: str, follow: Optional[bool] = None, pod_connection_timeout: Optional[str] = None) -> dict[str, Any]:
         """
@@ -546,20 +1433,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if component_name is None:
-            raise ValueError("Missing required parameter 'component_name'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/components/{component_name}/logs"
-        query_params = {k: v for k, v in [('follow', follow), ('type', type), ('pod_connection_timeout', pod_connection_timeout)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, component_name=component_name)
+        return self._call('GET', f"/v2/apps/{app_id}/components/{component_name}/logs", query={'follow': follow, 'type': type, 'pod_connection_timeout': pod_connection_timeout})
 
     def get_component_execution_details(self, app_id: str, component_name: str) -> dict[str, Any]:
         """
@@ -579,20 +1454,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if component_name is None:
-            raise ValueError("Missing required parameter 'component_name'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/components/{component_name}/exec"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, component_name=component_name)
+        return self._call('GET', f"/v2/apps/{app_id}/components/{component_name}/exec")
 
     def apps_get_instances(self, app_id: str) -> dict[str, Any]:
         """
@@ -611,18 +1474,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/instances"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('GET', f"/v2/apps/{app_id}/instances", conditional=True)
 
     def apps_list_deployments(self, app_id: str, page: Optional[int] = None, per_page: Optional[int] = None) -> Any:
         """
@@ -643,18 +1496,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('GET', f"/v2/apps/{app_id}/deployments", query={'page': page, 'per_page': per_page})
 
     def apps_create_deployment(self, app_id: str, force_build: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -674,23 +1517,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(app_id=app_id)
+        return self._call('POST', f"/v2/apps/{app_id}/deployments", body={
             'force_build': force_build,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_get_deployment(self, app_id: str, deployment_id: str) -> dict[str, Any]:
         """
@@ -710,20 +1540,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if deployment_id is None:
-            raise ValueError("Missing required parameter 'deployment_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments/{deployment_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, deployment_id=deployment_id)
+        return self._call('GET', f"/v2/apps/{app_id}/deployments/{deployment_id}", conditional=True)
 
     def apps_cancel_deployment(self, app_id: str, deployment_id: str) -> dict[str, Any]:
         """
@@ -743,21 +1561,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if deployment_id is None:
-            raise ValueError("Missing required parameter 'deployment_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments/{deployment_id}/cancel"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, deployment_id=deployment_id)
+        return self._call('POST', f"/v2/apps/{app_id}/deployments/{deployment_id}/cancel")
 
     def apps_get_logs(self, app_id: str, deployment_id: str, component_name: str, type: str, follow: Optional[bool] = None, pod_connection_timeout: Optional[str] = None) -> dict[str, Any]:
         """
@@ -785,22 +1590,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if deployment_id is None:
-            raise ValueError("Missing required parameter 'deployment_id'.")
-        if component_name is None:
-            raise ValueError("Missing required parameter 'component_name'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments/{deployment_id}/components/{component_name}/logs"
-        query_params = {k: v for k, v in [('follow', follow), ('type', type), ('pod_connection_timeout', pod_connection_timeout)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, deployment_id=deployment_id, component_name=component_name)
+        return self._call('GET', f"/v2/apps/{app_id}/deployments/{deployment_id}/components/{component_name}/logs", query={'follow': follow, 'type': type, 'pod_connection_timeout': pod_connection_timeout})
 
     def apps_get_logs_aggregate(self, app_id: str, deployment_id: str, type: str, follow: Optional[bool] = None, pod_connection_timeout: Optional[str] = None) -> dict[str, Any]:
         """
@@ -827,20 +1618,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if deployment_id is None:
-            raise ValueError("Missing required parameter 'deployment_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments/{deployment_id}/logs"
-        query_params = {k: v for k, v in [('follow', follow), ('type', type), ('pod_connection_timeout', pod_connection_timeout)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, deployment_id=deployment_id)
+        return self._call('GET', f"/v2/apps/{app_id}/deployments/{deployment_id}/logs", query={'follow': follow, 'type': type, 'pod_connection_timeout': pod_connection_timeout})
 
     def apps_get_exec(self, app_id: str, deployment_id: str, component_name: str, instance_name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -862,22 +1641,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if deployment_id is None:
-            raise ValueError("Missing required parameter 'deployment_id'.")
-        if component_name is None:
-            raise ValueError("Missing required parameter 'component_name'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/deployments/{deployment_id}/components/{component_name}/exec"
-        query_params = {k: v for k, v in [('instance_name', instance_name)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id, deployment_id=deployment_id, component_name=component_name)
+        return self._call('GET', f"/v2/apps/{app_id}/deployments/{deployment_id}/components/{component_name}/exec", query={'instance_name': instance_name})
 
     def get_app_logs(self, app_id: str, type: str, follow: Optional[bool] = None, pod_connection_timeout: Optional[str] = None) -> dict[str, Any]:
         """
@@ -903,18 +1668,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/logs"
-        query_params = {k: v for k, v in [('follow', follow), ('type', type), ('pod_connection_timeout', pod_connection_timeout)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('GET', f"/v2/apps/{app_id}/logs", query={'follow': follow, 'type': type, 'pod_connection_timeout': pod_connection_timeout})
 
     def apps_list_instance_sizes(self) -> dict[str, Any]:
         """
@@ -930,16 +1685,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        url = f"{self.base_url}/v2/apps/tiers/instance_sizes"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/apps/tiers/instance_sizes", conditional=True, ttl=_CATALOG_TTL)
 
     def apps_get_instance_size(self, slug: str) -> dict[str, Any]:
         """
@@ -958,18 +1704,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if slug is None:
-            raise ValueError("Missing required parameter 'slug'.")
-        url = f"{self.base_url}/v2/apps/tiers/instance_sizes/{slug}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(slug=slug)
+        return self._call('GET', f"/v2/apps/tiers/instance_sizes/{slug}", conditional=True, ttl=_CATALOG_TTL)
 
     def apps_list_regions(self) -> dict[str, Any]:
         """
@@ -985,16 +1721,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        url = f"{self.base_url}/v2/apps/regions"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/apps/regions", conditional=True, ttl=_CATALOG_TTL)
 
     def apps_validate_app_spec(self, spec: dict[str, Any], app_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1014,22 +1741,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/apps/propose", body={
             'spec': spec,
             'app_id': app_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/propose"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_list_alerts(self, app_id: str) -> dict[str, Any]:
         """
@@ -1048,18 +1763,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/alerts"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('GET', f"/v2/apps/{app_id}/alerts")
 
     def apps_assign_alert_destinations(self, app_id: str, alert_id: str, emails: Optional[List[str]] = None, slack_webhooks: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -1081,26 +1786,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        if alert_id is None:
-            raise ValueError("Missing required parameter 'alert_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(app_id=app_id, alert_id=alert_id)
+        return self._call('POST', f"/v2/apps/{app_id}/alerts/{alert_id}/destinations", body={
             'emails': emails,
             'slack_webhooks': slack_webhooks,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/{app_id}/alerts/{alert_id}/destinations"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_create_rollback(self, app_id: str, deployment_id: Optional[str] = None, skip_pin: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -1121,24 +1811,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(app_id=app_id)
+        return self._call('POST', f"/v2/apps/{app_id}/rollback", body={
             'deployment_id': deployment_id,
             'skip_pin': skip_pin,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/{app_id}/rollback"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_validate_rollback(self, app_id: str, deployment_id: Optional[str] = None, skip_pin: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -1159,24 +1836,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(app_id=app_id)
+        return self._call('POST', f"/v2/apps/{app_id}/rollback/validate", body={
             'deployment_id': deployment_id,
             'skip_pin': skip_pin,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/{app_id}/rollback/validate"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def apps_commit_rollback(self, app_id: str) -> Any:
         """
@@ -1195,19 +1859,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/apps/{app_id}/rollback/commit"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('POST', f"/v2/apps/{app_id}/rollback/commit")
 
     def apps_revert_rollback(self, app_id: str) -> dict[str, Any]:
         """
@@ -1226,19 +1879,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/apps/{app_id}/rollback/revert"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('POST', f"/v2/apps/{app_id}/rollback/revert")
 
     def get_app_bandwidth_daily(self, app_id: str, date: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1258,25 +1900,15 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/metrics/bandwidth_daily"
-        query_params = {k: v for k, v in [('date', date)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('GET', f"/v2/apps/{app_id}/metrics/bandwidth_daily", query={'date': date})
 
     def create_daily_bandwidth_metrics(self, app_ids: List[str], date: Optional[str] = None) -> dict[str, Any]:
         """
         Retrieve Multiple Apps' Daily Bandwidth Metrics
 
         Args:
-            app_ids (array): A list of app IDs to query bandwidth metrics for. Example: "['4f6c71e2-1e90-4762-9fee-6cc4a0a9f2cf', 'c2a93513-8d9b-4223-9d61-5e7272c81cf5']".
+            app_ids (array): A list of app IDs to query bandwidth metrics for. Long lists are split into batches of 50 that are queried concurrently and merged. Example: "['4f6c71e2-1e90-4762-9fee-6cc4a0a9f2cf', 'c2a93513-8d9b-4223-9d61-5e7272c81cf5']".
             date (string): Optional day to query. Only the date component of the timestamp will be considered. Default: yesterday. Example: '2023-01-17T00:00:00Z'.
 
         Returns:
@@ -1289,22 +1921,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        request_body_data = None
-        request_body_data = {
-            'app_ids': app_ids,
-            'date': date,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/apps/metrics/bandwidth_daily"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        if app_ids is None or len(app_ids) <= _BANDWIDTH_BATCH_SIZE:
+            return self._call('POST', "/v2/apps/metrics/bandwidth_daily", body={
+                'app_ids': app_ids,
+                'date': date,
+            })
+        batches = [app_ids[i:i + _BANDWIDTH_BATCH_SIZE] for i in range(0, len(app_ids), _BANDWIDTH_BATCH_SIZE)]
+        responses = self._pool.map(lambda batch: self.create_daily_bandwidth_metrics(batch, date), batches)
+        return {'app_bandwidth_usage': [usage for response in responses for usage in (response or {}).get('app_bandwidth_usage') or ()]}
 
     def apps_get_health(self, app_id: str) -> dict[str, Any]:
         """
@@ -1323,18 +1947,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Apps
         """
-        if app_id is None:
-            raise ValueError("Missing required parameter 'app_id'.")
-        url = f"{self.base_url}/v2/apps/{app_id}/health"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(app_id=app_id)
+        return self._call('GET', f"/v2/apps/{app_id}/health")
 
     def cdn_list_endpoints(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -1354,16 +1968,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             CDN Endpoints
         """
-        url = f"{self.base_url}/v2/cdn/endpoints"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/cdn/endpoints", query={'per_page': per_page, 'page': page})
 
     def cdn_create_endpoint(self, origin: str, id: Optional[str] = None, endpoint: Optional[str] = None, ttl: Optional[int] = None, certificate_id: Optional[str] = None, custom_domain: Optional[str] = None, created_at: Optional[str] = None) -> Any:
         """
@@ -1388,8 +1993,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             CDN Endpoints
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/cdn/endpoints", body={
             'id': id,
             'origin': origin,
             'endpoint': endpoint,
@@ -1397,18 +2001,7 @@ class DigitaloceanApp(APIApplication):
             'certificate_id': certificate_id,
             'custom_domain': custom_domain,
             'created_at': created_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/cdn/endpoints"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def cdn_get_endpoint(self, cdn_id: str) -> Any:
         """
@@ -1427,18 +2020,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             CDN Endpoints
         """
-        if cdn_id is None:
-            raise ValueError("Missing required parameter 'cdn_id'.")
-        url = f"{self.base_url}/v2/cdn/endpoints/{cdn_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cdn_id=cdn_id)
+        return self._call('GET', f"/v2/cdn/endpoints/{cdn_id}")
 
     def cdn_update_endpoints(self, cdn_id: str, ttl: Optional[int] = None, certificate_id: Optional[str] = None, custom_domain: Optional[str] = None) -> Any:
         """
@@ -1460,25 +2043,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             CDN Endpoints
         """
-        if cdn_id is None:
-            raise ValueError("Missing required parameter 'cdn_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cdn_id=cdn_id)
+        return self._call('PUT', f"/v2/cdn/endpoints/{cdn_id}", body={
             'ttl': ttl,
             'certificate_id': certificate_id,
             'custom_domain': custom_domain,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/cdn/endpoints/{cdn_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def cdn_delete_endpoint(self, cdn_id: str) -> Any:
         """
@@ -1497,18 +2067,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             CDN Endpoints
         """
-        if cdn_id is None:
-            raise ValueError("Missing required parameter 'cdn_id'.")
-        url = f"{self.base_url}/v2/cdn/endpoints/{cdn_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cdn_id=cdn_id)
+        return self._call('DELETE', f"/v2/cdn/endpoints/{cdn_id}")
 
     def cdn_purge_cache(self, cdn_id: str, files: List[str]) -> Any:
         """
@@ -1528,22 +2088,36 @@ class DigitaloceanApp(APIApplication):
         Tags:
             CDN Endpoints
         """
-        if cdn_id is None:
-            raise ValueError("Missing required parameter 'cdn_id'.")
-        request_body_data = {
+        _require(cdn_id=cdn_id)
+        return self._call('DELETE', f"/v2/cdn/endpoints/{cdn_id}/cache", body={
             'files': files,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/cdn/endpoints/{cdn_id}/cache"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
+
+    def cdn_purge_cache_many(self, cdn_id: str, files: List[str], batch_size: int = _PURGE_BATCH_SIZE) -> None:
+        """
+        Purge Many Paths from a CDN Endpoint Cache
+
+        Args:
+            cdn_id (string): cdn_id
+            files (array): The paths to purge from the CDN cache; they are sent in batches of `batch_size`, concurrently. Example: "['path/to/image.png', 'path/to/css/*']".
+            batch_size (integer): Maximum number of paths per purge request. Example: '250'.
+
+        Returns:
+            None: Every batch was purged successfully.
+
+        Raises:
+            ValueError: Raised if `batch_size` is less than 1.
+            HTTPError: Raised when any of the purge requests fails (e.g., non-2XX status code).
+
+        Tags:
+            CDN Endpoints
+        """
+        _require(cdn_id=cdn_id, files=files, batch_size=batch_size)
+        if batch_size < 1:
+            raise ValueError(f"Parameter 'batch_size' must be at least 1, got {batch_size}.")
+        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+        for _ in self._pool.map(lambda batch: self.cdn_purge_cache(cdn_id, batch), batches):
+            pass
 
     def certificates_list(self, per_page: Optional[int] = None, page: Optional[int] = None, name: Optional[str] = None) -> Any:
         """
@@ -1564,16 +2138,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Certificates
         """
-        url = f"{self.base_url}/v2/certificates"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('name', name)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/certificates", query={'per_page': per_page, 'page': page, 'name': name}, conditional=True, ttl=_LISTING_TTL)
 
     def certificates_create(self, name: Optional[str] = None, type: Optional[str] = None, dns_names: Optional[List[str]] = None, private_key: Optional[str] = None, leaf_certificate: Optional[str] = None, certificate_chain: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1593,31 +2158,23 @@ class DigitaloceanApp(APIApplication):
 
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised if `private_key`, `leaf_certificate` or `certificate_chain` is not PEM-encoded.
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Certificates
         """
-        request_body_data = None
-        request_body_data = {
+        _check_pem('private_key', private_key, 'PRIVATE KEY')
+        _check_pem('leaf_certificate', leaf_certificate, 'CERTIFICATE')
+        _check_pem('certificate_chain', certificate_chain, 'CERTIFICATE')
+        return self._call('POST', "/v2/certificates", body={
             'name': name,
             'type': type,
             'dns_names': dns_names,
             'private_key': private_key,
             'leaf_certificate': leaf_certificate,
             'certificate_chain': certificate_chain,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/certificates"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def certificates_get(self, certificate_id: str) -> dict[str, Any]:
         """
@@ -1636,18 +2193,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Certificates
         """
-        if certificate_id is None:
-            raise ValueError("Missing required parameter 'certificate_id'.")
-        url = f"{self.base_url}/v2/certificates/{certificate_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(certificate_id=certificate_id)
+        return self._call('GET', f"/v2/certificates/{certificate_id}")
 
     def certificates_delete(self, certificate_id: str) -> Any:
         """
@@ -1666,18 +2213,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Certificates
         """
-        if certificate_id is None:
-            raise ValueError("Missing required parameter 'certificate_id'.")
-        url = f"{self.base_url}/v2/certificates/{certificate_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(certificate_id=certificate_id)
+        return self._call('DELETE', f"/v2/certificates/{certificate_id}")
 
     def balance_get(self) -> dict[str, Any]:
         """
@@ -1693,16 +2230,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Billing
         """
-        url = f"{self.base_url}/v2/customers/my/balance"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/customers/my/balance")
 
     def billing_history_list(self) -> Any:
         """
@@ -1718,16 +2246,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Billing
         """
-        url = f"{self.base_url}/v2/customers/my/billing_history"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/customers/my/billing_history")
 
     def invoices_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -1748,16 +2267,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Billing
         """
-        url = f"{self.base_url}/v2/customers/my/invoices"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/customers/my/invoices", query={'per_page': per_page, 'page': page})
 
     def invoices_get_by_uuid(self, invoice_uuid: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -1778,20 +2288,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Billing
         """
-        if invoice_uuid is None:
-            raise ValueError("Missing required parameter 'invoice_uuid'.")
-        url = f"{self.base_url}/v2/customers/my/invoices/{invoice_uuid}"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(invoice_uuid=invoice_uuid)
+        return self._call('GET', f"/v2/customers/my/invoices/{invoice_uuid}", query={'per_page': per_page, 'page': page})
 
-    def invoices_get_csv_by_uuid(self, invoice_uuid: str) -> Any:
+    def invoices_get_csv_by_uuid(self, invoice_uuid: str) -> str:
         """
         Retrieve an Invoice CSV by UUID
 
@@ -1799,29 +2299,18 @@ class DigitaloceanApp(APIApplication):
             invoice_uuid (string): invoice_uuid
 
         Returns:
-            Any: The response will be a CSV file.
+            str: The invoice as CSV text.
 
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
-            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Billing
         """
-        if invoice_uuid is None:
-            raise ValueError("Missing required parameter 'invoice_uuid'.")
-        url = f"{self.base_url}/v2/customers/my/invoices/{invoice_uuid}/csv"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(invoice_uuid=invoice_uuid)
+        return self._download(f"/v2/customers/my/invoices/{invoice_uuid}/csv", 'text/csv').text
 
-    def invoices_get_pdf_by_uuid(self, invoice_uuid: str) -> Any:
+    def invoices_get_pdf_by_uuid(self, invoice_uuid: str) -> bytes:
         """
         Retrieve an Invoice PDF by UUID
 
@@ -1829,27 +2318,16 @@ class DigitaloceanApp(APIApplication):
             invoice_uuid (string): invoice_uuid
 
         Returns:
-            Any: The response will be a PDF file.
+            bytes: The invoice as a PDF document.
 
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
-            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Billing
         """
-        if invoice_uuid is None:
-            raise ValueError("Missing required parameter 'invoice_uuid'.")
-        url = f"{self.base_url}/v2/customers/my/invoices/{invoice_uuid}/pdf"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(invoice_uuid=invoice_uuid)
+        return self._download(f"/v2/customers/my/invoices/{invoice_uuid}/pdf", 'application/pdf').content
 
     def invoices_get_summary_by_uuid(self, invoice_uuid: str) -> dict[str, Any]:
         """
@@ -1868,18 +2346,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Billing
         """
-        if invoice_uuid is None:
-            raise ValueError("Missing required parameter 'invoice_uuid'.")
-        url = f"{self.base_url}/v2/customers/my/invoices/{invoice_uuid}/summary"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(invoice_uuid=invoice_uuid)
+        return self._call('GET', f"/v2/customers/my/invoices/{invoice_uuid}/summary")
 
     def databases_list_options(self) -> dict[str, Any]:
         """
@@ -1895,16 +2363,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases, important
         """
-        url = f"{self.base_url}/v2/databases/options"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/databases/options", conditional=True, ttl=_CATALOG_TTL)
 
     def databases_list_clusters(self, tag_name: Optional[str] = None) -> Any:
         """
@@ -1923,16 +2382,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        url = f"{self.base_url}/v2/databases"
-        query_params = {k: v for k, v in [('tag_name', tag_name)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/databases", query={'tag_name': tag_name})
 
     def databases_create_cluster(self, name: str, engine: str, num_nodes: int, size: str, region: str, id: Optional[str] = None, version: Optional[str] = None, semantic_version: Optional[str] = None, status: Optional[str] = None, created_at: Optional[str] = None, private_network_uuid: Optional[str] = None, tags: Optional[List[str]] = None, db_names: Optional[List[str]] = None, ui_connection: Optional[Any] = None, connection: Optional[Any] = None, private_connection: Optional[Any] = None, standby_connection: Optional[Any] = None, standby_private_connection: Optional[Any] = None, users: Optional[List[dict[str, Any]]] = None, maintenance_window: Optional[Any] = None, project_id: Optional[str] = None, rules: Optional[List[dict[str, Any]]] = None, version_end_of_life: Optional[str] = None, version_end_of_availability: Optional[str] = None, storage_size_mib: Optional[int] = None, metrics_endpoints: Optional[List[dict[str, Any]]] = None, backup_restore: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1977,8 +2427,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/databases", body={
             'id': id,
             'name': name,
             'engine': engine,
@@ -2006,18 +2455,7 @@ class DigitaloceanApp(APIApplication):
             'storage_size_mib': storage_size_mib,
             'metrics_endpoints': metrics_endpoints,
             'backup_restore': backup_restore,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_cluster(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -2036,18 +2474,45 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}", ttl=_HOT_TTL)
+
+    def databases_get_cluster_overview(self, database_cluster_uuid: str) -> dict[str, Any]:
+        """
+        Retrieve a Database Cluster with Its Configuration, CA, Firewall Rules, Backups and Replicas
+
+        Args:
+            database_cluster_uuid (string): database_cluster_uuid
+
+        Returns:
+            dict[str, Any]: A JSON object with keys `database`, `config`, `ca`, `rules`, `backups` and `replicas`, fetched concurrently. `backups` and `replicas` are empty lists when the cluster's engine or state does not offer them (404 Not Found).
+
+        Raises:
+            HTTPError: Raised when any of the required API requests fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a response body cannot be parsed as JSON.
+
+        Tags:
+            Databases
+        """
+        _require(database_cluster_uuid=database_cluster_uuid)
+
+        def optional(fetch: Callable[[str], Any], key: str) -> List[Any]:
+            try:
+                return (fetch(database_cluster_uuid) or {}).get(key) or []
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == 404:
+                    return []
+                raise
+
+        parts = {
+            'database': self._pool.submit(lambda: (self.databases_get_cluster(database_cluster_uuid) or {}).get('database')),
+            'config': self._pool.submit(lambda: (self.databases_get_config(database_cluster_uuid) or {}).get('config')),
+            'ca': self._pool.submit(lambda: (self.databases_get_ca(database_cluster_uuid) or {}).get('ca')),
+            'rules': self._pool.submit(lambda: (self.databases_list_firewall_rules(database_cluster_uuid) or {}).get('rules')),
+            'backups': self._pool.submit(optional, self.databases_list_backups, 'backups'),
+            'replicas': self._pool.submit(optional, self.databases_list_replicas, 'replicas'),
+        }
+        return {key: future.result() for key, future in parts.items()}
 
     def databases_destroy_cluster(self, database_cluster_uuid: str) -> Any:
         """
@@ -2066,18 +2531,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}")
 
     def databases_get_config(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -2096,18 +2551,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/config"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/config", ttl=_DETAIL_TTL)
 
     def databases_patch_config(self, database_cluster_uuid: str, config: Optional[Any] = None) -> Any:
         """
@@ -2127,23 +2572,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PATCH', f"/v2/databases/{database_cluster_uuid}/config", body={
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/config"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_ca(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -2162,18 +2594,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/ca"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/ca", ttl=_DETAIL_TTL)
 
     def databases_get_migration_status(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -2192,18 +2614,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/online-migration"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/online-migration", ttl=_HOT_TTL)
 
     def start_online_migration(self, database_cluster_uuid: str, source: dict[str, Any], disable_ssl: Optional[bool] = None, ignore_dbs: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -2225,25 +2637,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/online-migration", body={
             'source': source,
             'disable_ssl': disable_ssl,
             'ignore_dbs': ignore_dbs,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/online-migration"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def delete_online_migration_by_id(self, database_cluster_uuid: str, migration_id: str) -> Any:
         """
@@ -2263,20 +2662,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if migration_id is None:
-            raise ValueError("Missing required parameter 'migration_id'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/online-migration/{migration_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, migration_id=migration_id)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/online-migration/{migration_id}")
 
     def databases_update_region(self, database_cluster_uuid: str, region: str) -> Any:
         """
@@ -2296,23 +2683,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/migrate", body={
             'region': region,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/migrate"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_update_cluster_size(self, database_cluster_uuid: str, size: str, num_nodes: int, storage_size_mib: Optional[int] = None) -> Any:
         """
@@ -2328,31 +2702,21 @@ class DigitaloceanApp(APIApplication):
             Any: The action was successful and the response body is empty.
 
         Raises:
+            ValueError: Raised if `num_nodes` is outside 1-3.
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        if num_nodes is not None and num_nodes not in _DATABASE_NODE_RANGE:
+            raise ValueError(f"Parameter 'num_nodes' must be between 1 and 3, got {num_nodes}.")
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/resize", body={
             'size': size,
             'num_nodes': num_nodes,
             'storage_size_mib': storage_size_mib,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/resize"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_list_firewall_rules(self, database_cluster_uuid: str) -> Any:
         """
@@ -2371,18 +2735,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/firewall"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/firewall", ttl=_DETAIL_TTL)
 
     def update_database_cluster_firewall(self, database_cluster_uuid: str, rules: Optional[List[dict[str, Any]]] = None) -> Any:
         """
@@ -2402,23 +2756,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/firewall", body={
             'rules': rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/firewall"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def update_database_maintenance(self, database_cluster_uuid: str, day: str, hour: str, pending: Optional[bool] = None, description: Optional[List[str]] = None) -> Any:
         """
@@ -2435,32 +2776,24 @@ class DigitaloceanApp(APIApplication):
             Any: The action was successful and the response body is empty.
 
         Raises:
+            ValueError: Raised if `day` is not a day of the week or `hour` is not a 24 hour `HH:MM` time.
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        if day is not None and day.lower() not in _WEEKDAYS:
+            raise ValueError(f"Parameter 'day' must be a day of the week, got {day!r}.")
+        if hour is not None and not _MAINTENANCE_HOUR.fullmatch(hour):
+            raise ValueError(f"Parameter 'hour' must be a 24 hour HH:MM time, got {hour!r}.")
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/maintenance", body={
             'day': day,
             'hour': hour,
             'pending': pending,
             'description': description,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/maintenance"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_install_update(self, database_cluster_uuid: str) -> Any:
         """
@@ -2479,19 +2812,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/install_update"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/install_update")
 
     def databases_list_backups(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -2510,18 +2832,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/backups"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/backups", ttl=_DETAIL_TTL)
 
     def databases_list_replicas(self, database_cluster_uuid: str) -> Any:
         """
@@ -2540,18 +2852,29 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/replicas"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/replicas", ttl=_HOT_TTL)
+
+    def databases_list_replicas_detailed(self, database_cluster_uuid: str) -> List[dict[str, Any]]:
+        """
+        List All Read-only Replicas with Their Details
+
+        Args:
+            database_cluster_uuid (string): database_cluster_uuid
+
+        Returns:
+            List[dict[str, Any]]: One JSON object with a key of `replica` per replica, in the order the replicas are listed. The per-replica lookups run concurrently on the pooled client.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a response body cannot be parsed as JSON.
+
+        Tags:
+            Databases
+        """
+        _require(database_cluster_uuid=database_cluster_uuid)
+        replicas = (self.databases_list_replicas(database_cluster_uuid) or {}).get('replicas') or []
+        return list(self._pool.map(lambda replica: self.databases_get_replica(database_cluster_uuid, replica['name']), replicas))
 
     def databases_create_replica(self, database_cluster_uuid: str, id: Optional[str] = None, name: Optional[str] = None, region: Optional[str] = None, size: Optional[str] = None, status: Optional[str] = None, tags: Optional[List[str]] = None, created_at: Optional[str] = None, private_network_uuid: Optional[str] = None, connection: Optional[Any] = None, private_connection: Optional[Any] = None, storage_size_mib: Optional[int] = None) -> dict[str, Any]:
         """
@@ -2581,10 +2904,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/replicas", body={
             'id': id,
             'name': name,
             'region': region,
@@ -2596,18 +2917,7 @@ class DigitaloceanApp(APIApplication):
             'connection': connection,
             'private_connection': private_connection,
             'storage_size_mib': storage_size_mib,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/replicas"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_list_events_logs(self, database_cluster_uuid: str) -> Any:
         """
@@ -2626,18 +2936,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/events"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/events")
 
     def databases_get_replica(self, database_cluster_uuid: str, replica_name: str) -> dict[str, Any]:
         """
@@ -2657,20 +2957,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if replica_name is None:
-            raise ValueError("Missing required parameter 'replica_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/replicas/{replica_name}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, replica_name=replica_name)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/replicas/{replica_name}", ttl=_HOT_TTL)
 
     def databases_destroy_replica(self, database_cluster_uuid: str, replica_name: str) -> Any:
         """
@@ -2690,20 +2978,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if replica_name is None:
-            raise ValueError("Missing required parameter 'replica_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/replicas/{replica_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, replica_name=replica_name)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/replicas/{replica_name}")
 
     def databases_promote_replica(self, database_cluster_uuid: str, replica_name: str) -> Any:
         """
@@ -2723,21 +2999,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if replica_name is None:
-            raise ValueError("Missing required parameter 'replica_name'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/replicas/{replica_name}/promote"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, replica_name=replica_name)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/replicas/{replica_name}/promote")
 
     def databases_list_users(self, database_cluster_uuid: str) -> Any:
         """
@@ -2756,18 +3019,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/users"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/users", ttl=_HOT_TTL)
 
     def databases_add_user(self, database_cluster_uuid: str, name: str, role: Optional[str] = None, password: Optional[str] = None, access_cert: Optional[str] = None, access_key: Optional[str] = None, mysql_settings: Optional[dict[str, Any]] = None, settings: Optional[dict[str, Any]] = None, readonly: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -2800,10 +3053,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/users", body={
             'name': name,
             'role': role,
             'password': password,
@@ -2812,18 +3063,7 @@ class DigitaloceanApp(APIApplication):
             'mysql_settings': mysql_settings,
             'settings': settings,
             'readonly': readonly,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/users"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_user(self, database_cluster_uuid: str, username: str) -> dict[str, Any]:
         """
@@ -2843,20 +3083,29 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if username is None:
-            raise ValueError("Missing required parameter 'username'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/users/{username}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, username=username)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/users/{username}", ttl=_HOT_TTL)
+
+    def databases_get_users_many(self, database_cluster_uuid: str, usernames: List[str]) -> List[dict[str, Any]]:
+        """
+        Retrieve Several Database Users Concurrently
+
+        Args:
+            database_cluster_uuid (string): database_cluster_uuid
+            usernames (array): The names of the users to retrieve. Example: "['app-01', 'app-02']".
+
+        Returns:
+            List[dict[str, Any]]: One JSON object with a key of `user` per username, in the order the usernames were given. The lookups run concurrently on the pooled client.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a response body cannot be parsed as JSON.
+
+        Tags:
+            Databases
+        """
+        _require(database_cluster_uuid=database_cluster_uuid, usernames=usernames)
+        return list(self._pool.map(lambda username: self.databases_get_user(database_cluster_uuid, username), usernames))
 
     def databases_delete_user(self, database_cluster_uuid: str, username: str) -> Any:
         """
@@ -2876,20 +3125,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if username is None:
-            raise ValueError("Missing required parameter 'username'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/users/{username}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, username=username)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/users/{username}")
 
     def databases_update_user(self, database_cluster_uuid: str, username: str, settings: dict[str, Any]) -> dict[str, Any]:
         """
@@ -2910,25 +3147,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if username is None:
-            raise ValueError("Missing required parameter 'username'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid, username=username)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/users/{username}", body={
             'settings': settings,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/users/{username}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_reset_auth(self, database_cluster_uuid: str, username: str, mysql_settings: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2949,25 +3171,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if username is None:
-            raise ValueError("Missing required parameter 'username'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid, username=username)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/users/{username}/reset_auth", body={
             'mysql_settings': mysql_settings,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/users/{username}/reset_auth"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_list(self, database_cluster_uuid: str) -> Any:
         """
@@ -2986,18 +3193,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases, important
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/dbs"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/dbs", ttl=_HOT_TTL)
 
     def databases_add(self, database_cluster_uuid: str, name: str) -> dict[str, Any]:
         """
@@ -3017,23 +3214,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/dbs", body={
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/dbs"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get(self, database_cluster_uuid: str, database_name: str) -> dict[str, Any]:
         """
@@ -3053,20 +3237,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if database_name is None:
-            raise ValueError("Missing required parameter 'database_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/dbs/{database_name}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, database_name=database_name)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/dbs/{database_name}", ttl=_HOT_TTL)
 
     def databases_delete(self, database_cluster_uuid: str, database_name: str) -> Any:
         """
@@ -3086,20 +3258,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if database_name is None:
-            raise ValueError("Missing required parameter 'database_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/dbs/{database_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, database_name=database_name)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/dbs/{database_name}")
 
     def databases_list_connection_pools(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -3118,18 +3278,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/pools"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/pools", ttl=_HOT_TTL)
 
     def databases_add_connection_pool(self, database_cluster_uuid: str, name: str, mode: str, size: int, db: str, user: Optional[str] = None, connection: Optional[Any] = None, private_connection: Optional[Any] = None, standby_connection: Optional[Any] = None, standby_private_connection: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -3157,10 +3307,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/pools", body={
             'name': name,
             'mode': mode,
             'size': size,
@@ -3170,18 +3318,7 @@ class DigitaloceanApp(APIApplication):
             'private_connection': private_connection,
             'standby_connection': standby_connection,
             'standby_private_connection': standby_private_connection,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/pools"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_connection_pool(self, database_cluster_uuid: str, pool_name: str) -> dict[str, Any]:
         """
@@ -3201,20 +3338,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if pool_name is None:
-            raise ValueError("Missing required parameter 'pool_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/pools/{pool_name}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, pool_name=pool_name)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/pools/{pool_name}", ttl=_HOT_TTL)
 
     def update_database_pool(self, database_cluster_uuid: str, pool_name: str, mode: str, size: int, db: str, user: Optional[str] = None) -> Any:
         """
@@ -3238,28 +3363,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if pool_name is None:
-            raise ValueError("Missing required parameter 'pool_name'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid, pool_name=pool_name)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/pools/{pool_name}", body={
             'mode': mode,
             'size': size,
             'db': db,
             'user': user,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/pools/{pool_name}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def delete_pool(self, database_cluster_uuid: str, pool_name: str) -> Any:
         """
@@ -3279,20 +3389,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if pool_name is None:
-            raise ValueError("Missing required parameter 'pool_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/pools/{pool_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, pool_name=pool_name)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/pools/{pool_name}")
 
     def databases_get_eviction_policy(self, database_cluster_uuid: str) -> Any:
         """
@@ -3311,18 +3409,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/eviction_policy"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/eviction_policy")
 
     def update_eviction_policy(self, database_cluster_uuid: str, eviction_policy: str) -> Any:
         """
@@ -3349,23 +3437,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/eviction_policy", body={
             'eviction_policy': eviction_policy,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/eviction_policy"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_sql_mode(self, database_cluster_uuid: str) -> dict[str, Any]:
         """
@@ -3384,18 +3459,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/sql_mode"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/sql_mode")
 
     def databases_update_sql_mode(self, database_cluster_uuid: str, sql_mode: str) -> Any:
         """
@@ -3415,23 +3480,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/sql_mode", body={
             'sql_mode': sql_mode,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/sql_mode"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_update_major_version(self, database_cluster_uuid: str, version: Optional[str] = None) -> Any:
         """
@@ -3451,23 +3503,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/upgrade", body={
             'version': version,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/upgrade"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_list_kafka_topics(self, database_cluster_uuid: str) -> Any:
         """
@@ -3486,18 +3525,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/topics"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/topics")
 
     def databases_create_kafka_topic(self, database_cluster_uuid: str, name: Optional[str] = None, replication_factor: Optional[int] = None, partition_count: Optional[int] = None, config: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -3520,26 +3549,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/topics", body={
             'name': name,
             'replication_factor': replication_factor,
             'partition_count': partition_count,
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/topics"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_kafka_topic(self, database_cluster_uuid: str, topic_name: str) -> Any:
         """
@@ -3559,20 +3575,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if topic_name is None:
-            raise ValueError("Missing required parameter 'topic_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/topics/{topic_name}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, topic_name=topic_name)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/topics/{topic_name}")
 
     def databases_update_kafka_topic(self, database_cluster_uuid: str, topic_name: str, replication_factor: Optional[int] = None, partition_count: Optional[int] = None, config: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -3595,27 +3599,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if topic_name is None:
-            raise ValueError("Missing required parameter 'topic_name'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid, topic_name=topic_name)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/topics/{topic_name}", body={
             'replication_factor': replication_factor,
             'partition_count': partition_count,
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/topics/{topic_name}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_delete_kafka_topic(self, database_cluster_uuid: str, topic_name: str) -> Any:
         """
@@ -3635,20 +3624,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if topic_name is None:
-            raise ValueError("Missing required parameter 'topic_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/topics/{topic_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, topic_name=topic_name)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/topics/{topic_name}")
 
     def databases_list_logsink(self, database_cluster_uuid: str) -> Any:
         """
@@ -3667,18 +3644,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/logsink"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/logsink")
 
     def databases_create_logsink(self, database_cluster_uuid: str, sink_name: str, sink_type: str, config: Any) -> Any:
         """
@@ -3707,25 +3674,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('POST', f"/v2/databases/{database_cluster_uuid}/logsink", body={
             'sink_name': sink_name,
             'sink_type': sink_type,
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/logsink"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_get_logsink(self, database_cluster_uuid: str, logsink_id: str) -> Any:
         """
@@ -3745,20 +3699,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if logsink_id is None:
-            raise ValueError("Missing required parameter 'logsink_id'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/logsink/{logsink_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, logsink_id=logsink_id)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/logsink/{logsink_id}")
 
     def databases_update_logsink(self, database_cluster_uuid: str, logsink_id: str, config: Any) -> Any:
         """
@@ -3779,25 +3721,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if logsink_id is None:
-            raise ValueError("Missing required parameter 'logsink_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(database_cluster_uuid=database_cluster_uuid, logsink_id=logsink_id)
+        return self._call('PUT', f"/v2/databases/{database_cluster_uuid}/logsink/{logsink_id}", body={
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/logsink/{logsink_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def databases_delete_logsink(self, database_cluster_uuid: str, logsink_id: str) -> Any:
         """
@@ -3817,20 +3744,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if logsink_id is None:
-            raise ValueError("Missing required parameter 'logsink_id'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/logsink/{logsink_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, logsink_id=logsink_id)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/logsink/{logsink_id}")
 
     def get_database_metrics_credentials(self) -> Any:
         """
@@ -3846,16 +3761,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        url = f"{self.base_url}/v2/databases/metrics/credentials"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/databases/metrics/credentials")
 
     def update_database_credentials(self, credentials: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -3874,21 +3780,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('PUT', "/v2/databases/metrics/credentials", body={
             'credentials': credentials,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/databases/metrics/credentials"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def list_database_indexes(self, database_cluster_uuid: str) -> Any:
         """
@@ -3907,18 +3801,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/indexes"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid)
+        return self._call('GET', f"/v2/databases/{database_cluster_uuid}/indexes")
 
     def delete_database_index_by_name(self, database_cluster_uuid: str, index_name: str) -> Any:
         """
@@ -3938,20 +3822,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Databases
         """
-        if database_cluster_uuid is None:
-            raise ValueError("Missing required parameter 'database_cluster_uuid'.")
-        if index_name is None:
-            raise ValueError("Missing required parameter 'index_name'.")
-        url = f"{self.base_url}/v2/databases/{database_cluster_uuid}/indexes/{index_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(database_cluster_uuid=database_cluster_uuid, index_name=index_name)
+        return self._call('DELETE', f"/v2/databases/{database_cluster_uuid}/indexes/{index_name}")
 
     def domains_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -3971,16 +3843,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domains, important
         """
-        url = f"{self.base_url}/v2/domains"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/domains", query={'per_page': per_page, 'page': page})
 
     def domains_create(self, name: Optional[str] = None, ip_address: Optional[str] = None, ttl: Optional[int] = None, zone_file: Optional[str] = None) -> Any:
         """
@@ -4002,24 +3865,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domains, important
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/domains", body={
             'name': name,
             'ip_address': ip_address,
             'ttl': ttl,
             'zone_file': zone_file,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/domains"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def domains_get(self, domain_name: str) -> Any:
         """
@@ -4038,18 +3889,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domains
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        url = f"{self.base_url}/v2/domains/{domain_name}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(domain_name=domain_name)
+        return self._call('GET', f"/v2/domains/{domain_name}")
 
     def domains_delete(self, domain_name: str) -> Any:
         """
@@ -4068,18 +3909,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domains
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        url = f"{self.base_url}/v2/domains/{domain_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(domain_name=domain_name)
+        return self._call('DELETE', f"/v2/domains/{domain_name}")
 
     def domains_list_records(self, domain_name: str, name: Optional[str] = None, type: Optional[str] = None, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4102,18 +3933,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domain Records
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        url = f"{self.base_url}/v2/domains/{domain_name}/records"
-        query_params = {k: v for k, v in [('name', name), ('type', type), ('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(domain_name=domain_name)
+        return self._call('GET', f"/v2/domains/{domain_name}/records", query={'name': name, 'type': type, 'per_page': per_page, 'page': page})
 
     def domains_create_record(self, domain_name: str, id: Optional[int] = None, type: Optional[str] = None, name: Optional[str] = None, data: Optional[str] = None, priority: Optional[int] = None, port: Optional[int] = None, ttl: Optional[int] = None, weight: Optional[int] = None, flags: Optional[int] = None, tag: Optional[str] = None) -> Any:
         """
@@ -4142,10 +3963,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domain Records
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        request_body_data = None
-        request_body_data = {
+        _require(domain_name=domain_name)
+        return self._call('POST', f"/v2/domains/{domain_name}/records", body={
             'id': id,
             'type': type,
             'name': name,
@@ -4156,18 +3975,7 @@ class DigitaloceanApp(APIApplication):
             'weight': weight,
             'flags': flags,
             'tag': tag,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/domains/{domain_name}/records"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def domains_get_record(self, domain_name: str, domain_record_id: str) -> Any:
         """
@@ -4187,20 +3995,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domain Records
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        if domain_record_id is None:
-            raise ValueError("Missing required parameter 'domain_record_id'.")
-        url = f"{self.base_url}/v2/domains/{domain_name}/records/{domain_record_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(domain_name=domain_name, domain_record_id=domain_record_id)
+        return self._call('GET', f"/v2/domains/{domain_name}/records/{domain_record_id}")
 
     def domains_patch_record(self, domain_name: str, domain_record_id: str, id: Optional[int] = None, type: Optional[str] = None, name: Optional[str] = None, data: Optional[str] = None, priority: Optional[int] = None, port: Optional[int] = None, ttl: Optional[int] = None, weight: Optional[int] = None, flags: Optional[int] = None, tag: Optional[str] = None) -> Any:
         """
@@ -4230,12 +4026,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domain Records
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        if domain_record_id is None:
-            raise ValueError("Missing required parameter 'domain_record_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(domain_name=domain_name, domain_record_id=domain_record_id)
+        return self._call('PATCH', f"/v2/domains/{domain_name}/records/{domain_record_id}", body={
             'id': id,
             'type': type,
             'name': name,
@@ -4246,18 +4038,7 @@ class DigitaloceanApp(APIApplication):
             'weight': weight,
             'flags': flags,
             'tag': tag,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/domains/{domain_name}/records/{domain_record_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def domains_update_record(self, domain_name: str, domain_record_id: str, id: Optional[int] = None, type: Optional[str] = None, name: Optional[str] = None, data: Optional[str] = None, priority: Optional[int] = None, port: Optional[int] = None, ttl: Optional[int] = None, weight: Optional[int] = None, flags: Optional[int] = None, tag: Optional[str] = None) -> Any:
         """
@@ -4287,12 +4068,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domain Records
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        if domain_record_id is None:
-            raise ValueError("Missing required parameter 'domain_record_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(domain_name=domain_name, domain_record_id=domain_record_id)
+        return self._call('PUT', f"/v2/domains/{domain_name}/records/{domain_record_id}", body={
             'id': id,
             'type': type,
             'name': name,
@@ -4303,18 +4080,7 @@ class DigitaloceanApp(APIApplication):
             'weight': weight,
             'flags': flags,
             'tag': tag,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/domains/{domain_name}/records/{domain_record_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def domains_delete_record(self, domain_name: str, domain_record_id: str) -> Any:
         """
@@ -4334,20 +4100,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Domain Records
         """
-        if domain_name is None:
-            raise ValueError("Missing required parameter 'domain_name'.")
-        if domain_record_id is None:
-            raise ValueError("Missing required parameter 'domain_record_id'.")
-        url = f"{self.base_url}/v2/domains/{domain_name}/records/{domain_record_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(domain_name=domain_name, domain_record_id=domain_record_id)
+        return self._call('DELETE', f"/v2/domains/{domain_name}/records/{domain_record_id}")
 
     def droplets_list(self, per_page: Optional[int] = None, page: Optional[int] = None, tag_name: Optional[str] = None, name: Optional[str] = None, type: Optional[str] = None) -> Any:
         """
@@ -4370,16 +4124,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets, important
         """
-        url = f"{self.base_url}/v2/droplets"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('tag_name', tag_name), ('name', name), ('type', type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/droplets", query={'per_page': per_page, 'page': page, 'tag_name': tag_name, 'name': name, 'type': type})
 
     def droplets_create(self, name: Optional[str] = None, region: Optional[str] = None, size: Optional[str] = None, image: Optional[Any] = None, ssh_keys: Optional[List[Any]] = None, backups: Optional[bool] = None, backup_policy: Optional[Any] = None, ipv6: Optional[bool] = None, monitoring: Optional[bool] = None, tags: Optional[List[str]] = None, user_data: Optional[str] = None, private_networking: Optional[bool] = None, volumes: Optional[List[str]] = None, vpc_uuid: Optional[str] = None, with_droplet_agent: Optional[bool] = None, names: Optional[List[str]] = None) -> Any:
         """
@@ -4413,8 +4158,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets, important
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/droplets", body={
             'name': name,
             'region': region,
             'size': size,
@@ -4431,18 +4175,7 @@ class DigitaloceanApp(APIApplication):
             'vpc_uuid': vpc_uuid,
             'with_droplet_agent': with_droplet_agent,
             'names': names,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/droplets"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def droplets_destroy_by_tag(self, tag_name: str) -> Any:
         """
@@ -4461,16 +4194,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        url = f"{self.base_url}/v2/droplets"
-        query_params = {k: v for k, v in [('tag_name', tag_name)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('DELETE', "/v2/droplets", query={'tag_name': tag_name})
 
     def droplets_get(self, droplet_id: str) -> Any:
         """
@@ -4490,18 +4214,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}")
 
     def droplets_destroy(self, droplet_id: str) -> Any:
         """
@@ -4520,18 +4234,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('DELETE', f"/v2/droplets/{droplet_id}")
 
     def droplets_list_backups(self, droplet_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4552,18 +4256,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/backups"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/backups", query={'per_page': per_page, 'page': page})
 
     def droplets_get_backup_policy(self, droplet_id: str) -> Any:
         """
@@ -4583,18 +4277,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/backups/policy"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/backups/policy")
 
     def droplets_list_backup_policies(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4614,16 +4298,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        url = f"{self.base_url}/v2/droplets/backups/policies"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/droplets/backups/policies", query={'per_page': per_page, 'page': page})
 
     def list_supported_policies(self) -> dict[str, Any]:
         """
@@ -4639,16 +4314,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        url = f"{self.base_url}/v2/droplets/backups/supported_policies"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/droplets/backups/supported_policies")
 
     def droplets_list_snapshots(self, droplet_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4669,18 +4335,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/snapshots"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/snapshots", query={'per_page': per_page, 'page': page})
 
     def droplet_actions_list(self, droplet_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4701,18 +4357,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Actions
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/actions"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/actions", query={'per_page': per_page, 'page': page})
 
     def droplet_actions_post(self, droplet_id: str, type: Optional[str] = None, backup_policy: Optional[Any] = None, image: Optional[Any] = None, disk: Optional[bool] = None, size: Optional[str] = None, name: Optional[str] = None, kernel: Optional[int] = None) -> Any:
         """
@@ -4738,10 +4384,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Actions
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(droplet_id=droplet_id)
+        return self._call('POST', f"/v2/droplets/{droplet_id}/actions", body={
             'type': type,
             'backup_policy': backup_policy,
             'image': image,
@@ -4749,18 +4393,7 @@ class DigitaloceanApp(APIApplication):
             'size': size,
             'name': name,
             'kernel': kernel,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/actions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def droplet_actions_post_by_tag(self, tag_name: Optional[str] = None, type: Optional[str] = None, name: Optional[str] = None) -> Any:
         """
@@ -4781,22 +4414,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Actions
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/droplets/actions", query={'tag_name': tag_name}, body={
             'type': type,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/droplets/actions"
-        query_params = {k: v for k, v in [('tag_name', tag_name)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def droplet_actions_get(self, droplet_id: str, action_id: str) -> Any:
         """
@@ -4816,20 +4437,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Actions
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        if action_id is None:
-            raise ValueError("Missing required parameter 'action_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/actions/{action_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id, action_id=action_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/actions/{action_id}")
 
     def droplets_list_kernels(self, droplet_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4850,18 +4459,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/kernels"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/kernels", query={'per_page': per_page, 'page': page})
 
     def droplets_list_firewalls(self, droplet_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -4882,18 +4481,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/firewalls"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/firewalls", query={'per_page': per_page, 'page': page})
 
     def droplets_list_neighbors(self, droplet_id: str) -> Any:
         """
@@ -4912,18 +4501,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/neighbors"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/neighbors")
 
     def destroy_droplet_with_resources(self, droplet_id: str) -> Any:
         """
@@ -4942,18 +4521,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/destroy_with_associated_resources"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/destroy_with_associated_resources")
 
     def destroy_select(self, droplet_id: str, floating_ips: Optional[List[str]] = None, reserved_ips: Optional[List[str]] = None, snapshots: Optional[List[str]] = None, volumes: Optional[List[str]] = None, volume_snapshots: Optional[List[str]] = None) -> Any:
         """
@@ -4977,26 +4546,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        request_body_data = {
+        _require(droplet_id=droplet_id)
+        return self._call('DELETE', f"/v2/droplets/{droplet_id}/destroy_with_associated_resources/selective", body={
             'floating_ips': floating_ips,
             'reserved_ips': reserved_ips,
             'snapshots': snapshots,
             'volumes': volumes,
             'volume_snapshots': volume_snapshots,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/destroy_with_associated_resources/selective"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def delete_droplet_resources(self, droplet_id: str) -> Any:
         """
@@ -5015,18 +4572,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/destroy_with_associated_resources/dangerous"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('DELETE', f"/v2/droplets/{droplet_id}/destroy_with_associated_resources/dangerous")
 
     def get_droplet_status(self, droplet_id: str) -> dict[str, Any]:
         """
@@ -5045,18 +4592,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/destroy_with_associated_resources/status"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('GET', f"/v2/droplets/{droplet_id}/destroy_with_associated_resources/status")
 
     def retry_droplet_with_resources(self, droplet_id: str) -> Any:
         """
@@ -5075,19 +4612,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        if droplet_id is None:
-            raise ValueError("Missing required parameter 'droplet_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/droplets/{droplet_id}/destroy_with_associated_resources/retry"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(droplet_id=droplet_id)
+        return self._call('POST', f"/v2/droplets/{droplet_id}/destroy_with_associated_resources/retry")
 
     def autoscalepools_list(self, per_page: Optional[int] = None, page: Optional[int] = None, name: Optional[str] = None) -> Any:
         """
@@ -5108,16 +4634,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        url = f"{self.base_url}/v2/droplets/autoscale"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('name', name)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/droplets/autoscale", query={'per_page': per_page, 'page': page, 'name': name})
 
     def autoscalepools_create(self, name: Optional[str] = None, config: Optional[dict[str, Any]] = None, droplet_template: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -5138,23 +4655,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/droplets/autoscale", body={
             'name': name,
             'config': config,
             'droplet_template': droplet_template,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/droplets/autoscale"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def autoscalepools_get(self, autoscale_pool_id: str) -> Any:
         """
@@ -5174,18 +4679,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        if autoscale_pool_id is None:
-            raise ValueError("Missing required parameter 'autoscale_pool_id'.")
-        url = f"{self.base_url}/v2/droplets/autoscale/{autoscale_pool_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(autoscale_pool_id=autoscale_pool_id)
+        return self._call('GET', f"/v2/droplets/autoscale/{autoscale_pool_id}")
 
     def autoscalepools_update(self, autoscale_pool_id: str, name: Optional[str] = None, config: Optional[dict[str, Any]] = None, droplet_template: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -5207,25 +4702,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        if autoscale_pool_id is None:
-            raise ValueError("Missing required parameter 'autoscale_pool_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(autoscale_pool_id=autoscale_pool_id)
+        return self._call('PUT', f"/v2/droplets/autoscale/{autoscale_pool_id}", body={
             'name': name,
             'config': config,
             'droplet_template': droplet_template,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/droplets/autoscale/{autoscale_pool_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def autoscalepools_delete(self, autoscale_pool_id: str) -> Any:
         """
@@ -5244,18 +4726,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        if autoscale_pool_id is None:
-            raise ValueError("Missing required parameter 'autoscale_pool_id'.")
-        url = f"{self.base_url}/v2/droplets/autoscale/{autoscale_pool_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(autoscale_pool_id=autoscale_pool_id)
+        return self._call('DELETE', f"/v2/droplets/autoscale/{autoscale_pool_id}")
 
     def delete_autoscale_pool_dangerously(self, autoscale_pool_id: str) -> Any:
         """
@@ -5274,18 +4746,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        if autoscale_pool_id is None:
-            raise ValueError("Missing required parameter 'autoscale_pool_id'.")
-        url = f"{self.base_url}/v2/droplets/autoscale/{autoscale_pool_id}/dangerous"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(autoscale_pool_id=autoscale_pool_id)
+        return self._call('DELETE', f"/v2/droplets/autoscale/{autoscale_pool_id}/dangerous")
 
     def autoscalepools_list_members(self, autoscale_pool_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -5306,18 +4768,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        if autoscale_pool_id is None:
-            raise ValueError("Missing required parameter 'autoscale_pool_id'.")
-        url = f"{self.base_url}/v2/droplets/autoscale/{autoscale_pool_id}/members"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(autoscale_pool_id=autoscale_pool_id)
+        return self._call('GET', f"/v2/droplets/autoscale/{autoscale_pool_id}/members", query={'per_page': per_page, 'page': page})
 
     def autoscalepools_list_history(self, autoscale_pool_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -5338,18 +4790,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplet Autoscale Pools
         """
-        if autoscale_pool_id is None:
-            raise ValueError("Missing required parameter 'autoscale_pool_id'.")
-        url = f"{self.base_url}/v2/droplets/autoscale/{autoscale_pool_id}/history"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(autoscale_pool_id=autoscale_pool_id)
+        return self._call('GET', f"/v2/droplets/autoscale/{autoscale_pool_id}/history", query={'per_page': per_page, 'page': page})
 
     def firewalls_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -5369,16 +4811,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        url = f"{self.base_url}/v2/firewalls"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/firewalls", query={'per_page': per_page, 'page': page})
 
     def firewalls_create(self, id: Optional[str] = None, status: Optional[str] = None, created_at: Optional[str] = None, pending_changes: Optional[List[dict[str, Any]]] = None, name: Optional[str] = None, droplet_ids: Optional[List[int]] = None, tags: Optional[Any] = None, inbound_rules: Optional[List[Any]] = None, outbound_rules: Optional[List[Any]] = None) -> Any:
         """
@@ -5405,8 +4838,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/firewalls", body={
             'id': id,
             'status': status,
             'created_at': created_at,
@@ -5416,18 +4848,7 @@ class DigitaloceanApp(APIApplication):
             'tags': tags,
             'inbound_rules': inbound_rules,
             'outbound_rules': outbound_rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_get(self, firewall_id: str) -> Any:
         """
@@ -5446,18 +4867,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(firewall_id=firewall_id)
+        return self._call('GET', f"/v2/firewalls/{firewall_id}")
 
     def firewalls_update(self, firewall_id: str, id: Optional[str] = None, status: Optional[str] = None, created_at: Optional[str] = None, pending_changes: Optional[List[dict[str, Any]]] = None, name: Optional[str] = None, droplet_ids: Optional[List[int]] = None, tags: Optional[Any] = None, inbound_rules: Optional[List[Any]] = None, outbound_rules: Optional[List[Any]] = None) -> Any:
         """
@@ -5485,10 +4896,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('PUT', f"/v2/firewalls/{firewall_id}", body={
             'id': id,
             'status': status,
             'created_at': created_at,
@@ -5498,18 +4907,7 @@ class DigitaloceanApp(APIApplication):
             'tags': tags,
             'inbound_rules': inbound_rules,
             'outbound_rules': outbound_rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_delete(self, firewall_id: str) -> Any:
         """
@@ -5528,18 +4926,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(firewall_id=firewall_id)
+        return self._call('DELETE', f"/v2/firewalls/{firewall_id}")
 
     def firewalls_assign_droplets(self, firewall_id: str, droplet_ids: Optional[List[int]] = None) -> Any:
         """
@@ -5559,23 +4947,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('POST', f"/v2/firewalls/{firewall_id}/droplets", body={
             'droplet_ids': droplet_ids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}/droplets"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_delete_droplets(self, firewall_id: str, droplet_ids: Optional[List[int]] = None) -> Any:
         """
@@ -5595,22 +4970,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('DELETE', f"/v2/firewalls/{firewall_id}/droplets", body={
             'droplet_ids': droplet_ids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}/droplets"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_add_tags(self, firewall_id: str, tags: Optional[Any] = None) -> Any:
         """
@@ -5630,23 +4993,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('POST', f"/v2/firewalls/{firewall_id}/tags", body={
             'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}/tags"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_delete_tags(self, firewall_id: str, tags: Optional[Any] = None) -> Any:
         """
@@ -5666,22 +5016,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('DELETE', f"/v2/firewalls/{firewall_id}/tags", body={
             'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}/tags"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_add_rules(self, firewall_id: str, inbound_rules: Optional[List[Any]] = None, outbound_rules: Optional[List[Any]] = None) -> Any:
         """
@@ -5702,24 +5040,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('POST', f"/v2/firewalls/{firewall_id}/rules", body={
             'inbound_rules': inbound_rules,
             'outbound_rules': outbound_rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}/rules"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def firewalls_delete_rules(self, firewall_id: str, inbound_rules: Optional[List[Any]] = None, outbound_rules: Optional[List[Any]] = None) -> Any:
         """
@@ -5740,23 +5065,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Firewalls
         """
-        if firewall_id is None:
-            raise ValueError("Missing required parameter 'firewall_id'.")
-        request_body_data = {
+        _require(firewall_id=firewall_id)
+        return self._call('DELETE', f"/v2/firewalls/{firewall_id}/rules", body={
             'inbound_rules': inbound_rules,
             'outbound_rules': outbound_rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/firewalls/{firewall_id}/rules"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def floating_ips_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -5776,16 +5089,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IPs
         """
-        url = f"{self.base_url}/v2/floating_ips"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/floating_ips", query={'per_page': per_page, 'page': page})
 
     def floating_ips_create(self, droplet_id: Optional[int] = None, region: Optional[str] = None, project_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -5807,23 +5111,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IPs
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/floating_ips", body={
             'droplet_id': droplet_id,
             'region': region,
             'project_id': project_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/floating_ips"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def floating_ips_get(self, floating_ip: str) -> dict[str, Any]:
         """
@@ -5842,18 +5134,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IPs
         """
-        if floating_ip is None:
-            raise ValueError("Missing required parameter 'floating_ip'.")
-        url = f"{self.base_url}/v2/floating_ips/{floating_ip}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(floating_ip=floating_ip)
+        return self._call('GET', f"/v2/floating_ips/{floating_ip}")
 
     def floating_ips_delete(self, floating_ip: str) -> Any:
         """
@@ -5872,18 +5154,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IPs
         """
-        if floating_ip is None:
-            raise ValueError("Missing required parameter 'floating_ip'.")
-        url = f"{self.base_url}/v2/floating_ips/{floating_ip}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(floating_ip=floating_ip)
+        return self._call('DELETE', f"/v2/floating_ips/{floating_ip}")
 
     def floating_ips_action_list(self, floating_ip: str) -> Any:
         """
@@ -5902,18 +5174,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IP Actions
         """
-        if floating_ip is None:
-            raise ValueError("Missing required parameter 'floating_ip'.")
-        url = f"{self.base_url}/v2/floating_ips/{floating_ip}/actions"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(floating_ip=floating_ip)
+        return self._call('GET', f"/v2/floating_ips/{floating_ip}/actions")
 
     def floating_ips_action_post(self, floating_ip: str, type: Optional[str] = None, droplet_id: Optional[int] = None) -> Any:
         """
@@ -5934,24 +5196,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IP Actions
         """
-        if floating_ip is None:
-            raise ValueError("Missing required parameter 'floating_ip'.")
-        request_body_data = None
-        request_body_data = {
+        _require(floating_ip=floating_ip)
+        return self._call('POST', f"/v2/floating_ips/{floating_ip}/actions", body={
             'type': type,
             'droplet_id': droplet_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/floating_ips/{floating_ip}/actions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def floating_ips_action_get(self, floating_ip: str, action_id: str) -> Any:
         """
@@ -5971,20 +5220,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Floating IP Actions
         """
-        if floating_ip is None:
-            raise ValueError("Missing required parameter 'floating_ip'.")
-        if action_id is None:
-            raise ValueError("Missing required parameter 'action_id'.")
-        url = f"{self.base_url}/v2/floating_ips/{floating_ip}/actions/{action_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(floating_ip=floating_ip, action_id=action_id)
+        return self._call('GET', f"/v2/floating_ips/{floating_ip}/actions/{action_id}")
 
     def functions_list_namespaces(self) -> Any:
         """
@@ -6001,16 +5238,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        url = f"{self.base_url}/v2/functions/namespaces"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/functions/namespaces")
 
     def functions_create_namespace(self, region: str, label: str) -> dict[str, Any]:
         """
@@ -6031,22 +5259,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/functions/namespaces", body={
             'region': region,
             'label': label,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/functions/namespaces"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def functions_get_namespace(self, namespace_id: str) -> dict[str, Any]:
         """
@@ -6066,18 +5282,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(namespace_id=namespace_id)
+        return self._call('GET', f"/v2/functions/namespaces/{namespace_id}")
 
     def functions_delete_namespace(self, namespace_id: str) -> Any:
         """
@@ -6096,18 +5302,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(namespace_id=namespace_id)
+        return self._call('DELETE', f"/v2/functions/namespaces/{namespace_id}")
 
     def functions_list_triggers(self, namespace_id: str) -> Any:
         """
@@ -6127,18 +5323,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}/triggers"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(namespace_id=namespace_id)
+        return self._call('GET', f"/v2/functions/namespaces/{namespace_id}/triggers")
 
     def functions_create_trigger(self, namespace_id: str, name: str, function: str, type: str, is_enabled: bool, scheduled_details: dict[str, Any]) -> dict[str, Any]:
         """
@@ -6164,27 +5350,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(namespace_id=namespace_id)
+        return self._call('POST', f"/v2/functions/namespaces/{namespace_id}/triggers", body={
             'name': name,
             'function': function,
             'type': type,
             'is_enabled': is_enabled,
             'scheduled_details': scheduled_details,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}/triggers"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def functions_get_trigger(self, namespace_id: str, trigger_name: str) -> dict[str, Any]:
         """
@@ -6205,20 +5378,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        if trigger_name is None:
-            raise ValueError("Missing required parameter 'trigger_name'.")
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}/triggers/{trigger_name}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(namespace_id=namespace_id, trigger_name=trigger_name)
+        return self._call('GET', f"/v2/functions/namespaces/{namespace_id}/triggers/{trigger_name}")
 
     def functions_update_trigger(self, namespace_id: str, trigger_name: str, is_enabled: Optional[bool] = None, scheduled_details: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -6242,26 +5403,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        if trigger_name is None:
-            raise ValueError("Missing required parameter 'trigger_name'.")
-        request_body_data = None
-        request_body_data = {
+        _require(namespace_id=namespace_id, trigger_name=trigger_name)
+        return self._call('PUT', f"/v2/functions/namespaces/{namespace_id}/triggers/{trigger_name}", body={
             'is_enabled': is_enabled,
             'scheduled_details': scheduled_details,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}/triggers/{trigger_name}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def functions_delete_trigger(self, namespace_id: str, trigger_name: str) -> Any:
         """
@@ -6281,20 +5427,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Functions
         """
-        if namespace_id is None:
-            raise ValueError("Missing required parameter 'namespace_id'.")
-        if trigger_name is None:
-            raise ValueError("Missing required parameter 'trigger_name'.")
-        url = f"{self.base_url}/v2/functions/namespaces/{namespace_id}/triggers/{trigger_name}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(namespace_id=namespace_id, trigger_name=trigger_name)
+        return self._call('DELETE', f"/v2/functions/namespaces/{namespace_id}/triggers/{trigger_name}")
 
     def images_list(self, type: Optional[str] = None, private: Optional[bool] = None, tag_name: Optional[str] = None, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -6317,16 +5451,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Images, important
         """
-        url = f"{self.base_url}/v2/images"
-        query_params = {k: v for k, v in [('type', type), ('private', private), ('tag_name', tag_name), ('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/images", query={'type': type, 'private': private, 'tag_name': tag_name, 'per_page': per_page, 'page': page})
 
     def images_create_custom(self, name: str, url: str, region: str, distribution: Optional[str] = None, description: Optional[str] = None, tags: Optional[List[str]] = None) -> Any:
         """
@@ -6350,26 +5475,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Images
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/images", body={
             'name': name,
             'distribution': distribution,
             'description': description,
             'url': url,
             'region': region,
             'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/images"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def images_get(self, image_id: str) -> dict[str, Any]:
         """
@@ -6388,18 +5501,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Images
         """
-        if image_id is None:
-            raise ValueError("Missing required parameter 'image_id'.")
-        url = f"{self.base_url}/v2/images/{image_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(image_id=image_id)
+        return self._call('GET', f"/v2/images/{image_id}")
 
     def images_update(self, image_id: str, name: Optional[str] = None, distribution: Optional[str] = None, description: Optional[str] = None) -> dict[str, Any]:
         """
@@ -6421,25 +5524,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Images
         """
-        if image_id is None:
-            raise ValueError("Missing required parameter 'image_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(image_id=image_id)
+        return self._call('PUT', f"/v2/images/{image_id}", body={
             'name': name,
             'distribution': distribution,
             'description': description,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/images/{image_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def images_delete(self, image_id: str) -> Any:
         """
@@ -6458,18 +5548,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Images
         """
-        if image_id is None:
-            raise ValueError("Missing required parameter 'image_id'.")
-        url = f"{self.base_url}/v2/images/{image_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(image_id=image_id)
+        return self._call('DELETE', f"/v2/images/{image_id}")
 
     def image_actions_list(self, image_id: str) -> Any:
         """
@@ -6488,18 +5568,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Image Actions
         """
-        if image_id is None:
-            raise ValueError("Missing required parameter 'image_id'.")
-        url = f"{self.base_url}/v2/images/{image_id}/actions"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(image_id=image_id)
+        return self._call('GET', f"/v2/images/{image_id}/actions")
 
     def image_actions_post(self, image_id: str, type: Optional[str] = None, region: Optional[str] = None) -> dict[str, Any]:
         """
@@ -6520,24 +5590,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Image Actions
         """
-        if image_id is None:
-            raise ValueError("Missing required parameter 'image_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(image_id=image_id)
+        return self._call('POST', f"/v2/images/{image_id}/actions", body={
             'type': type,
             'region': region,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/images/{image_id}/actions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def image_actions_get(self, image_id: str, action_id: str) -> dict[str, Any]:
         """
@@ -6557,20 +5614,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Image Actions
         """
-        if image_id is None:
-            raise ValueError("Missing required parameter 'image_id'.")
-        if action_id is None:
-            raise ValueError("Missing required parameter 'action_id'.")
-        url = f"{self.base_url}/v2/images/{image_id}/actions/{action_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(image_id=image_id, action_id=action_id)
+        return self._call('GET', f"/v2/images/{image_id}/actions/{action_id}")
 
     def kubernetes_list_clusters(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -6592,16 +5637,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        url = f"{self.base_url}/v2/kubernetes/clusters"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/kubernetes/clusters", query={'per_page': per_page, 'page': page})
 
     def kubernetes_create_cluster(self, name: str, region: str, version: str, node_pools: List[dict[str, Any]], id: Optional[str] = None, cluster_subnet: Optional[str] = None, service_subnet: Optional[str] = None, vpc_uuid: Optional[str] = None, ipv4: Optional[str] = None, endpoint: Optional[str] = None, tags: Optional[List[str]] = None, maintenance_policy: Optional[dict[str, Any]] = None, auto_upgrade: Optional[bool] = None, status: Optional[dict[str, Any]] = None, created_at: Optional[str] = None, updated_at: Optional[str] = None, surge_upgrade: Optional[bool] = None, ha: Optional[bool] = None, registry_enabled: Optional[bool] = None, control_plane_firewall: Optional[dict[str, Any]] = None, cluster_autoscaler_configuration: Optional[dict[str, Any]] = None, routing_agent: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -6648,8 +5684,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/kubernetes/clusters", body={
             'id': id,
             'name': name,
             'region': region,
@@ -6672,18 +5707,7 @@ class DigitaloceanApp(APIApplication):
             'control_plane_firewall': control_plane_firewall,
             'cluster_autoscaler_configuration': cluster_autoscaler_configuration,
             'routing_agent': routing_agent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_get_cluster(self, cluster_id: str) -> Any:
         """
@@ -6704,18 +5728,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}")
 
     def kubernetes_update_cluster(self, cluster_id: str, name: str, tags: Optional[List[str]] = None, maintenance_policy: Optional[dict[str, Any]] = None, auto_upgrade: Optional[bool] = None, surge_upgrade: Optional[bool] = None, ha: Optional[bool] = None, control_plane_firewall: Optional[dict[str, Any]] = None, cluster_autoscaler_configuration: Optional[dict[str, Any]] = None, routing_agent: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -6745,10 +5759,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cluster_id=cluster_id)
+        return self._call('PUT', f"/v2/kubernetes/clusters/{cluster_id}", body={
             'name': name,
             'tags': tags,
             'maintenance_policy': maintenance_policy,
@@ -6758,18 +5770,7 @@ class DigitaloceanApp(APIApplication):
             'control_plane_firewall': control_plane_firewall,
             'cluster_autoscaler_configuration': cluster_autoscaler_configuration,
             'routing_agent': routing_agent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_delete_cluster(self, cluster_id: str) -> Any:
         """
@@ -6788,18 +5789,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('DELETE', f"/v2/kubernetes/clusters/{cluster_id}")
 
     def destroy_cluster_resources(self, cluster_id: str) -> dict[str, Any]:
         """
@@ -6818,18 +5809,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/destroy_with_associated_resources"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/destroy_with_associated_resources")
 
     def delete_cluster_resources(self, cluster_id: str, load_balancers: Optional[List[str]] = None, volumes: Optional[List[str]] = None, volume_snapshots: Optional[List[str]] = None) -> Any:
         """
@@ -6851,24 +5832,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        request_body_data = {
+        _require(cluster_id=cluster_id)
+        return self._call('DELETE', f"/v2/kubernetes/clusters/{cluster_id}/destroy_with_associated_resources/selective", body={
             'load_balancers': load_balancers,
             'volumes': volumes,
             'volume_snapshots': volume_snapshots,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/destroy_with_associated_resources/selective"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def destroy_cluster_with_resources(self, cluster_id: str) -> Any:
         """
@@ -6887,18 +5856,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/destroy_with_associated_resources/dangerous"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('DELETE', f"/v2/kubernetes/clusters/{cluster_id}/destroy_with_associated_resources/dangerous")
 
     def kubernetes_get_kubeconfig(self, cluster_id: str, expiry_seconds: Optional[int] = None) -> Any:
         """
@@ -6918,18 +5877,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/kubeconfig"
-        query_params = {k: v for k, v in [('expiry_seconds', expiry_seconds)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/kubeconfig", query={'expiry_seconds': expiry_seconds})
 
     def kubernetes_get_credentials(self, cluster_id: str, expiry_seconds: Optional[int] = None) -> dict[str, Any]:
         """
@@ -6949,18 +5898,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/credentials"
-        query_params = {k: v for k, v in [('expiry_seconds', expiry_seconds)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/credentials", query={'expiry_seconds': expiry_seconds})
 
     def get_cluster_upgrades(self, cluster_id: str) -> dict[str, Any]:
         """
@@ -6984,18 +5923,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/upgrades"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/upgrades")
 
     def kubernetes_upgrade_cluster(self, cluster_id: str, version: Optional[str] = None) -> Any:
         """
@@ -7015,23 +5944,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cluster_id=cluster_id)
+        return self._call('POST', f"/v2/kubernetes/clusters/{cluster_id}/upgrade", body={
             'version': version,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/upgrade"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_list_node_pools(self, cluster_id: str) -> Any:
         """
@@ -7052,18 +5968,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/node_pools")
 
     def kubernetes_add_node_pool(self, cluster_id: str, size: str, name: str, count: int, id: Optional[str] = None, tags: Optional[List[str]] = None, labels: Optional[dict[str, Any]] = None, taints: Optional[List[dict[str, Any]]] = None, auto_scale: Optional[bool] = None, min_nodes: Optional[int] = None, max_nodes: Optional[int] = None, nodes: Optional[List[dict[str, Any]]] = None) -> Any:
         """
@@ -7094,10 +6000,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cluster_id=cluster_id)
+        return self._call('POST', f"/v2/kubernetes/clusters/{cluster_id}/node_pools", body={
             'size': size,
             'id': id,
             'name': name,
@@ -7109,18 +6013,7 @@ class DigitaloceanApp(APIApplication):
             'min_nodes': min_nodes,
             'max_nodes': max_nodes,
             'nodes': nodes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_get_node_pool(self, cluster_id: str, node_pool_id: str) -> Any:
         """
@@ -7141,20 +6034,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        if node_pool_id is None:
-            raise ValueError("Missing required parameter 'node_pool_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id, node_pool_id=node_pool_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}")
 
     def kubernetes_update_node_pool(self, cluster_id: str, node_pool_id: str, name: str, count: int, id: Optional[str] = None, tags: Optional[List[str]] = None, labels: Optional[dict[str, Any]] = None, taints: Optional[List[dict[str, Any]]] = None, auto_scale: Optional[bool] = None, min_nodes: Optional[int] = None, max_nodes: Optional[int] = None, nodes: Optional[List[dict[str, Any]]] = None) -> Any:
         """
@@ -7185,12 +6066,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        if node_pool_id is None:
-            raise ValueError("Missing required parameter 'node_pool_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cluster_id=cluster_id, node_pool_id=node_pool_id)
+        return self._call('PUT', f"/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}", body={
             'id': id,
             'name': name,
             'count': count,
@@ -7201,18 +6078,7 @@ class DigitaloceanApp(APIApplication):
             'min_nodes': min_nodes,
             'max_nodes': max_nodes,
             'nodes': nodes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_delete_node_pool(self, cluster_id: str, node_pool_id: str) -> Any:
         """
@@ -7232,20 +6098,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        if node_pool_id is None:
-            raise ValueError("Missing required parameter 'node_pool_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id, node_pool_id=node_pool_id)
+        return self._call('DELETE', f"/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}")
 
     def kubernetes_delete_node(self, cluster_id: str, node_pool_id: str, node_id: str, skip_drain: Optional[int] = None, replace: Optional[int] = None) -> Any:
         """
@@ -7268,22 +6122,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        if node_pool_id is None:
-            raise ValueError("Missing required parameter 'node_pool_id'.")
-        if node_id is None:
-            raise ValueError("Missing required parameter 'node_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}/nodes/{node_id}"
-        query_params = {k: v for k, v in [('skip_drain', skip_drain), ('replace', replace)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id, node_pool_id=node_pool_id, node_id=node_id)
+        return self._call('DELETE', f"/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}/nodes/{node_id}", query={'skip_drain': skip_drain, 'replace': replace})
 
     def kubernetes_recycle_node_pool(self, cluster_id: str, node_pool_id: str, nodes: Optional[List[str]] = None) -> Any:
         """
@@ -7304,25 +6144,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        if node_pool_id is None:
-            raise ValueError("Missing required parameter 'node_pool_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cluster_id=cluster_id, node_pool_id=node_pool_id)
+        return self._call('POST', f"/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}/recycle", body={
             'nodes': nodes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/node_pools/{node_pool_id}/recycle"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_get_cluster_user(self, cluster_id: str) -> dict[str, Any]:
         """
@@ -7342,18 +6167,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/user"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/user")
 
     def kubernetes_list_options(self) -> dict[str, Any]:
         """
@@ -7371,16 +6186,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        url = f"{self.base_url}/v2/kubernetes/options"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/kubernetes/options", ttl=_CATALOG_TTL)
 
     def kubernetes_run_cluster_lint(self, cluster_id: str, include_groups: Optional[List[str]] = None, include_checks: Optional[List[str]] = None, exclude_groups: Optional[List[str]] = None, exclude_checks: Optional[List[str]] = None) -> Any:
         """
@@ -7403,26 +6209,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(cluster_id=cluster_id)
+        return self._call('POST', f"/v2/kubernetes/clusters/{cluster_id}/clusterlint", body={
             'include_groups': include_groups,
             'include_checks': include_checks,
             'exclude_groups': exclude_groups,
             'exclude_checks': exclude_checks,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/clusterlint"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def get_cluster_lint(self, cluster_id: str, run_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -7444,18 +6237,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/clusterlint"
-        query_params = {k: v for k, v in [('run_id', run_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/clusterlint", query={'run_id': run_id})
 
     def kubernetes_add_registry(self, cluster_uuids: Optional[List[str]] = None) -> Any:
         """
@@ -7474,21 +6257,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/kubernetes/registry", body={
             'cluster_uuids': cluster_uuids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/registry"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_remove_registry(self, cluster_uuids: Optional[List[str]] = None) -> Any:
         """
@@ -7507,20 +6278,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        request_body_data = {
+        return self._call('DELETE', "/v2/kubernetes/registry", body={
             'cluster_uuids': cluster_uuids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/kubernetes/registry"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def kubernetes_get_status_messages(self, cluster_id: str, since: Optional[str] = None) -> Any:
         """
@@ -7540,18 +6300,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Kubernetes
         """
-        if cluster_id is None:
-            raise ValueError("Missing required parameter 'cluster_id'.")
-        url = f"{self.base_url}/v2/kubernetes/clusters/{cluster_id}/status_messages"
-        query_params = {k: v for k, v in [('since', since)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(cluster_id=cluster_id)
+        return self._call('GET', f"/v2/kubernetes/clusters/{cluster_id}/status_messages", query={'since': since})
 
     def load_balancers_create(self, droplet_ids: Optional[List[int]] = None, region: Optional[str] = None, id: Optional[str] = None, name: Optional[str] = None, project_id: Optional[str] = None, ip: Optional[str] = None, ipv6: Optional[str] = None, size_unit: Optional[int] = None, size: Optional[str] = None, algorithm: Optional[str] = None, status: Optional[str] = None, created_at: Optional[str] = None, forwarding_rules: Optional[List[dict[str, Any]]] = None, health_check: Optional[dict[str, Any]] = None, sticky_sessions: Optional[dict[str, Any]] = None, redirect_http_to_https: Optional[bool] = None, enable_proxy_protocol: Optional[bool] = None, enable_backend_keepalive: Optional[bool] = None, http_idle_timeout_seconds: Optional[int] = None, vpc_uuid: Optional[str] = None, disable_lets_encrypt_dns_records: Optional[bool] = None, firewall: Optional[dict[str, Any]] = None, network: Optional[str] = None, network_stack: Optional[str] = None, type: Optional[str] = None, domains: Optional[List[dict[str, Any]]] = None, glb_settings: Optional[dict[str, Any]] = None, target_load_balancer_ids: Optional[List[str]] = None, tls_cipher_policy: Optional[str] = None, tag: Optional[str] = None) -> Any:
         """
@@ -7604,8 +6354,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/load_balancers", body={
             'droplet_ids': droplet_ids,
             'region': region,
             'id': id,
@@ -7636,18 +6385,7 @@ class DigitaloceanApp(APIApplication):
             'target_load_balancer_ids': target_load_balancer_ids,
             'tls_cipher_policy': tls_cipher_policy,
             'tag': tag,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/load_balancers"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def load_balancers_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -7667,16 +6405,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        url = f"{self.base_url}/v2/load_balancers"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/load_balancers", query={'per_page': per_page, 'page': page})
 
     def load_balancers_get(self, lb_id: str) -> Any:
         """
@@ -7697,18 +6426,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(lb_id=lb_id)
+        return self._call('GET', f"/v2/load_balancers/{lb_id}")
 
     def load_balancers_update(self, lb_id: str, droplet_ids: Optional[List[int]] = None, region: Optional[str] = None, id: Optional[str] = None, name: Optional[str] = None, project_id: Optional[str] = None, ip: Optional[str] = None, ipv6: Optional[str] = None, size_unit: Optional[int] = None, size: Optional[str] = None, algorithm: Optional[str] = None, status: Optional[str] = None, created_at: Optional[str] = None, forwarding_rules: Optional[List[dict[str, Any]]] = None, health_check: Optional[dict[str, Any]] = None, sticky_sessions: Optional[dict[str, Any]] = None, redirect_http_to_https: Optional[bool] = None, enable_proxy_protocol: Optional[bool] = None, enable_backend_keepalive: Optional[bool] = None, http_idle_timeout_seconds: Optional[int] = None, vpc_uuid: Optional[str] = None, disable_lets_encrypt_dns_records: Optional[bool] = None, firewall: Optional[dict[str, Any]] = None, network: Optional[str] = None, network_stack: Optional[str] = None, type: Optional[str] = None, domains: Optional[List[dict[str, Any]]] = None, glb_settings: Optional[dict[str, Any]] = None, target_load_balancer_ids: Optional[List[str]] = None, tls_cipher_policy: Optional[str] = None, tag: Optional[str] = None) -> Any:
         """
@@ -7764,10 +6483,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(lb_id=lb_id)
+        return self._call('PUT', f"/v2/load_balancers/{lb_id}", body={
             'droplet_ids': droplet_ids,
             'region': region,
             'id': id,
@@ -7798,18 +6515,7 @@ class DigitaloceanApp(APIApplication):
             'target_load_balancer_ids': target_load_balancer_ids,
             'tls_cipher_policy': tls_cipher_policy,
             'tag': tag,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def load_balancers_delete(self, lb_id: str) -> Any:
         """
@@ -7828,18 +6534,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(lb_id=lb_id)
+        return self._call('DELETE', f"/v2/load_balancers/{lb_id}")
 
     def load_balancers_delete_cache(self, lb_id: str) -> Any:
         """
@@ -7858,18 +6554,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}/cache"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(lb_id=lb_id)
+        return self._call('DELETE', f"/v2/load_balancers/{lb_id}/cache")
 
     def load_balancers_add_droplets(self, lb_id: str, droplet_ids: List[int]) -> Any:
         """
@@ -7889,23 +6575,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(lb_id=lb_id)
+        return self._call('POST', f"/v2/load_balancers/{lb_id}/droplets", body={
             'droplet_ids': droplet_ids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}/droplets"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def load_balancers_remove_droplets(self, lb_id: str, droplet_ids: List[int]) -> Any:
         """
@@ -7925,22 +6598,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        request_body_data = {
+        _require(lb_id=lb_id)
+        return self._call('DELETE', f"/v2/load_balancers/{lb_id}/droplets", body={
             'droplet_ids': droplet_ids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}/droplets"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def add_forwarding_rule(self, lb_id: str, forwarding_rules: List[dict[str, Any]]) -> Any:
         """
@@ -7960,23 +6621,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(lb_id=lb_id)
+        return self._call('POST', f"/v2/load_balancers/{lb_id}/forwarding_rules", body={
             'forwarding_rules': forwarding_rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}/forwarding_rules"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def delete_lb_forwarding_rules(self, lb_id: str, forwarding_rules: List[dict[str, Any]]) -> Any:
         """
@@ -7996,22 +6644,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Load Balancers
         """
-        if lb_id is None:
-            raise ValueError("Missing required parameter 'lb_id'.")
-        request_body_data = {
+        _require(lb_id=lb_id)
+        return self._call('DELETE', f"/v2/load_balancers/{lb_id}/forwarding_rules", body={
             'forwarding_rules': forwarding_rules,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/load_balancers/{lb_id}/forwarding_rules"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def monitoring_list_alert_policy(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -8031,16 +6667,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/alerts"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/monitoring/alerts", query={'per_page': per_page, 'page': page})
 
     def monitoring_create_alert_policy(self, alerts: dict[str, Any], compare: str, description: str, enabled: bool, entities: List[str], tags: List[str], type: str, value: float, window: str) -> Any:
         """
@@ -8067,8 +6694,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/monitoring/alerts", body={
             'alerts': alerts,
             'compare': compare,
             'description': description,
@@ -8078,18 +6704,7 @@ class DigitaloceanApp(APIApplication):
             'type': type,
             'value': value,
             'window': window,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/monitoring/alerts"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def monitoring_get_alert_policy(self, alert_uuid: str) -> Any:
         """
@@ -8108,18 +6723,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if alert_uuid is None:
-            raise ValueError("Missing required parameter 'alert_uuid'.")
-        url = f"{self.base_url}/v2/monitoring/alerts/{alert_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(alert_uuid=alert_uuid)
+        return self._call('GET', f"/v2/monitoring/alerts/{alert_uuid}")
 
     def monitoring_update_alert_policy(self, alert_uuid: str, alerts: dict[str, Any], compare: str, description: str, enabled: bool, entities: List[str], tags: List[str], type: str, value: float, window: str) -> Any:
         """
@@ -8147,10 +6752,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if alert_uuid is None:
-            raise ValueError("Missing required parameter 'alert_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(alert_uuid=alert_uuid)
+        return self._call('PUT', f"/v2/monitoring/alerts/{alert_uuid}", body={
             'alerts': alerts,
             'compare': compare,
             'description': description,
@@ -8160,18 +6763,7 @@ class DigitaloceanApp(APIApplication):
             'type': type,
             'value': value,
             'window': window,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/monitoring/alerts/{alert_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def monitoring_delete_alert_policy(self, alert_uuid: str) -> Any:
         """
@@ -8190,18 +6782,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if alert_uuid is None:
-            raise ValueError("Missing required parameter 'alert_uuid'.")
-        url = f"{self.base_url}/v2/monitoring/alerts/{alert_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(alert_uuid=alert_uuid)
+        return self._call('DELETE', f"/v2/monitoring/alerts/{alert_uuid}")
 
     def get_droplet_bandwidth_metrics(self, host_id: str, interface: str, direction: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8224,16 +6806,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/bandwidth"
-        query_params = {k: v for k, v in [('host_id', host_id), ('interface', interface), ('direction', direction), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/bandwidth', {'host_id': host_id, 'interface': interface, 'direction': direction, 'start': start, 'end': end})
 
     def get_droplet_cpu_metrics(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8254,16 +6827,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/cpu"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/cpu', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_filesystem_free(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8284,16 +6848,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/filesystem_free"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/filesystem_free', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_filesystem_size(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8314,16 +6869,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/filesystem_size"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/filesystem_size', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_load_metrics(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8344,16 +6890,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/load_1"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/load_1', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_load5_metrics(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8374,16 +6911,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/load_5"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/load_5', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_load_metric(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8404,16 +6932,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/load_15"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/load_15', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_memory_cached(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8434,16 +6953,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/memory_cached"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/memory_cached', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_memory_free(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8464,16 +6974,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/memory_free"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/memory_free', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_memory_total(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8494,16 +6995,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/memory_total"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/memory_total', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_droplet_memory_available(self, host_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8524,16 +7016,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet/memory_available"
-        query_params = {k: v for k, v in [('host_id', host_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet/memory_available', {'host_id': host_id, 'start': start, 'end': end})
 
     def get_app_memory_percentage(self, app_id: str, start: str, end: str, app_component: Optional[str] = None) -> dict[str, Any]:
         """
@@ -8555,16 +7038,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/apps/memory_percentage"
-        query_params = {k: v for k, v in [('app_id', app_id), ('app_component', app_component), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('apps/memory_percentage', {'app_id': app_id, 'app_component': app_component, 'start': start, 'end': end})
 
     def get_app_cpu_metrics(self, app_id: str, start: str, end: str, app_component: Optional[str] = None) -> dict[str, Any]:
         """
@@ -8586,16 +7060,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/apps/cpu_percentage"
-        query_params = {k: v for k, v in [('app_id', app_id), ('app_component', app_component), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('apps/cpu_percentage', {'app_id': app_id, 'app_component': app_component, 'start': start, 'end': end})
 
     def get_app_restart_count(self, app_id: str, start: str, end: str, app_component: Optional[str] = None) -> dict[str, Any]:
         """
@@ -8617,16 +7082,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/apps/restart_count"
-        query_params = {k: v for k, v in [('app_id', app_id), ('app_component', app_component), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('apps/restart_count', {'app_id': app_id, 'app_component': app_component, 'start': start, 'end': end})
 
     def get_frontend_connections(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8647,16 +7103,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_connections_current"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_connections_current', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_lb_frontend_connections_limit(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8677,16 +7124,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_connections_limit"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_connections_limit', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_cpu_utilization(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8707,16 +7145,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_cpu_utilization"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_cpu_utilization', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_firewall_bytes(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8737,16 +7166,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_firewall_dropped_bytes"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_firewall_dropped_bytes', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_lb_frontend_fw_dropped_pkts(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8767,16 +7187,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_firewall_dropped_packets"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_firewall_dropped_packets', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_load_balancer_responses(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8797,16 +7208,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_http_responses"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_http_responses', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def fetch_frontend_request_rate(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8827,16 +7229,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_http_requests_per_second"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_http_requests_per_second', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_network_throughput(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8857,16 +7250,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_network_throughput_http"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_network_throughput_http', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_udp_throughput(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8887,16 +7271,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_network_throughput_udp"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_network_throughput_udp', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_tcp_throughput(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8917,16 +7292,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_network_throughput_tcp"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_network_throughput_tcp', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_nlb_tcp_throughput(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8947,16 +7313,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_nlb_tcp_network_throughput"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_nlb_tcp_network_throughput', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_nlb_udp_throughput(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -8977,16 +7334,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_nlb_udp_network_throughput"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_nlb_udp_network_throughput', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_tls_connections(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9007,16 +7355,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_tls_connections_current"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_tls_connections_current', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_frontend_tls_connections_limit(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9037,16 +7376,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_tls_connections_limit"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_tls_connections_limit', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_tls_exceeding_rate_limit(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9067,16 +7397,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/frontend_tls_connections_exceeding_rate_limit"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/frontend_tls_connections_exceeding_rate_limit', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_session_duration_avg(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9097,16 +7418,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_session_duration_avg"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_session_duration_avg', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_session_duration_50p(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9127,16 +7439,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_session_duration_50p"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_session_duration_50p', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_session_duration_95p(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9157,16 +7460,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_session_duration_95p"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_session_duration_95p', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_response_time(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9187,16 +7481,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_response_time_avg"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_response_time_avg', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_http_response_time(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9217,16 +7502,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_response_time_50p"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_response_time_50p', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplets_http_response_timep_95p(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9247,16 +7523,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_response_time_95p"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_response_time_95p', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplets_http_response_timep_99p(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9277,16 +7544,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_response_time_99p"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_response_time_99p', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_queue_size(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9307,16 +7565,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_queue_size"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_queue_size', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_responses(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9337,16 +7586,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_http_responses"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_http_responses', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_connections(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9367,16 +7607,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_connections"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_connections', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_droplet_health_checks(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9397,16 +7628,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_health_checks"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_health_checks', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_load_balancer_downtime(self, lb_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9427,16 +7649,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/load_balancer/droplets_downtime"
-        query_params = {k: v for k, v in [('lb_id', lb_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('load_balancer/droplets_downtime', {'lb_id': lb_id, 'start': start, 'end': end})
 
     def get_current_autoscale_instances(self, autoscale_pool_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9457,16 +7670,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet_autoscale/current_instances"
-        query_params = {k: v for k, v in [('autoscale_pool_id', autoscale_pool_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet_autoscale/current_instances', {'autoscale_pool_id': autoscale_pool_id, 'start': start, 'end': end})
 
     def list_target_instances(self, autoscale_pool_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9487,16 +7691,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet_autoscale/target_instances"
-        query_params = {k: v for k, v in [('autoscale_pool_id', autoscale_pool_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet_autoscale/target_instances', {'autoscale_pool_id': autoscale_pool_id, 'start': start, 'end': end})
 
     def get_droplet_cpu_utilization(self, autoscale_pool_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9517,16 +7712,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet_autoscale/current_cpu_utilization"
-        query_params = {k: v for k, v in [('autoscale_pool_id', autoscale_pool_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet_autoscale/current_cpu_utilization', {'autoscale_pool_id': autoscale_pool_id, 'start': start, 'end': end})
 
     def get_droplet_target_cpu_utilization(self, autoscale_pool_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9547,16 +7733,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet_autoscale/target_cpu_utilization"
-        query_params = {k: v for k, v in [('autoscale_pool_id', autoscale_pool_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet_autoscale/target_cpu_utilization', {'autoscale_pool_id': autoscale_pool_id, 'start': start, 'end': end})
 
     def get_droplet_memory_utilization(self, autoscale_pool_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9577,16 +7754,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet_autoscale/current_memory_utilization"
-        query_params = {k: v for k, v in [('autoscale_pool_id', autoscale_pool_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet_autoscale/current_memory_utilization', {'autoscale_pool_id': autoscale_pool_id, 'start': start, 'end': end})
 
     def get_autoscale_memory_target(self, autoscale_pool_id: str, start: str, end: str) -> dict[str, Any]:
         """
@@ -9607,16 +7775,27 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/metrics/droplet_autoscale/target_memory_utilization"
-        query_params = {k: v for k, v in [('autoscale_pool_id', autoscale_pool_id), ('start', start), ('end', end)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._get_metric('droplet_autoscale/target_memory_utilization', {'autoscale_pool_id': autoscale_pool_id, 'start': start, 'end': end})
+
+    async def monitoring_get_batch(self, metrics: List[dict[str, Any]]) -> List[Any]:
+        """
+        Get Multiple Metrics Concurrently
+
+        Args:
+            metrics (array): The metric queries to run. Each item names a `metric` path below `/v2/monitoring/metrics/` and may carry a `params` object with that metric's query parameters. Example: "[{'metric': 'droplet/cpu', 'params': {'host_id': '17209102', 'start': '1620683817', 'end': '1620705417'}}]".
+
+        Returns:
+            List[Any]: One metric response per query, in the order the queries were given. Each response is a JSON object with a key called `data` and `status`.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a response body cannot be parsed as JSON.
+
+        Tags:
+            Monitoring
+        """
+        _require(metrics=metrics)
+        return await self.fetch_many([{'path': f"/v2/monitoring/metrics/{spec['metric']}", 'query': spec.get('params')} for spec in metrics])
 
     def monitoring_create_destination(self, type: Any, config: dict[str, Any], name: Optional[str] = None) -> Any:
         """
@@ -9639,23 +7818,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/monitoring/sinks/destinations", body={
             'name': name,
             'type': type,
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/monitoring/sinks/destinations"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def monitoring_list_destinations(self) -> Any:
         """
@@ -9671,16 +7838,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/sinks/destinations"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/monitoring/sinks/destinations")
 
     def monitoring_get_destination(self, destination_uuid: str) -> Any:
         """
@@ -9699,18 +7857,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if destination_uuid is None:
-            raise ValueError("Missing required parameter 'destination_uuid'.")
-        url = f"{self.base_url}/v2/monitoring/sinks/destinations/{destination_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(destination_uuid=destination_uuid)
+        return self._call('GET', f"/v2/monitoring/sinks/destinations/{destination_uuid}")
 
     def monitoring_update_destination(self, destination_uuid: str, type: Any, config: dict[str, Any], name: Optional[str] = None) -> Any:
         """
@@ -9734,25 +7882,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if destination_uuid is None:
-            raise ValueError("Missing required parameter 'destination_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(destination_uuid=destination_uuid)
+        return self._call('POST', f"/v2/monitoring/sinks/destinations/{destination_uuid}", body={
             'name': name,
             'type': type,
             'config': config,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/monitoring/sinks/destinations/{destination_uuid}"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def monitoring_delete_destination(self, destination_uuid: str) -> Any:
         """
@@ -9771,18 +7906,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if destination_uuid is None:
-            raise ValueError("Missing required parameter 'destination_uuid'.")
-        url = f"{self.base_url}/v2/monitoring/sinks/destinations/{destination_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(destination_uuid=destination_uuid)
+        return self._call('DELETE', f"/v2/monitoring/sinks/destinations/{destination_uuid}")
 
     def monitoring_create_sink(self, destination_uuid: Optional[str] = None, resources: Optional[List[dict[str, Any]]] = None) -> Any:
         """
@@ -9802,22 +7927,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/monitoring/sinks", body={
             'destination_uuid': destination_uuid,
             'resources': resources,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/monitoring/sinks"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def monitoring_list_sinks(self, resource_id: Optional[str] = None) -> Any:
         """
@@ -9836,16 +7949,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        url = f"{self.base_url}/v2/monitoring/sinks"
-        query_params = {k: v for k, v in [('resource_id', resource_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/monitoring/sinks", query={'resource_id': resource_id})
 
     def monitoring_get_sink(self, sink_uuid: str) -> Any:
         """
@@ -9864,18 +7968,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if sink_uuid is None:
-            raise ValueError("Missing required parameter 'sink_uuid'.")
-        url = f"{self.base_url}/v2/monitoring/sinks/{sink_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(sink_uuid=sink_uuid)
+        return self._call('GET', f"/v2/monitoring/sinks/{sink_uuid}")
 
     def monitoring_delete_sink(self, sink_uuid: str) -> Any:
         """
@@ -9894,18 +7988,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Monitoring
         """
-        if sink_uuid is None:
-            raise ValueError("Missing required parameter 'sink_uuid'.")
-        url = f"{self.base_url}/v2/monitoring/sinks/{sink_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(sink_uuid=sink_uuid)
+        return self._call('DELETE', f"/v2/monitoring/sinks/{sink_uuid}")
 
     def partner_attachments_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -9926,16 +8010,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        url = f"{self.base_url}/v2/partner_network_connect/attachments"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/partner_network_connect/attachments", query={'per_page': per_page, 'page': page})
 
     def partner_attachments_create(self, name: Optional[str] = None, connection_bandwidth_in_mbps: Optional[int] = None, region: Optional[str] = None, naas_provider: Optional[str] = None, vpc_ids: Optional[List[str]] = None, parent_uuid: Optional[str] = None, bgp: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -9961,8 +8036,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/partner_network_connect/attachments", body={
             'name': name,
             'connection_bandwidth_in_mbps': connection_bandwidth_in_mbps,
             'region': region,
@@ -9970,18 +8044,7 @@ class DigitaloceanApp(APIApplication):
             'vpc_ids': vpc_ids,
             'parent_uuid': parent_uuid,
             'bgp': bgp,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/partner_network_connect/attachments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def partner_attachments_get(self, pa_id: str) -> Any:
         """
@@ -10001,18 +8064,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(pa_id=pa_id)
+        return self._call('GET', f"/v2/partner_network_connect/attachments/{pa_id}")
 
     def partner_attachments_patch(self, pa_id: str, name: Optional[str] = None, vpc_ids: Optional[List[str]] = None, bgp: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -10035,25 +8088,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(pa_id=pa_id)
+        return self._call('PATCH', f"/v2/partner_network_connect/attachments/{pa_id}", body={
             'name': name,
             'vpc_ids': vpc_ids,
             'bgp': bgp,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def partner_attachments_delete(self, pa_id: str) -> Any:
         """
@@ -10073,18 +8113,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(pa_id=pa_id)
+        return self._call('DELETE', f"/v2/partner_network_connect/attachments/{pa_id}")
 
     def get_bgp_auth_key_by_pa_id(self, pa_id: str) -> Any:
         """
@@ -10104,18 +8134,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}/bgp_auth_key"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(pa_id=pa_id)
+        return self._call('GET', f"/v2/partner_network_connect/attachments/{pa_id}/bgp_auth_key")
 
     def get_partner_network_remote_routes(self, pa_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -10137,18 +8157,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}/remote_routes"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(pa_id=pa_id)
+        return self._call('GET', f"/v2/partner_network_connect/attachments/{pa_id}/remote_routes", query={'per_page': per_page, 'page': page})
 
     def update_remote_routes(self, pa_id: str, remote_routes: Optional[List[dict[str, Any]]] = None) -> Any:
         """
@@ -10169,23 +8179,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(pa_id=pa_id)
+        return self._call('PUT', f"/v2/partner_network_connect/attachments/{pa_id}/remote_routes", body={
             'remote_routes': remote_routes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}/remote_routes"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def get_partner_service_key(self, pa_id: str) -> Any:
         """
@@ -10205,18 +8202,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}/service_key"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(pa_id=pa_id)
+        return self._call('GET', f"/v2/partner_network_connect/attachments/{pa_id}/service_key")
 
     def create_service_key(self, pa_id: str) -> Any:
         """
@@ -10236,19 +8223,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Partner Network Connect
         """
-        if pa_id is None:
-            raise ValueError("Missing required parameter 'pa_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/partner_network_connect/attachments/{pa_id}/service_key"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(pa_id=pa_id)
+        return self._call('POST', f"/v2/partner_network_connect/attachments/{pa_id}/service_key")
 
     def projects_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -10268,16 +8244,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects, important
         """
-        url = f"{self.base_url}/v2/projects"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/projects", query={'per_page': per_page, 'page': page}, conditional=True, ttl=_LISTING_TTL)
 
     def projects_create(self, name: str, purpose: str, id: Optional[str] = None, owner_uuid: Optional[str] = None, owner_id: Optional[int] = None, description: Optional[str] = None, environment: Optional[str] = None, created_at: Optional[str] = None, updated_at: Optional[str] = None) -> Any:
         """
@@ -10319,8 +8286,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects, important
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/projects", body={
             'id': id,
             'owner_uuid': owner_uuid,
             'owner_id': owner_id,
@@ -10330,18 +8296,7 @@ class DigitaloceanApp(APIApplication):
             'environment': environment,
             'created_at': created_at,
             'updated_at': updated_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def projects_get_default(self) -> Any:
         """
@@ -10357,16 +8312,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        url = f"{self.base_url}/v2/projects/default"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/projects/default")
 
     def projects_update_default(self, name: str, description: str, purpose: str, environment: str, is_default: bool, id: Optional[str] = None, owner_uuid: Optional[str] = None, owner_id: Optional[int] = None, created_at: Optional[str] = None, updated_at: Optional[str] = None) -> Any:
         """
@@ -10409,8 +8355,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('PUT', "/v2/projects/default", body={
             'id': id,
             'owner_uuid': owner_uuid,
             'owner_id': owner_id,
@@ -10421,18 +8366,7 @@ class DigitaloceanApp(APIApplication):
             'created_at': created_at,
             'updated_at': updated_at,
             'is_default': is_default,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects/default"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def projects_patch_default(self, id: Optional[str] = None, owner_uuid: Optional[str] = None, owner_id: Optional[int] = None, name: Optional[str] = None, description: Optional[str] = None, purpose: Optional[str] = None, environment: Optional[str] = None, created_at: Optional[str] = None, updated_at: Optional[str] = None, is_default: Optional[bool] = None) -> Any:
         """
@@ -10475,8 +8409,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('PATCH', "/v2/projects/default", body={
             'id': id,
             'owner_uuid': owner_uuid,
             'owner_id': owner_id,
@@ -10487,18 +8420,7 @@ class DigitaloceanApp(APIApplication):
             'created_at': created_at,
             'updated_at': updated_at,
             'is_default': is_default,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects/default"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def projects_get(self, project_id: str) -> Any:
         """
@@ -10517,18 +8439,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'.")
-        url = f"{self.base_url}/v2/projects/{project_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(project_id=project_id)
+        return self._call('GET', f"/v2/projects/{project_id}")
 
     def projects_update(self, project_id: str, name: str, description: str, purpose: str, environment: str, is_default: bool, id: Optional[str] = None, owner_uuid: Optional[str] = None, owner_id: Optional[int] = None, created_at: Optional[str] = None, updated_at: Optional[str] = None) -> Any:
         """
@@ -10572,10 +8484,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(project_id=project_id)
+        return self._call('PUT', f"/v2/projects/{project_id}", body={
             'id': id,
             'owner_uuid': owner_uuid,
             'owner_id': owner_id,
@@ -10586,18 +8496,7 @@ class DigitaloceanApp(APIApplication):
             'created_at': created_at,
             'updated_at': updated_at,
             'is_default': is_default,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects/{project_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def projects_patch(self, project_id: str, id: Optional[str] = None, owner_uuid: Optional[str] = None, owner_id: Optional[int] = None, name: Optional[str] = None, description: Optional[str] = None, purpose: Optional[str] = None, environment: Optional[str] = None, created_at: Optional[str] = None, updated_at: Optional[str] = None, is_default: Optional[bool] = None) -> Any:
         """
@@ -10641,10 +8540,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(project_id=project_id)
+        return self._call('PATCH', f"/v2/projects/{project_id}", body={
             'id': id,
             'owner_uuid': owner_uuid,
             'owner_id': owner_id,
@@ -10655,18 +8552,7 @@ class DigitaloceanApp(APIApplication):
             'created_at': created_at,
             'updated_at': updated_at,
             'is_default': is_default,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects/{project_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def projects_delete(self, project_id: str) -> Any:
         """
@@ -10685,18 +8571,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Projects
         """
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'.")
-        url = f"{self.base_url}/v2/projects/{project_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(project_id=project_id)
+        return self._call('DELETE', f"/v2/projects/{project_id}")
 
     def projects_list_resources(self, project_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -10717,18 +8593,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Project Resources
         """
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'.")
-        url = f"{self.base_url}/v2/projects/{project_id}/resources"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(project_id=project_id)
+        return self._call('GET', f"/v2/projects/{project_id}/resources", query={'per_page': per_page, 'page': page})
 
     def projects_assign_resources(self, project_id: str, resources: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -10748,23 +8614,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Project Resources
         """
-        if project_id is None:
-            raise ValueError("Missing required parameter 'project_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(project_id=project_id)
+        return self._call('POST', f"/v2/projects/{project_id}/resources", body={
             'resources': resources,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects/{project_id}/resources"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def list_project_resources(self) -> Any:
         """
@@ -10780,16 +8633,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Project Resources
         """
-        url = f"{self.base_url}/v2/projects/default/resources"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/projects/default/resources")
 
     def create_default_project_resource(self, resources: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -10808,21 +8652,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Project Resources
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/projects/default/resources", body={
             'resources': resources,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/projects/default/resources"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def regions_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -10842,16 +8674,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Regions
         """
-        url = f"{self.base_url}/v2/regions"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/regions", query={'per_page': per_page, 'page': page}, ttl=_CATALOG_TTL)
 
     def registry_get(self) -> Any:
         """
@@ -10867,16 +8690,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        url = f"{self.base_url}/v2/registry"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/registry")
 
     def registry_create(self, name: str, subscription_tier_slug: str, region: Optional[str] = None) -> Any:
         """
@@ -10897,23 +8711,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/registry", body={
             'name': name,
             'subscription_tier_slug': subscription_tier_slug,
             'region': region,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/registry"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def registry_delete(self) -> Any:
         """
@@ -10929,16 +8731,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        url = f"{self.base_url}/v2/registry"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('DELETE', "/v2/registry")
 
     def registry_get_subscription(self) -> Any:
         """
@@ -10954,16 +8747,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        url = f"{self.base_url}/v2/registry/subscription"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/registry/subscription")
 
     def registry_update_subscription(self, tier_slug: Optional[str] = None) -> Any:
         """
@@ -10982,21 +8766,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/registry/subscription", body={
             'tier_slug': tier_slug,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/registry/subscription"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def registry_get_docker_credentials(self, expiry_seconds: Optional[int] = None, read_write: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -11016,16 +8788,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        url = f"{self.base_url}/v2/registry/docker-credentials"
-        query_params = {k: v for k, v in [('expiry_seconds', expiry_seconds), ('read_write', read_write)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/registry/docker-credentials", query={'expiry_seconds': expiry_seconds, 'read_write': read_write})
 
     def registry_validate_name(self, name: str) -> Any:
         """
@@ -11044,21 +8807,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/registry/validate-name", body={
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/registry/validate-name"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def registry_list_repositories(self, registry_name: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -11079,18 +8830,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/repositories"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name)
+        return self._call('GET', f"/v2/registry/{registry_name}/repositories", query={'per_page': per_page, 'page': page})
 
     def registry_list_repositories_v(self, registry_name: str, per_page: Optional[int] = None, page: Optional[int] = None, page_token: Optional[str] = None) -> Any:
         """
@@ -11112,18 +8853,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/repositoriesV2"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('page_token', page_token)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name)
+        return self._call('GET', f"/v2/registry/{registry_name}/repositoriesV2", query={'per_page': per_page, 'page': page, 'page_token': page_token})
 
     def registry_list_repository_tags(self, registry_name: str, repository_name: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -11145,20 +8876,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        if repository_name is None:
-            raise ValueError("Missing required parameter 'repository_name'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/repositories/{repository_name}/tags"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name, repository_name=repository_name)
+        return self._call('GET', f"/v2/registry/{registry_name}/repositories/{repository_name}/tags", query={'per_page': per_page, 'page': page}, conditional=True)
 
     def registry_delete_repository_tag(self, registry_name: str, repository_name: str, repository_tag: str) -> Any:
         """
@@ -11179,22 +8898,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        if repository_name is None:
-            raise ValueError("Missing required parameter 'repository_name'.")
-        if repository_tag is None:
-            raise ValueError("Missing required parameter 'repository_tag'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/repositories/{repository_name}/tags/{repository_tag}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name, repository_name=repository_name, repository_tag=repository_tag)
+        return self._call('DELETE', f"/v2/registry/{registry_name}/repositories/{repository_name}/tags/{repository_tag}")
 
     def get_repository_digests(self, registry_name: str, repository_name: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -11216,20 +8921,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        if repository_name is None:
-            raise ValueError("Missing required parameter 'repository_name'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/repositories/{repository_name}/digests"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name, repository_name=repository_name)
+        return self._call('GET', f"/v2/registry/{registry_name}/repositories/{repository_name}/digests", query={'per_page': per_page, 'page': page})
 
     def delete_manifest_digest(self, registry_name: str, repository_name: str, manifest_digest: str) -> Any:
         """
@@ -11250,22 +8943,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        if repository_name is None:
-            raise ValueError("Missing required parameter 'repository_name'.")
-        if manifest_digest is None:
-            raise ValueError("Missing required parameter 'manifest_digest'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/repositories/{repository_name}/digests/{manifest_digest}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name, repository_name=repository_name, manifest_digest=manifest_digest)
+        return self._call('DELETE', f"/v2/registry/{registry_name}/repositories/{repository_name}/digests/{manifest_digest}")
 
     def registry_run_garbage_collection(self, registry_name: str, type: Optional[str] = None) -> dict[str, Any]:
         """
@@ -11285,23 +8964,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        request_body_data = None
-        request_body_data = {
+        _require(registry_name=registry_name)
+        return self._call('POST', f"/v2/registry/{registry_name}/garbage-collection", body={
             'type': type,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/registry/{registry_name}/garbage-collection"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def registry_get_garbage_collection(self, registry_name: str) -> dict[str, Any]:
         """
@@ -11320,18 +8986,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/garbage-collection"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name)
+        return self._call('GET', f"/v2/registry/{registry_name}/garbage-collection")
 
     def list_registry_garbage_collections(self, registry_name: str, per_page: Optional[int] = None, page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11352,18 +9008,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        url = f"{self.base_url}/v2/registry/{registry_name}/garbage-collections"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(registry_name=registry_name)
+        return self._call('GET', f"/v2/registry/{registry_name}/garbage-collections", query={'per_page': per_page, 'page': page})
 
     def update_garbage_collection(self, registry_name: str, garbage_collection_uuid: str, cancel: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -11384,25 +9030,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        if registry_name is None:
-            raise ValueError("Missing required parameter 'registry_name'.")
-        if garbage_collection_uuid is None:
-            raise ValueError("Missing required parameter 'garbage_collection_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(registry_name=registry_name, garbage_collection_uuid=garbage_collection_uuid)
+        return self._call('PUT', f"/v2/registry/{registry_name}/garbage-collection/{garbage_collection_uuid}", body={
             'cancel': cancel,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/registry/{registry_name}/garbage-collection/{garbage_collection_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def registry_get_options(self) -> dict[str, Any]:
         """
@@ -11418,16 +9049,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Container Registry
         """
-        url = f"{self.base_url}/v2/registry/options"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/registry/options", ttl=_CATALOG_TTL)
 
     def droplets_list_neighbors_ids(self) -> dict[str, Any]:
         """
@@ -11443,16 +9065,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Droplets
         """
-        url = f"{self.base_url}/v2/reports/droplet_neighbors_ids"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/reports/droplet_neighbors_ids")
 
     def reserved_ips_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -11472,16 +9085,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IPs
         """
-        url = f"{self.base_url}/v2/reserved_ips"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/reserved_ips", query={'per_page': per_page, 'page': page})
 
     def reserved_ips_create(self, droplet_id: Optional[int] = None, region: Optional[str] = None, project_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -11503,23 +9107,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IPs
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/reserved_ips", body={
             'droplet_id': droplet_id,
             'region': region,
             'project_id': project_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/reserved_ips"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def reserved_ips_get(self, reserved_ip: str) -> dict[str, Any]:
         """
@@ -11538,18 +9130,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IPs
         """
-        if reserved_ip is None:
-            raise ValueError("Missing required parameter 'reserved_ip'.")
-        url = f"{self.base_url}/v2/reserved_ips/{reserved_ip}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(reserved_ip=reserved_ip)
+        return self._call('GET', f"/v2/reserved_ips/{reserved_ip}")
 
     def reserved_ips_delete(self, reserved_ip: str) -> Any:
         """
@@ -11568,18 +9150,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IPs
         """
-        if reserved_ip is None:
-            raise ValueError("Missing required parameter 'reserved_ip'.")
-        url = f"{self.base_url}/v2/reserved_ips/{reserved_ip}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(reserved_ip=reserved_ip)
+        return self._call('DELETE', f"/v2/reserved_ips/{reserved_ip}")
 
     def reserved_ips_actions_list(self, reserved_ip: str) -> Any:
         """
@@ -11598,18 +9170,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IP Actions
         """
-        if reserved_ip is None:
-            raise ValueError("Missing required parameter 'reserved_ip'.")
-        url = f"{self.base_url}/v2/reserved_ips/{reserved_ip}/actions"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(reserved_ip=reserved_ip)
+        return self._call('GET', f"/v2/reserved_ips/{reserved_ip}/actions")
 
     def reserved_ips_actions_post(self, reserved_ip: str, type: Optional[str] = None, droplet_id: Optional[int] = None) -> Any:
         """
@@ -11630,24 +9192,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IP Actions
         """
-        if reserved_ip is None:
-            raise ValueError("Missing required parameter 'reserved_ip'.")
-        request_body_data = None
-        request_body_data = {
+        _require(reserved_ip=reserved_ip)
+        return self._call('POST', f"/v2/reserved_ips/{reserved_ip}/actions", body={
             'type': type,
             'droplet_id': droplet_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/reserved_ips/{reserved_ip}/actions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def reserved_ips_actions_get(self, reserved_ip: str, action_id: str) -> Any:
         """
@@ -11667,20 +9216,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Reserved IP Actions
         """
-        if reserved_ip is None:
-            raise ValueError("Missing required parameter 'reserved_ip'.")
-        if action_id is None:
-            raise ValueError("Missing required parameter 'action_id'.")
-        url = f"{self.base_url}/v2/reserved_ips/{reserved_ip}/actions/{action_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(reserved_ip=reserved_ip, action_id=action_id)
+        return self._call('GET', f"/v2/reserved_ips/{reserved_ip}/actions/{action_id}")
 
     def reserved_ipv_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -11700,16 +9237,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             [Public Preview] Reserved IPv6
         """
-        url = f"{self.base_url}/v2/reserved_ipv6"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/reserved_ipv6", query={'per_page': per_page, 'page': page})
 
     def reserved_ipv_create(self, region_slug: str) -> Any:
         """
@@ -11728,21 +9256,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             [Public Preview] Reserved IPv6
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/reserved_ipv6", body={
             'region_slug': region_slug,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/reserved_ipv6"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def reserved_ipv_get(self, reserved_ipv6: str) -> dict[str, Any]:
         """
@@ -11761,18 +9277,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             [Public Preview] Reserved IPv6
         """
-        if reserved_ipv6 is None:
-            raise ValueError("Missing required parameter 'reserved_ipv6'.")
-        url = f"{self.base_url}/v2/reserved_ipv6/{reserved_ipv6}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(reserved_ipv6=reserved_ipv6)
+        return self._call('GET', f"/v2/reserved_ipv6/{reserved_ipv6}")
 
     def reserved_ipv_delete(self, reserved_ipv6: str) -> Any:
         """
@@ -11791,18 +9297,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             [Public Preview] Reserved IPv6
         """
-        if reserved_ipv6 is None:
-            raise ValueError("Missing required parameter 'reserved_ipv6'.")
-        url = f"{self.base_url}/v2/reserved_ipv6/{reserved_ipv6}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(reserved_ipv6=reserved_ipv6)
+        return self._call('DELETE', f"/v2/reserved_ipv6/{reserved_ipv6}")
 
     def reserved_ipv_actions_post(self, reserved_ipv6: str, type: Optional[str] = None, droplet_id: Optional[int] = None) -> Any:
         """
@@ -11823,24 +9319,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             [Public Preview] Reserved IPv6 Actions
         """
-        if reserved_ipv6 is None:
-            raise ValueError("Missing required parameter 'reserved_ipv6'.")
-        request_body_data = None
-        request_body_data = {
+        _require(reserved_ipv6=reserved_ipv6)
+        return self._call('POST', f"/v2/reserved_ipv6/{reserved_ipv6}/actions", body={
             'type': type,
             'droplet_id': droplet_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/reserved_ipv6/{reserved_ipv6}/actions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def sizes_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -11860,16 +9343,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Sizes
         """
-        url = f"{self.base_url}/v2/sizes"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/sizes", query={'per_page': per_page, 'page': page}, ttl=_CATALOG_TTL)
 
     def snapshots_list(self, per_page: Optional[int] = None, page: Optional[int] = None, resource_type: Optional[str] = None) -> Any:
         """
@@ -11890,16 +9364,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Snapshots
         """
-        url = f"{self.base_url}/v2/snapshots"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('resource_type', resource_type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/snapshots", query={'per_page': per_page, 'page': page, 'resource_type': resource_type})
 
     def snapshots_get(self, snapshot_id: str) -> Any:
         """
@@ -11918,18 +9383,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Snapshots
         """
-        if snapshot_id is None:
-            raise ValueError("Missing required parameter 'snapshot_id'.")
-        url = f"{self.base_url}/v2/snapshots/{snapshot_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(snapshot_id=snapshot_id)
+        return self._call('GET', f"/v2/snapshots/{snapshot_id}")
 
     def snapshots_delete(self, snapshot_id: str) -> Any:
         """
@@ -11948,18 +9403,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Snapshots
         """
-        if snapshot_id is None:
-            raise ValueError("Missing required parameter 'snapshot_id'.")
-        url = f"{self.base_url}/v2/snapshots/{snapshot_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(snapshot_id=snapshot_id)
+        return self._call('DELETE', f"/v2/snapshots/{snapshot_id}")
 
     def spaces_key_list(self, per_page: Optional[int] = None, page: Optional[int] = None, sort: Optional[str] = None, sort_direction: Optional[str] = None, name: Optional[str] = None, bucket: Optional[str] = None, permission: Optional[str] = None) -> Any:
         """
@@ -11984,16 +9429,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Spaces Keys
         """
-        url = f"{self.base_url}/v2/spaces/keys"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('sort', sort), ('sort_direction', sort_direction), ('name', name), ('bucket', bucket), ('permission', permission)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/spaces/keys", query={'per_page': per_page, 'page': page, 'sort': sort, 'sort_direction': sort_direction, 'name': name, 'bucket': bucket, 'permission': permission})
 
     def spaces_key_create(self, name: Optional[str] = None, grants: Optional[List[dict[str, Any]]] = None, access_key: Optional[str] = None, created_at: Optional[str] = None) -> Any:
         """
@@ -12015,24 +9451,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Spaces Keys
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/spaces/keys", body={
             'name': name,
             'grants': grants,
             'access_key': access_key,
             'created_at': created_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/spaces/keys"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def spaces_key_get(self, access_key: str) -> Any:
         """
@@ -12051,18 +9475,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Spaces Keys
         """
-        if access_key is None:
-            raise ValueError("Missing required parameter 'access_key'.")
-        url = f"{self.base_url}/v2/spaces/keys/{access_key}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(access_key=access_key)
+        return self._call('GET', f"/v2/spaces/keys/{access_key}")
 
     def spaces_key_delete(self, access_key: str) -> Any:
         """
@@ -12081,18 +9495,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Spaces Keys
         """
-        if access_key is None:
-            raise ValueError("Missing required parameter 'access_key'.")
-        url = f"{self.base_url}/v2/spaces/keys/{access_key}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(access_key=access_key)
+        return self._call('DELETE', f"/v2/spaces/keys/{access_key}")
 
     def spaces_key_update(self, access_key: str, name: Optional[str] = None, grants: Optional[List[dict[str, Any]]] = None, access_key_body: Optional[str] = None, created_at: Optional[str] = None) -> Any:
         """
@@ -12115,26 +9519,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Spaces Keys
         """
-        if access_key is None:
-            raise ValueError("Missing required parameter 'access_key'.")
-        request_body_data = None
-        request_body_data = {
+        _require(access_key=access_key)
+        return self._call('PUT', f"/v2/spaces/keys/{access_key}", body={
             'name': name,
             'grants': grants,
             'access_key': access_key_body,
             'created_at': created_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/spaces/keys/{access_key}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def spaces_key_patch(self, access_key: str, name: Optional[str] = None, grants: Optional[List[dict[str, Any]]] = None, access_key_body: Optional[str] = None, created_at: Optional[str] = None) -> Any:
         """
@@ -12157,26 +9548,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Spaces Keys
         """
-        if access_key is None:
-            raise ValueError("Missing required parameter 'access_key'.")
-        request_body_data = None
-        request_body_data = {
+        _require(access_key=access_key)
+        return self._call('PATCH', f"/v2/spaces/keys/{access_key}", body={
             'name': name,
             'grants': grants,
             'access_key': access_key_body,
             'created_at': created_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/spaces/keys/{access_key}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def tags_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -12196,16 +9574,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Tags
         """
-        url = f"{self.base_url}/v2/tags"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/tags", query={'per_page': per_page, 'page': page}, conditional=True)
 
     def tags_create(self, name: Optional[str] = None, resources: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -12233,22 +9602,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Tags
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/tags", body={
             'name': name,
             'resources': resources,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/tags"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def tags_get(self, tag_id: str) -> dict[str, Any]:
         """
@@ -12267,18 +9624,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Tags
         """
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'.")
-        url = f"{self.base_url}/v2/tags/{tag_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(tag_id=tag_id)
+        return self._call('GET', f"/v2/tags/{tag_id}")
 
     def tags_delete(self, tag_id: str) -> Any:
         """
@@ -12297,18 +9644,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Tags
         """
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'.")
-        url = f"{self.base_url}/v2/tags/{tag_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(tag_id=tag_id)
+        return self._call('DELETE', f"/v2/tags/{tag_id}")
 
     def tags_assign_resources(self, tag_id: str, resources: List[Any]) -> Any:
         """
@@ -12328,23 +9665,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Tags
         """
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(tag_id=tag_id)
+        return self._call('POST', f"/v2/tags/{tag_id}/resources", body={
             'resources': resources,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/tags/{tag_id}/resources"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def tags_unassign_resources(self, tag_id: str, resources: List[Any]) -> Any:
         """
@@ -12364,22 +9688,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Tags
         """
-        if tag_id is None:
-            raise ValueError("Missing required parameter 'tag_id'.")
-        request_body_data = {
+        _require(tag_id=tag_id)
+        return self._call('DELETE', f"/v2/tags/{tag_id}/resources", body={
             'resources': resources,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/tags/{tag_id}/resources"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def volumes_list(self, name: Optional[str] = None, region: Optional[str] = None, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -12401,16 +9713,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage, important
         """
-        url = f"{self.base_url}/v2/volumes"
-        query_params = {k: v for k, v in [('name', name), ('region', region), ('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/volumes", query={'name': name, 'region': region, 'per_page': per_page, 'page': page})
 
     def volumes_create(self, id: Optional[str] = None, droplet_ids: Optional[List[int]] = None, name: Optional[str] = None, description: Optional[str] = None, size_gigabytes: Optional[int] = None, created_at: Optional[str] = None, tags: Optional[List[str]] = None, snapshot_id: Optional[str] = None, filesystem_type: Optional[str] = None, region: Optional[str] = None, filesystem_label: Optional[Any] = None) -> Any:
         """
@@ -12439,8 +9742,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage, important
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/volumes", body={
             'id': id,
             'droplet_ids': droplet_ids,
             'name': name,
@@ -12452,18 +9754,7 @@ class DigitaloceanApp(APIApplication):
             'filesystem_type': filesystem_type,
             'region': region,
             'filesystem_label': filesystem_label,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/volumes"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def volumes_delete_by_name(self, name: Optional[str] = None, region: Optional[str] = None) -> Any:
         """
@@ -12483,16 +9774,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        url = f"{self.base_url}/v2/volumes"
-        query_params = {k: v for k, v in [('name', name), ('region', region)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('DELETE', "/v2/volumes", query={'name': name, 'region': region})
 
     def volume_actions_post(self, per_page: Optional[int] = None, page: Optional[int] = None, type: Optional[str] = None, region: Optional[str] = None, droplet_id: Optional[int] = None, tags: Optional[List[str]] = None) -> Any:
         """
@@ -12516,24 +9798,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage Actions
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/volumes/actions", query={'per_page': per_page, 'page': page}, body={
             'type': type,
             'region': region,
             'droplet_id': droplet_id,
             'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/volumes/actions"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def volume_snapshots_get_by_id(self, snapshot_id: str) -> Any:
         """
@@ -12552,18 +9822,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        if snapshot_id is None:
-            raise ValueError("Missing required parameter 'snapshot_id'.")
-        url = f"{self.base_url}/v2/volumes/snapshots/{snapshot_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(snapshot_id=snapshot_id)
+        return self._call('GET', f"/v2/volumes/snapshots/{snapshot_id}")
 
     def volume_snapshots_delete_by_id(self, snapshot_id: str) -> Any:
         """
@@ -12582,18 +9842,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        if snapshot_id is None:
-            raise ValueError("Missing required parameter 'snapshot_id'.")
-        url = f"{self.base_url}/v2/volumes/snapshots/{snapshot_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(snapshot_id=snapshot_id)
+        return self._call('DELETE', f"/v2/volumes/snapshots/{snapshot_id}")
 
     def volumes_get(self, volume_id: str) -> Any:
         """
@@ -12612,18 +9862,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        url = f"{self.base_url}/v2/volumes/{volume_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(volume_id=volume_id)
+        return self._call('GET', f"/v2/volumes/{volume_id}")
 
     def volumes_delete(self, volume_id: str) -> Any:
         """
@@ -12642,18 +9882,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        url = f"{self.base_url}/v2/volumes/{volume_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(volume_id=volume_id)
+        return self._call('DELETE', f"/v2/volumes/{volume_id}")
 
     def volume_actions_list(self, volume_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -12674,18 +9904,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage Actions
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        url = f"{self.base_url}/v2/volumes/{volume_id}/actions"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(volume_id=volume_id)
+        return self._call('GET', f"/v2/volumes/{volume_id}/actions", query={'per_page': per_page, 'page': page})
 
     def volume_actions_post_by_id(self, volume_id: str, per_page: Optional[int] = None, page: Optional[int] = None, type: Optional[str] = None, region: Optional[str] = None, droplet_id: Optional[int] = None, tags: Optional[List[str]] = None, size_gigabytes: Optional[int] = None) -> Any:
         """
@@ -12711,27 +9931,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage Actions
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(volume_id=volume_id)
+        return self._call('POST', f"/v2/volumes/{volume_id}/actions", query={'per_page': per_page, 'page': page}, body={
             'type': type,
             'region': region,
             'droplet_id': droplet_id,
             'tags': tags,
             'size_gigabytes': size_gigabytes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/volumes/{volume_id}/actions"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def volume_actions_get(self, volume_id: str, action_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -12753,20 +9960,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage Actions
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        if action_id is None:
-            raise ValueError("Missing required parameter 'action_id'.")
-        url = f"{self.base_url}/v2/volumes/{volume_id}/actions/{action_id}"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(volume_id=volume_id, action_id=action_id)
+        return self._call('GET', f"/v2/volumes/{volume_id}/actions/{action_id}", query={'per_page': per_page, 'page': page})
 
     def volume_snapshots_list(self, volume_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -12787,18 +9982,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        url = f"{self.base_url}/v2/volumes/{volume_id}/snapshots"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(volume_id=volume_id)
+        return self._call('GET', f"/v2/volumes/{volume_id}/snapshots", query={'per_page': per_page, 'page': page})
 
     def volume_snapshots_create(self, volume_id: str, name: str, tags: Optional[List[str]] = None) -> Any:
         """
@@ -12819,24 +10004,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Block Storage
         """
-        if volume_id is None:
-            raise ValueError("Missing required parameter 'volume_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(volume_id=volume_id)
+        return self._call('POST', f"/v2/volumes/{volume_id}/snapshots", body={
             'name': name,
             'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/volumes/{volume_id}/snapshots"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpcs_list(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -12856,16 +10028,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        url = f"{self.base_url}/v2/vpcs"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/vpcs", query={'per_page': per_page, 'page': page}, conditional=True, ttl=_LISTING_TTL)
 
     def vpcs_create(self, name: str, region: str, description: Optional[str] = None, ip_range: Optional[str] = None) -> dict[str, Any]:
         """
@@ -12887,24 +10050,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/vpcs", body={
             'name': name,
             'description': description,
             'region': region,
             'ip_range': ip_range,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpcs"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpcs_get(self, vpc_id: str) -> dict[str, Any]:
         """
@@ -12923,18 +10074,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(vpc_id=vpc_id)
+        return self._call('GET', f"/v2/vpcs/{vpc_id}")
 
     def vpcs_update(self, vpc_id: str, name: str, description: Optional[str] = None, default: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -12956,25 +10097,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(vpc_id=vpc_id)
+        return self._call('PUT', f"/v2/vpcs/{vpc_id}", body={
             'name': name,
             'description': description,
             'default': default,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpcs_patch(self, vpc_id: str, name: Optional[str] = None, description: Optional[str] = None, default: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -12996,25 +10124,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(vpc_id=vpc_id)
+        return self._call('PATCH', f"/v2/vpcs/{vpc_id}", body={
             'name': name,
             'description': description,
             'default': default,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpcs_delete(self, vpc_id: str) -> Any:
         """
@@ -13033,18 +10148,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(vpc_id=vpc_id)
+        return self._call('DELETE', f"/v2/vpcs/{vpc_id}")
 
     def vpcs_list_members(self, vpc_id: str, resource_type: Optional[str] = None, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -13066,18 +10171,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}/members"
-        query_params = {k: v for k, v in [('resource_type', resource_type), ('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(vpc_id=vpc_id)
+        return self._call('GET', f"/v2/vpcs/{vpc_id}/members", query={'resource_type': resource_type, 'per_page': per_page, 'page': page})
 
     def vpcs_list_peerings(self, vpc_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -13098,18 +10193,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}/peerings"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(vpc_id=vpc_id)
+        return self._call('GET', f"/v2/vpcs/{vpc_id}/peerings", query={'per_page': per_page, 'page': page})
 
     def vpcs_create_peerings(self, vpc_id: str, name: str, vpc_id_body: str) -> dict[str, Any]:
         """
@@ -13130,24 +10215,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(vpc_id=vpc_id)
+        return self._call('POST', f"/v2/vpcs/{vpc_id}/peerings", body={
             'name': name,
             'vpc_id': vpc_id_body,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}/peerings"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpcs_patch_peerings(self, vpc_id: str, vpc_peering_id: str, name: str) -> dict[str, Any]:
         """
@@ -13168,25 +10240,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPCs
         """
-        if vpc_id is None:
-            raise ValueError("Missing required parameter 'vpc_id'.")
-        if vpc_peering_id is None:
-            raise ValueError("Missing required parameter 'vpc_peering_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(vpc_id=vpc_id, vpc_peering_id=vpc_peering_id)
+        return self._call('PATCH', f"/v2/vpcs/{vpc_id}/peerings/{vpc_peering_id}", body={
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpcs/{vpc_id}/peerings/{vpc_peering_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpc_peerings_list(self, per_page: Optional[int] = None, page: Optional[int] = None, region: Optional[str] = None) -> Any:
         """
@@ -13207,16 +10264,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPC Peerings
         """
-        url = f"{self.base_url}/v2/vpc_peerings"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page), ('region', region)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/vpc_peerings", query={'per_page': per_page, 'page': page, 'region': region})
 
     def vpc_peerings_create(self, name: str, vpc_ids: List[str]) -> dict[str, Any]:
         """
@@ -13236,22 +10284,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPC Peerings
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/vpc_peerings", body={
             'name': name,
             'vpc_ids': vpc_ids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpc_peerings"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpc_peerings_get(self, vpc_peering_id: str) -> dict[str, Any]:
         """
@@ -13270,18 +10306,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPC Peerings
         """
-        if vpc_peering_id is None:
-            raise ValueError("Missing required parameter 'vpc_peering_id'.")
-        url = f"{self.base_url}/v2/vpc_peerings/{vpc_peering_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(vpc_peering_id=vpc_peering_id)
+        return self._call('GET', f"/v2/vpc_peerings/{vpc_peering_id}")
 
     def vpc_peerings_patch(self, vpc_peering_id: str, name: str) -> dict[str, Any]:
         """
@@ -13301,23 +10327,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPC Peerings
         """
-        if vpc_peering_id is None:
-            raise ValueError("Missing required parameter 'vpc_peering_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(vpc_peering_id=vpc_peering_id)
+        return self._call('PATCH', f"/v2/vpc_peerings/{vpc_peering_id}", body={
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/vpc_peerings/{vpc_peering_id}"
-        query_params = {}
-        response = self._patch(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def vpc_peerings_delete(self, vpc_peering_id: str) -> dict[str, Any]:
         """
@@ -13336,18 +10349,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             VPC Peerings
         """
-        if vpc_peering_id is None:
-            raise ValueError("Missing required parameter 'vpc_peering_id'.")
-        url = f"{self.base_url}/v2/vpc_peerings/{vpc_peering_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(vpc_peering_id=vpc_peering_id)
+        return self._call('DELETE', f"/v2/vpc_peerings/{vpc_peering_id}")
 
     def uptime_list_checks(self, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -13367,16 +10370,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        url = f"{self.base_url}/v2/uptime/checks"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/uptime/checks", query={'per_page': per_page, 'page': page})
 
     def uptime_create_check(self, name: str, type: str, target: str, regions: List[str], enabled: bool) -> dict[str, Any]:
         """
@@ -13399,25 +10393,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/uptime/checks", body={
             'name': name,
             'type': type,
             'target': target,
             'regions': regions,
             'enabled': enabled,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/uptime/checks"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def uptime_get_check(self, check_id: str) -> dict[str, Any]:
         """
@@ -13436,18 +10418,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(check_id=check_id)
+        return self._call('GET', f"/v2/uptime/checks/{check_id}")
 
     def uptime_update_check(self, check_id: str, name: Optional[str] = None, type: Optional[str] = None, target: Optional[str] = None, regions: Optional[List[str]] = None, enabled: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -13471,27 +10443,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(check_id=check_id)
+        return self._call('PUT', f"/v2/uptime/checks/{check_id}", body={
             'name': name,
             'type': type,
             'target': target,
             'regions': regions,
             'enabled': enabled,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def uptime_delete_check(self, check_id: str) -> Any:
         """
@@ -13510,18 +10469,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(check_id=check_id)
+        return self._call('DELETE', f"/v2/uptime/checks/{check_id}")
 
     def uptime_get_check_state(self, check_id: str) -> dict[str, Any]:
         """
@@ -13540,18 +10489,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}/state"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(check_id=check_id)
+        return self._call('GET', f"/v2/uptime/checks/{check_id}/state")
 
     def uptime_list_alerts(self, check_id: str, per_page: Optional[int] = None, page: Optional[int] = None) -> Any:
         """
@@ -13572,18 +10511,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}/alerts"
-        query_params = {k: v for k, v in [('per_page', per_page), ('page', page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(check_id=check_id)
+        return self._call('GET', f"/v2/uptime/checks/{check_id}/alerts", query={'per_page': per_page, 'page': page})
 
     def uptime_create_alert(self, check_id: str, name: str, type: str, notifications: dict[str, Any], period: str, id: Optional[str] = None, threshold: Optional[int] = None, comparison: Optional[str] = None) -> dict[str, Any]:
         """
@@ -13609,10 +10538,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(check_id=check_id)
+        return self._call('POST', f"/v2/uptime/checks/{check_id}/alerts", body={
             'id': id,
             'name': name,
             'type': type,
@@ -13620,18 +10547,7 @@ class DigitaloceanApp(APIApplication):
             'comparison': comparison,
             'notifications': notifications,
             'period': period,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}/alerts"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def uptime_get_alert(self, check_id: str, alert_id: str) -> dict[str, Any]:
         """
@@ -13651,20 +10567,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        if alert_id is None:
-            raise ValueError("Missing required parameter 'alert_id'.")
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}/alerts/{alert_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(check_id=check_id, alert_id=alert_id)
+        return self._call('GET', f"/v2/uptime/checks/{check_id}/alerts/{alert_id}")
 
     def uptime_update_alert(self, check_id: str, alert_id: str, name: str, type: str, notifications: dict[str, Any], period: str, threshold: Optional[int] = None, comparison: Optional[str] = None) -> dict[str, Any]:
         """
@@ -13690,30 +10594,15 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        if alert_id is None:
-            raise ValueError("Missing required parameter 'alert_id'.")
-        request_body_data = None
-        request_body_data = {
+        _require(check_id=check_id, alert_id=alert_id)
+        return self._call('PUT', f"/v2/uptime/checks/{check_id}/alerts/{alert_id}", body={
             'name': name,
             'type': type,
             'threshold': threshold,
             'comparison': comparison,
             'notifications': notifications,
             'period': period,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}/alerts/{alert_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def uptime_delete_alert(self, check_id: str, alert_id: str) -> Any:
         """
@@ -13733,20 +10622,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             Uptime
         """
-        if check_id is None:
-            raise ValueError("Missing required parameter 'check_id'.")
-        if alert_id is None:
-            raise ValueError("Missing required parameter 'alert_id'.")
-        url = f"{self.base_url}/v2/uptime/checks/{check_id}/alerts/{alert_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(check_id=check_id, alert_id=alert_id)
+        return self._call('DELETE', f"/v2/uptime/checks/{check_id}/alerts/{alert_id}")
 
     def genai_list_agents(self, only_deployed: Optional[bool] = None, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -13767,16 +10644,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/agents"
-        query_params = {k: v for k, v in [('only_deployed', only_deployed), ('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/agents", query={'only_deployed': only_deployed, 'page': page, 'per_page': per_page})
 
     def genai_create_agent(self, anthropic_key_uuid: Optional[str] = None, description: Optional[str] = None, instruction: Optional[str] = None, knowledge_base_uuid: Optional[List[str]] = None, model_uuid: Optional[str] = None, name: Optional[str] = None, open_ai_key_uuid: Optional[str] = None, project_id: Optional[str] = None, region: Optional[str] = None, tags: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -13804,8 +10672,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/gen-ai/agents", body={
             'anthropic_key_uuid': anthropic_key_uuid,
             'description': description,
             'instruction': instruction,
@@ -13816,18 +10683,7 @@ class DigitaloceanApp(APIApplication):
             'project_id': project_id,
             'region': region,
             'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_list_agent_api_keys(self, agent_uuid: str, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -13848,18 +10704,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/api_keys"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid)
+        return self._call('GET', f"/v2/gen-ai/agents/{agent_uuid}/api_keys", query={'page': page, 'per_page': per_page})
 
     def genai_create_agent_api_key(self, agent_uuid: str, agent_uuid_body: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -13880,24 +10726,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(agent_uuid=agent_uuid)
+        return self._call('POST', f"/v2/gen-ai/agents/{agent_uuid}/api_keys", body={
             'agent_uuid': agent_uuid_body,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/api_keys"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_update_agent_api_key(self, agent_uuid: str, api_key_uuid: str, agent_uuid_body: Optional[str] = None, api_key_uuid_body: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -13920,27 +10753,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(agent_uuid=agent_uuid, api_key_uuid=api_key_uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{agent_uuid}/api_keys/{api_key_uuid}", body={
             'agent_uuid': agent_uuid_body,
             'api_key_uuid': api_key_uuid_body,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/api_keys/{api_key_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_delete_agent_api_key(self, agent_uuid: str, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -13960,20 +10778,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/api_keys/{api_key_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid, api_key_uuid=api_key_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/agents/{agent_uuid}/api_keys/{api_key_uuid}")
 
     def genai_regenerate_agent_api_key(self, agent_uuid: str, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -13993,21 +10799,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/api_keys/{api_key_uuid}/regenerate"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid, api_key_uuid=api_key_uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{agent_uuid}/api_keys/{api_key_uuid}/regenerate")
 
     def genai_attach_agent_function(self, agent_uuid: str, agent_uuid_body: Optional[str] = None, description: Optional[str] = None, faas_name: Optional[str] = None, faas_namespace: Optional[str] = None, function_name: Optional[str] = None, input_schema: Optional[dict[str, Any]] = None, output_schema: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -14033,10 +10826,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(agent_uuid=agent_uuid)
+        return self._call('POST', f"/v2/gen-ai/agents/{agent_uuid}/functions", body={
             'agent_uuid': agent_uuid_body,
             'description': description,
             'faas_name': faas_name,
@@ -14044,18 +10835,7 @@ class DigitaloceanApp(APIApplication):
             'function_name': function_name,
             'input_schema': input_schema,
             'output_schema': output_schema,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/functions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_update_agent_function(self, agent_uuid: str, function_uuid: str, agent_uuid_body: Optional[str] = None, description: Optional[str] = None, faas_name: Optional[str] = None, faas_namespace: Optional[str] = None, function_name: Optional[str] = None, function_uuid_body: Optional[str] = None, input_schema: Optional[dict[str, Any]] = None, output_schema: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -14083,12 +10863,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if function_uuid is None:
-            raise ValueError("Missing required parameter 'function_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(agent_uuid=agent_uuid, function_uuid=function_uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{agent_uuid}/functions/{function_uuid}", body={
             'agent_uuid': agent_uuid_body,
             'description': description,
             'faas_name': faas_name,
@@ -14097,18 +10873,7 @@ class DigitaloceanApp(APIApplication):
             'function_uuid': function_uuid_body,
             'input_schema': input_schema,
             'output_schema': output_schema,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/functions/{function_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_detach_agent_function(self, agent_uuid: str, function_uuid: str) -> dict[str, Any]:
         """
@@ -14128,20 +10893,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if function_uuid is None:
-            raise ValueError("Missing required parameter 'function_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/functions/{function_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid, function_uuid=function_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/agents/{agent_uuid}/functions/{function_uuid}")
 
     def genai_attach_knowledge_bases(self, agent_uuid: str) -> dict[str, Any]:
         """
@@ -14160,19 +10913,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/knowledge_bases"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid)
+        return self._call('POST', f"/v2/gen-ai/agents/{agent_uuid}/knowledge_bases")
 
     def genai_attach_knowledge_base(self, agent_uuid: str, knowledge_base_uuid: str) -> dict[str, Any]:
         """
@@ -14192,21 +10934,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if knowledge_base_uuid is None:
-            raise ValueError("Missing required parameter 'knowledge_base_uuid'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/knowledge_bases/{knowledge_base_uuid}"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid, knowledge_base_uuid=knowledge_base_uuid)
+        return self._call('POST', f"/v2/gen-ai/agents/{agent_uuid}/knowledge_bases/{knowledge_base_uuid}")
 
     def genai_detach_knowledge_base(self, agent_uuid: str, knowledge_base_uuid: str) -> dict[str, Any]:
         """
@@ -14226,20 +10955,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if agent_uuid is None:
-            raise ValueError("Missing required parameter 'agent_uuid'.")
-        if knowledge_base_uuid is None:
-            raise ValueError("Missing required parameter 'knowledge_base_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{agent_uuid}/knowledge_bases/{knowledge_base_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(agent_uuid=agent_uuid, knowledge_base_uuid=knowledge_base_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/agents/{agent_uuid}/knowledge_bases/{knowledge_base_uuid}")
 
     def genai_attach_agent(self, parent_agent_uuid: str, child_agent_uuid: str, child_agent_uuid_body: Optional[str] = None, if_case: Optional[str] = None, parent_agent_uuid_body: Optional[str] = None, route_name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14263,28 +10980,13 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if parent_agent_uuid is None:
-            raise ValueError("Missing required parameter 'parent_agent_uuid'.")
-        if child_agent_uuid is None:
-            raise ValueError("Missing required parameter 'child_agent_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(parent_agent_uuid=parent_agent_uuid, child_agent_uuid=child_agent_uuid)
+        return self._call('POST', f"/v2/gen-ai/agents/{parent_agent_uuid}/child_agents/{child_agent_uuid}", body={
             'child_agent_uuid': child_agent_uuid_body,
             'if_case': if_case,
             'parent_agent_uuid': parent_agent_uuid_body,
             'route_name': route_name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{parent_agent_uuid}/child_agents/{child_agent_uuid}"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_update_attached_agent(self, parent_agent_uuid: str, child_agent_uuid: str, child_agent_uuid_body: Optional[str] = None, if_case: Optional[str] = None, parent_agent_uuid_body: Optional[str] = None, route_name: Optional[str] = None, uuid: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14309,29 +11011,14 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if parent_agent_uuid is None:
-            raise ValueError("Missing required parameter 'parent_agent_uuid'.")
-        if child_agent_uuid is None:
-            raise ValueError("Missing required parameter 'child_agent_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(parent_agent_uuid=parent_agent_uuid, child_agent_uuid=child_agent_uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{parent_agent_uuid}/child_agents/{child_agent_uuid}", body={
             'child_agent_uuid': child_agent_uuid_body,
             'if_case': if_case,
             'parent_agent_uuid': parent_agent_uuid_body,
             'route_name': route_name,
             'uuid': uuid,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{parent_agent_uuid}/child_agents/{child_agent_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_detach_agent(self, parent_agent_uuid: str, child_agent_uuid: str) -> dict[str, Any]:
         """
@@ -14351,20 +11038,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if parent_agent_uuid is None:
-            raise ValueError("Missing required parameter 'parent_agent_uuid'.")
-        if child_agent_uuid is None:
-            raise ValueError("Missing required parameter 'child_agent_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{parent_agent_uuid}/child_agents/{child_agent_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(parent_agent_uuid=parent_agent_uuid, child_agent_uuid=child_agent_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/agents/{parent_agent_uuid}/child_agents/{child_agent_uuid}")
 
     def genai_get_agent(self, uuid: str) -> dict[str, Any]:
         """
@@ -14383,18 +11058,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/agents/{uuid}")
 
     def genai_update_agent(self, uuid: str, anthropic_key_uuid: Optional[str] = None, description: Optional[str] = None, instruction: Optional[str] = None, k: Optional[int] = None, max_tokens: Optional[int] = None, model_uuid: Optional[str] = None, name: Optional[str] = None, open_ai_key_uuid: Optional[str] = None, project_id: Optional[str] = None, provide_citations: Optional[bool] = None, retrieval_method: Optional[str] = None, tags: Optional[List[str]] = None, temperature: Optional[float] = None, top_p: Optional[float] = None, uuid_body: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14432,10 +11097,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(uuid=uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{uuid}", body={
             'anthropic_key_uuid': anthropic_key_uuid,
             'description': description,
             'instruction': instruction,
@@ -14451,18 +11114,7 @@ class DigitaloceanApp(APIApplication):
             'temperature': temperature,
             'top_p': top_p,
             'uuid': uuid_body,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_delete_agent(self, uuid: str) -> dict[str, Any]:
         """
@@ -14481,18 +11133,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('DELETE', f"/v2/gen-ai/agents/{uuid}")
 
     def genai_get_agent_children(self, uuid: str) -> dict[str, Any]:
         """
@@ -14511,18 +11153,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}/child_agents"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/agents/{uuid}/child_agents")
 
     def update_deployment_visibility(self, uuid: str, uuid_body: Optional[str] = None, visibility: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14547,24 +11179,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(uuid=uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{uuid}/deployment_visibility", body={
             'uuid': uuid_body,
             'visibility': visibility,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}/deployment_visibility"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_list_agent_versions(self, uuid: str, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -14585,18 +11204,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}/versions"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/agents/{uuid}/versions", query={'page': page, 'per_page': per_page})
 
     def update_agent_version_by_uuid(self, uuid: str, uuid_body: Optional[str] = None, version_hash: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14617,24 +11226,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(uuid=uuid)
+        return self._call('PUT', f"/v2/gen-ai/agents/{uuid}/versions", body={
             'uuid': uuid_body,
             'version_hash': version_hash,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/agents/{uuid}/versions"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_list_anthropic_api_keys(self, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -14654,16 +11250,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/anthropic/keys"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/anthropic/keys", query={'page': page, 'per_page': per_page})
 
     def genai_create_anthropic_api_key(self, api_key: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14683,22 +11270,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/gen-ai/anthropic/keys", body={
             'api_key': api_key,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/anthropic/keys"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_get_anthropic_api_key(self, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -14717,18 +11292,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/anthropic/keys/{api_key_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('GET', f"/v2/gen-ai/anthropic/keys/{api_key_uuid}")
 
     def genai_update_anthropic_api_key(self, api_key_uuid: str, api_key: Optional[str] = None, api_key_uuid_body: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14750,25 +11315,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('PUT', f"/v2/gen-ai/anthropic/keys/{api_key_uuid}", body={
             'api_key': api_key,
             'api_key_uuid': api_key_uuid_body,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/anthropic/keys/{api_key_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_delete_anthropic_api_key(self, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -14787,18 +11339,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/anthropic/keys/{api_key_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/anthropic/keys/{api_key_uuid}")
 
     def list_agents_by_key_uuid(self, uuid: str, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -14819,18 +11361,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/anthropic/keys/{uuid}/agents"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/anthropic/keys/{uuid}/agents", query={'page': page, 'per_page': per_page})
 
     def genai_list_indexing_jobs(self, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -14850,16 +11382,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/indexing_jobs"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/indexing_jobs", query={'page': page, 'per_page': per_page})
 
     def genai_create_indexing_job(self, data_source_uuids: Optional[List[str]] = None, knowledge_base_uuid: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14879,22 +11402,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/gen-ai/indexing_jobs", body={
             'data_source_uuids': data_source_uuids,
             'knowledge_base_uuid': knowledge_base_uuid,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/indexing_jobs"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def list_job_data_sources(self, indexing_job_uuid: str) -> dict[str, Any]:
         """
@@ -14913,18 +11424,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if indexing_job_uuid is None:
-            raise ValueError("Missing required parameter 'indexing_job_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/indexing_jobs/{indexing_job_uuid}/data_sources"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(indexing_job_uuid=indexing_job_uuid)
+        return self._call('GET', f"/v2/gen-ai/indexing_jobs/{indexing_job_uuid}/data_sources")
 
     def genai_get_indexing_job(self, uuid: str) -> dict[str, Any]:
         """
@@ -14943,18 +11444,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/indexing_jobs/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/indexing_jobs/{uuid}")
 
     def genai_cancel_indexing_job(self, uuid: str, uuid_body: Optional[str] = None) -> dict[str, Any]:
         """
@@ -14974,23 +11465,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(uuid=uuid)
+        return self._call('PUT', f"/v2/gen-ai/indexing_jobs/{uuid}/cancel", body={
             'uuid': uuid_body,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/indexing_jobs/{uuid}/cancel"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_list_knowledge_bases(self, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -15010,16 +11488,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/knowledge_bases", query={'page': page, 'per_page': per_page})
 
     def genai_create_knowledge_base(self, database_id: Optional[str] = None, datasources: Optional[List[dict[str, Any]]] = None, embedding_model_uuid: Optional[str] = None, name: Optional[str] = None, project_id: Optional[str] = None, region: Optional[str] = None, tags: Optional[List[str]] = None, vpc_uuid: Optional[str] = None) -> dict[str, Any]:
         """
@@ -15047,8 +11516,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/gen-ai/knowledge_bases", body={
             'database_id': database_id,
             'datasources': datasources,
             'embedding_model_uuid': embedding_model_uuid,
@@ -15057,18 +11525,7 @@ class DigitaloceanApp(APIApplication):
             'region': region,
             'tags': tags,
             'vpc_uuid': vpc_uuid,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def list_data_source_by_knowledge_base(self, knowledge_base_uuid: str, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -15089,18 +11546,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if knowledge_base_uuid is None:
-            raise ValueError("Missing required parameter 'knowledge_base_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases/{knowledge_base_uuid}/data_sources"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(knowledge_base_uuid=knowledge_base_uuid)
+        return self._call('GET', f"/v2/gen-ai/knowledge_bases/{knowledge_base_uuid}/data_sources", query={'page': page, 'per_page': per_page})
 
     def add_data_source(self, knowledge_base_uuid: str, knowledge_base_uuid_body: Optional[str] = None, spaces_data_source: Optional[dict[str, Any]] = None, web_crawler_data_source: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -15122,25 +11569,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if knowledge_base_uuid is None:
-            raise ValueError("Missing required parameter 'knowledge_base_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(knowledge_base_uuid=knowledge_base_uuid)
+        return self._call('POST', f"/v2/gen-ai/knowledge_bases/{knowledge_base_uuid}/data_sources", body={
             'knowledge_base_uuid': knowledge_base_uuid_body,
             'spaces_data_source': spaces_data_source,
             'web_crawler_data_source': web_crawler_data_source,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases/{knowledge_base_uuid}/data_sources"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def delete_data_source_by_uuid(self, knowledge_base_uuid: str, data_source_uuid: str) -> dict[str, Any]:
         """
@@ -15160,20 +11594,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if knowledge_base_uuid is None:
-            raise ValueError("Missing required parameter 'knowledge_base_uuid'.")
-        if data_source_uuid is None:
-            raise ValueError("Missing required parameter 'data_source_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases/{knowledge_base_uuid}/data_sources/{data_source_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(knowledge_base_uuid=knowledge_base_uuid, data_source_uuid=data_source_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/knowledge_bases/{knowledge_base_uuid}/data_sources/{data_source_uuid}")
 
     def genai_get_knowledge_base(self, uuid: str) -> dict[str, Any]:
         """
@@ -15192,18 +11614,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/knowledge_bases/{uuid}")
 
     def genai_update_knowledge_base(self, uuid: str, database_id: Optional[str] = None, embedding_model_uuid: Optional[str] = None, name: Optional[str] = None, project_id: Optional[str] = None, tags: Optional[List[str]] = None, uuid_body: Optional[str] = None) -> dict[str, Any]:
         """
@@ -15228,28 +11640,15 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(uuid=uuid)
+        return self._call('PUT', f"/v2/gen-ai/knowledge_bases/{uuid}", body={
             'database_id': database_id,
             'embedding_model_uuid': embedding_model_uuid,
             'name': name,
             'project_id': project_id,
             'tags': tags,
             'uuid': uuid_body,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases/{uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_delete_knowledge_base(self, uuid: str) -> dict[str, Any]:
         """
@@ -15268,18 +11667,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/knowledge_bases/{uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('DELETE', f"/v2/gen-ai/knowledge_bases/{uuid}")
 
     def genai_list_models(self, usecases: Optional[List[str]] = None, public_only: Optional[bool] = None, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -15309,16 +11698,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/models"
-        query_params = {k: v for k, v in [('usecases', usecases), ('public_only', public_only), ('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/models", query={'usecases': usecases, 'public_only': public_only, 'page': page, 'per_page': per_page}, ttl=_CATALOG_TTL)
 
     def genai_list_model_api_keys(self, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -15338,16 +11718,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/models/api_keys"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/models/api_keys", query={'page': page, 'per_page': per_page})
 
     def genai_create_model_api_key(self, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -15366,21 +11737,9 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/gen-ai/models/api_keys", body={
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/models/api_keys"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_update_model_api_key(self, api_key_uuid: str, api_key_uuid_body: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -15401,24 +11760,11 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('PUT', f"/v2/gen-ai/models/api_keys/{api_key_uuid}", body={
             'api_key_uuid': api_key_uuid_body,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/models/api_keys/{api_key_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_delete_model_api_key(self, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -15437,18 +11783,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/models/api_keys/{api_key_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/models/api_keys/{api_key_uuid}")
 
     def genai_regenerate_model_api_key(self, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -15467,19 +11803,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        request_body_data = None
-        url = f"{self.base_url}/v2/gen-ai/models/api_keys/{api_key_uuid}/regenerate"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('PUT', f"/v2/gen-ai/models/api_keys/{api_key_uuid}/regenerate")
 
     def genai_list_openai_api_keys(self, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -15499,16 +11824,7 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/openai/keys"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/openai/keys", query={'page': page, 'per_page': per_page})
 
     def genai_create_openai_api_key(self, api_key: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -15528,22 +11844,10 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        request_body_data = None
-        request_body_data = {
+        return self._call('POST', "/v2/gen-ai/openai/keys", body={
             'api_key': api_key,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/openai/keys"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_get_openai_api_key(self, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -15562,18 +11866,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/openai/keys/{api_key_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('GET', f"/v2/gen-ai/openai/keys/{api_key_uuid}")
 
     def genai_update_openai_api_key(self, api_key_uuid: str, api_key: Optional[str] = None, api_key_uuid_body: Optional[str] = None, name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -15595,25 +11889,12 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        request_body_data = None
-        request_body_data = {
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('PUT', f"/v2/gen-ai/openai/keys/{api_key_uuid}", body={
             'api_key': api_key,
             'api_key_uuid': api_key_uuid_body,
             'name': name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/v2/gen-ai/openai/keys/{api_key_uuid}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        })
 
     def genai_delete_openai_api_key(self, api_key_uuid: str) -> dict[str, Any]:
         """
@@ -15632,18 +11913,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if api_key_uuid is None:
-            raise ValueError("Missing required parameter 'api_key_uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/openai/keys/{api_key_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(api_key_uuid=api_key_uuid)
+        return self._call('DELETE', f"/v2/gen-ai/openai/keys/{api_key_uuid}")
 
     def get_agents_by_key_uuid(self, uuid: str, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
@@ -15664,18 +11935,8 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'.")
-        url = f"{self.base_url}/v2/gen-ai/openai/keys/{uuid}/agents"
-        query_params = {k: v for k, v in [('page', page), ('per_page', per_page)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        _require(uuid=uuid)
+        return self._call('GET', f"/v2/gen-ai/openai/keys/{uuid}/agents", query={'page': page, 'per_page': per_page})
 
     def genai_list_datacenter_regions(self, serves_inference: Optional[bool] = None, serves_batch: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -15695,469 +11956,192 @@ class DigitaloceanApp(APIApplication):
         Tags:
             GenAI Platform (Public Preview)
         """
-        url = f"{self.base_url}/v2/gen-ai/regions"
-        query_params = {k: v for k, v in [('serves_inference', serves_inference), ('serves_batch', serves_batch)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('GET', "/v2/gen-ai/regions", query={'serves_inference': serves_inference, 'serves_batch': serves_batch}, ttl=_CATALOG_TTL)
+
+    def inventory_scan(self, kinds: List[str]) -> dict[str, Any]:
+        """
+        Scan Account Inventory
+
+        Args:
+            kinds (array): The resource kinds to list concurrently. Supported kinds are `apps`, `cdn_endpoints`, `certificates`, `databases`, `domains`, `droplets`, `firewalls`, `kubernetes_clusters`, `load_balancers`, `projects`, `reserved_ips`, `snapshots`, `ssh_keys`, `tags`, `uptime_checks`, `volumes` and `vpcs`. Example: "['droplets', 'volumes', 'vpcs']".
+
+        Returns:
+            dict[str, Any]: A JSON object keyed by resource kind. Each value is the first page of that kind's list response.
+
+        Raises:
+            ValueError: Raised when an unsupported resource kind is requested.
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+
+        Tags:
+            Inventory
+        """
+        _require(kinds=kinds)
+        unknown = [kind for kind in kinds if kind not in _INVENTORY_KINDS]
+        if unknown:
+            raise ValueError(f"Unsupported inventory kind(s): {', '.join(unknown)}.")
+        futures = {kind: self._pool.submit(getattr(self, _INVENTORY_KINDS[kind])) for kind in kinds}
+        return {kind: future.result() for kind, future in futures.items()}
+
+    def flush_cache(self) -> None:
+        """
+        Flush Cached Responses
+
+        Clears the in-memory cache of read-only responses (regions, sizes, app regions and instance sizes, option catalogs, GenAI models and regions, VPC, project and certificate listings, database cluster details, configuration, CA, firewall rules, backups, replicas, users, connection pools, databases and migration status, the account, SSH keys and 1-Click apps), together with the bodies kept for ETag revalidation, so the next call fetches fresh data from the API.
+
+        Returns:
+            None: Nothing is returned.
+
+        Tags:
+            Cache
+        """
+        with self._ttl_lock:
+            self._ttl_cache.clear()
+        with self._etag_lock:
+            self._etag_cache.clear()
 
     def list_tools(self):
-        return [
-            self.one_clicks_list,
-            self.one_clicks_install_kubernetes,
-            self.account_get,
-            self.ssh_keys_list,
-            self.ssh_keys_create,
-            self.ssh_keys_get,
-            self.ssh_keys_update,
-            self.ssh_keys_delete,
-            self.actions_list,
-            self.actions_get,
-            self.apps_list,
-            self.apps_create,
-            self.apps_delete,
-            self.apps_get,
-            self.apps_update,
-            self.apps_restart,
-            self.get_app_component_logs,
-            self.get_component_execution_details,
-            self.apps_get_instances,
-            self.apps_list_deployments,
-            self.apps_create_deployment,
-            self.apps_get_deployment,
-            self.apps_cancel_deployment,
-            self.apps_get_logs,
-            self.apps_get_logs_aggregate,
-            self.apps_get_exec,
-            self.get_app_logs,
-            self.apps_list_instance_sizes,
-            self.apps_get_instance_size,
-            self.apps_list_regions,
-            self.apps_validate_app_spec,
-            self.apps_list_alerts,
-            self.apps_assign_alert_destinations,
-            self.apps_create_rollback,
-            self.apps_validate_rollback,
-            self.apps_commit_rollback,
-            self.apps_revert_rollback,
-            self.get_app_bandwidth_daily,
-            self.create_daily_bandwidth_metrics,
-            self.apps_get_health,
-            self.cdn_list_endpoints,
-            self.cdn_create_endpoint,
-            self.cdn_get_endpoint,
-            self.cdn_update_endpoints,
-            self.cdn_delete_endpoint,
-            self.cdn_purge_cache,
-            self.certificates_list,
-            self.certificates_create,
-            self.certificates_get,
-            self.certificates_delete,
-            self.balance_get,
-            self.billing_history_list,
-            self.invoices_list,
-            self.invoices_get_by_uuid,
-            self.invoices_get_csv_by_uuid,
-            self.invoices_get_pdf_by_uuid,
-            self.invoices_get_summary_by_uuid,
-            self.databases_list_options,
-            self.databases_list_clusters,
-            self.databases_create_cluster,
-            self.databases_get_cluster,
-            self.databases_destroy_cluster,
-            self.databases_get_config,
-            self.databases_patch_config,
-            self.databases_get_ca,
-            self.databases_get_migration_status,
-            self.start_online_migration,
-            self.delete_online_migration_by_id,
-            self.databases_update_region,
-            self.databases_update_cluster_size,
-            self.databases_list_firewall_rules,
-            self.update_database_cluster_firewall,
-            self.update_database_maintenance,
-            self.databases_install_update,
-            self.databases_list_backups,
-            self.databases_list_replicas,
-            self.databases_create_replica,
-            self.databases_list_events_logs,
-            self.databases_get_replica,
-            self.databases_destroy_replica,
-            self.databases_promote_replica,
-            self.databases_list_users,
-            self.databases_add_user,
-            self.databases_get_user,
-            self.databases_delete_user,
-            self.databases_update_user,
-            self.databases_reset_auth,
-            self.databases_list,
-            self.databases_add,
-            self.databases_get,
-            self.databases_delete,
-            self.databases_list_connection_pools,
-            self.databases_add_connection_pool,
-            self.databases_get_connection_pool,
-            self.update_database_pool,
-            self.delete_pool,
-            self.databases_get_eviction_policy,
-            self.update_eviction_policy,
-            self.databases_get_sql_mode,
-            self.databases_update_sql_mode,
-            self.databases_update_major_version,
-            self.databases_list_kafka_topics,
-            self.databases_create_kafka_topic,
-            self.databases_get_kafka_topic,
-            self.databases_update_kafka_topic,
-            self.databases_delete_kafka_topic,
-            self.databases_list_logsink,
-            self.databases_create_logsink,
-            self.databases_get_logsink,
-            self.databases_update_logsink,
-            self.databases_delete_logsink,
-            self.get_database_metrics_credentials,
-            self.update_database_credentials,
-            self.list_database_indexes,
-            self.delete_database_index_by_name,
-            self.domains_list,
-            self.domains_create,
-            self.domains_get,
-            self.domains_delete,
-            self.domains_list_records,
-            self.domains_create_record,
-            self.domains_get_record,
-            self.domains_patch_record,
-            self.domains_update_record,
-            self.domains_delete_record,
-            self.droplets_list,
-            self.droplets_create,
-            self.droplets_destroy_by_tag,
-            self.droplets_get,
-            self.droplets_destroy,
-            self.droplets_list_backups,
-            self.droplets_get_backup_policy,
-            self.droplets_list_backup_policies,
-            self.list_supported_policies,
-            self.droplets_list_snapshots,
-            self.droplet_actions_list,
-            self.droplet_actions_post,
-            self.droplet_actions_post_by_tag,
-            self.droplet_actions_get,
-            self.droplets_list_kernels,
-            self.droplets_list_firewalls,
-            self.droplets_list_neighbors,
-            self.destroy_droplet_with_resources,
-            self.destroy_select,
-            self.delete_droplet_resources,
-            self.get_droplet_status,
-            self.retry_droplet_with_resources,
-            self.autoscalepools_list,
-            self.autoscalepools_create,
-            self.autoscalepools_get,
-            self.autoscalepools_update,
-            self.autoscalepools_delete,
-            self.delete_autoscale_pool_dangerously,
-            self.autoscalepools_list_members,
-            self.autoscalepools_list_history,
-            self.firewalls_list,
-            self.firewalls_create,
-            self.firewalls_get,
-            self.firewalls_update,
-            self.firewalls_delete,
-            self.firewalls_assign_droplets,
-            self.firewalls_delete_droplets,
-            self.firewalls_add_tags,
-            self.firewalls_delete_tags,
-            self.firewalls_add_rules,
-            self.firewalls_delete_rules,
-            self.floating_ips_list,
-            self.floating_ips_create,
-            self.floating_ips_get,
-            self.floating_ips_delete,
-            self.floating_ips_action_list,
-            self.floating_ips_action_post,
-            self.floating_ips_action_get,
-            self.functions_list_namespaces,
-            self.functions_create_namespace,
-            self.functions_get_namespace,
-            self.functions_delete_namespace,
-            self.functions_list_triggers,
-            self.functions_create_trigger,
-            self.functions_get_trigger,
-            self.functions_update_trigger,
-            self.functions_delete_trigger,
-            self.images_list,
-            self.images_create_custom,
-            self.images_get,
-            self.images_update,
-            self.images_delete,
-            self.image_actions_list,
-            self.image_actions_post,
-            self.image_actions_get,
-            self.kubernetes_list_clusters,
-            self.kubernetes_create_cluster,
-            self.kubernetes_get_cluster,
-            self.kubernetes_update_cluster,
-            self.kubernetes_delete_cluster,
-            self.destroy_cluster_resources,
-            self.delete_cluster_resources,
-            self.destroy_cluster_with_resources,
-            self.kubernetes_get_kubeconfig,
-            self.kubernetes_get_credentials,
-            self.get_cluster_upgrades,
-            self.kubernetes_upgrade_cluster,
-            self.kubernetes_list_node_pools,
-            self.kubernetes_add_node_pool,
-            self.kubernetes_get_node_pool,
-            self.kubernetes_update_node_pool,
-            self.kubernetes_delete_node_pool,
-            self.kubernetes_delete_node,
-            self.kubernetes_recycle_node_pool,
-            self.kubernetes_get_cluster_user,
-            self.kubernetes_list_options,
-            self.kubernetes_run_cluster_lint,
-            self.get_cluster_lint,
-            self.kubernetes_add_registry,
-            self.kubernetes_remove_registry,
-            self.kubernetes_get_status_messages,
-            self.load_balancers_create,
-            self.load_balancers_list,
-            self.load_balancers_get,
-            self.load_balancers_update,
-            self.load_balancers_delete,
-            self.load_balancers_delete_cache,
-            self.load_balancers_add_droplets,
-            self.load_balancers_remove_droplets,
-            self.add_forwarding_rule,
-            self.delete_lb_forwarding_rules,
-            self.monitoring_list_alert_policy,
-            self.monitoring_create_alert_policy,
-            self.monitoring_get_alert_policy,
-            self.monitoring_update_alert_policy,
-            self.monitoring_delete_alert_policy,
-            self.get_droplet_bandwidth_metrics,
-            self.get_droplet_cpu_metrics,
-            self.get_droplet_filesystem_free,
-            self.get_droplet_filesystem_size,
-            self.get_droplet_load_metrics,
-            self.get_droplet_load5_metrics,
-            self.get_droplet_load_metric,
-            self.get_droplet_memory_cached,
-            self.get_droplet_memory_free,
-            self.get_droplet_memory_total,
-            self.get_droplet_memory_available,
-            self.get_app_memory_percentage,
-            self.get_app_cpu_metrics,
-            self.get_app_restart_count,
-            self.get_frontend_connections,
-            self.get_lb_frontend_connections_limit,
-            self.get_frontend_cpu_utilization,
-            self.get_frontend_firewall_bytes,
-            self.get_lb_frontend_fw_dropped_pkts,
-            self.get_load_balancer_responses,
-            self.fetch_frontend_request_rate,
-            self.get_frontend_network_throughput,
-            self.get_frontend_udp_throughput,
-            self.get_frontend_tcp_throughput,
-            self.get_frontend_nlb_tcp_throughput,
-            self.get_nlb_udp_throughput,
-            self.get_frontend_tls_connections,
-            self.get_frontend_tls_connections_limit,
-            self.get_tls_exceeding_rate_limit,
-            self.get_droplet_session_duration_avg,
-            self.get_droplet_session_duration_50p,
-            self.get_droplet_session_duration_95p,
-            self.get_droplet_response_time,
-            self.get_droplet_http_response_time,
-            self.get_droplets_http_response_timep_95p,
-            self.get_droplets_http_response_timep_99p,
-            self.get_droplet_queue_size,
-            self.get_droplet_responses,
-            self.get_droplet_connections,
-            self.get_droplet_health_checks,
-            self.get_load_balancer_downtime,
-            self.get_current_autoscale_instances,
-            self.list_target_instances,
-            self.get_droplet_cpu_utilization,
-            self.get_droplet_target_cpu_utilization,
-            self.get_droplet_memory_utilization,
-            self.get_autoscale_memory_target,
-            self.monitoring_create_destination,
-            self.monitoring_list_destinations,
-            self.monitoring_get_destination,
-            self.monitoring_update_destination,
-            self.monitoring_delete_destination,
-            self.monitoring_create_sink,
-            self.monitoring_list_sinks,
-            self.monitoring_get_sink,
-            self.monitoring_delete_sink,
-            self.partner_attachments_list,
-            self.partner_attachments_create,
-            self.partner_attachments_get,
-            self.partner_attachments_patch,
-            self.partner_attachments_delete,
-            self.get_bgp_auth_key_by_pa_id,
-            self.get_partner_network_remote_routes,
-            self.update_remote_routes,
-            self.get_partner_service_key,
-            self.create_service_key,
-            self.projects_list,
-            self.projects_create,
-            self.projects_get_default,
-            self.projects_update_default,
-            self.projects_patch_default,
-            self.projects_get,
-            self.projects_update,
-            self.projects_patch,
-            self.projects_delete,
-            self.projects_list_resources,
-            self.projects_assign_resources,
-            self.list_project_resources,
-            self.create_default_project_resource,
-            self.regions_list,
-            self.registry_get,
-            self.registry_create,
-            self.registry_delete,
-            self.registry_get_subscription,
-            self.registry_update_subscription,
-            self.registry_get_docker_credentials,
-            self.registry_validate_name,
-            self.registry_list_repositories,
-            self.registry_list_repositories_v,
-            self.registry_list_repository_tags,
-            self.registry_delete_repository_tag,
-            self.get_repository_digests,
-            self.delete_manifest_digest,
-            self.registry_run_garbage_collection,
-            self.registry_get_garbage_collection,
-            self.list_registry_garbage_collections,
-            self.update_garbage_collection,
-            self.registry_get_options,
-            self.droplets_list_neighbors_ids,
-            self.reserved_ips_list,
-            self.reserved_ips_create,
-            self.reserved_ips_get,
-            self.reserved_ips_delete,
-            self.reserved_ips_actions_list,
-            self.reserved_ips_actions_post,
-            self.reserved_ips_actions_get,
-            self.reserved_ipv_list,
-            self.reserved_ipv_create,
-            self.reserved_ipv_get,
-            self.reserved_ipv_delete,
-            self.reserved_ipv_actions_post,
-            self.sizes_list,
-            self.snapshots_list,
-            self.snapshots_get,
-            self.snapshots_delete,
-            self.spaces_key_list,
-            self.spaces_key_create,
-            self.spaces_key_get,
-            self.spaces_key_delete,
-            self.spaces_key_update,
-            self.spaces_key_patch,
-            self.tags_list,
-            self.tags_create,
-            self.tags_get,
-            self.tags_delete,
-            self.tags_assign_resources,
-            self.tags_unassign_resources,
-            self.volumes_list,
-            self.volumes_create,
-            self.volumes_delete_by_name,
-            self.volume_actions_post,
-            self.volume_snapshots_get_by_id,
-            self.volume_snapshots_delete_by_id,
-            self.volumes_get,
-            self.volumes_delete,
-            self.volume_actions_list,
-            self.volume_actions_post_by_id,
-            self.volume_actions_get,
-            self.volume_snapshots_list,
-            self.volume_snapshots_create,
-            self.vpcs_list,
-            self.vpcs_create,
-            self.vpcs_get,
-            self.vpcs_update,
-            self.vpcs_patch,
-            self.vpcs_delete,
-            self.vpcs_list_members,
-            self.vpcs_list_peerings,
-            self.vpcs_create_peerings,
-            self.vpcs_patch_peerings,
-            self.vpc_peerings_list,
-            self.vpc_peerings_create,
-            self.vpc_peerings_get,
-            self.vpc_peerings_patch,
-            self.vpc_peerings_delete,
-            self.uptime_list_checks,
-            self.uptime_create_check,
-            self.uptime_get_check,
-            self.uptime_update_check,
-            self.uptime_delete_check,
-            self.uptime_get_check_state,
-            self.uptime_list_alerts,
-            self.uptime_create_alert,
-            self.uptime_get_alert,
-            self.uptime_update_alert,
-            self.uptime_delete_alert,
-            self.genai_list_agents,
-            self.genai_create_agent,
-            self.genai_list_agent_api_keys,
-            self.genai_create_agent_api_key,
-            self.genai_update_agent_api_key,
-            self.genai_delete_agent_api_key,
-            self.genai_regenerate_agent_api_key,
-            self.genai_attach_agent_function,
-            self.genai_update_agent_function,
-            self.genai_detach_agent_function,
-            self.genai_attach_knowledge_bases,
-            self.genai_attach_knowledge_base,
-            self.genai_detach_knowledge_base,
-            self.genai_attach_agent,
-            self.genai_update_attached_agent,
-            self.genai_detach_agent,
-            self.genai_get_agent,
-            self.genai_update_agent,
-            self.genai_delete_agent,
-            self.genai_get_agent_children,
-            self.update_deployment_visibility,
-            self.genai_list_agent_versions,
-            self.update_agent_version_by_uuid,
-            self.genai_list_anthropic_api_keys,
-            self.genai_create_anthropic_api_key,
-            self.genai_get_anthropic_api_key,
-            self.genai_update_anthropic_api_key,
-            self.genai_delete_anthropic_api_key,
-            self.list_agents_by_key_uuid,
-            self.genai_list_indexing_jobs,
-            self.genai_create_indexing_job,
-            self.list_job_data_sources,
-            self.genai_get_indexing_job,
-            self.genai_cancel_indexing_job,
-            self.genai_list_knowledge_bases,
-            self.genai_create_knowledge_base,
-            self.list_data_source_by_knowledge_base,
-            self.add_data_source,
-            self.delete_data_source_by_uuid,
-            self.genai_get_knowledge_base,
-            self.genai_update_knowledge_base,
-            self.genai_delete_knowledge_base,
-            self.genai_list_models,
-            self.genai_list_model_api_keys,
-            self.genai_create_model_api_key,
-            self.genai_update_model_api_key,
-            self.genai_delete_model_api_key,
-            self.genai_regenerate_model_api_key,
-            self.genai_list_openai_api_keys,
-            self.genai_create_openai_api_key,
-            self.genai_get_openai_api_key,
-            self.genai_update_openai_api_key,
-            self.genai_delete_openai_api_key,
-            self.get_agents_by_key_uuid,
-            self.genai_list_datacenter_regions
-        ]
+        return [_instrumented(name, getattr(self, name)) for name in type(self)._TOOL_NAMES]
+
+    def iter_tools(self):
+        for name in type(self)._TOOL_NAMES:
+            yield _instrumented(name, getattr(self, name))
+
+    @functools.cached_property
+    def tools_by_name(self) -> dict[str, Callable]:
+        """
+        Maps each tool name to its bound method so dispatch is a single dict lookup.
+        """
+        return {name: _instrumented(name, getattr(self, name)) for name in type(self)._TOOL_NAMES}
+
+    def list_tools_json(self) -> bytes:
+        """
+        Returns the JSON-encoded name, description, tags and parameter schema of every tool.
+
+        The schemas only depend on the class, so they are introspected once and then served from a class-level cache.
+        """
+        cls = type(self)
+        schema = cls.__dict__.get('_tools_schema_json')
+        if schema is None:
+            schema = _dumps([
+                Tool.from_function(getattr(self, name)).model_dump(include={'name', 'description', 'tags', 'parameters'})
+                for name in cls._TOOL_NAMES
+            ])
+            cls._tools_schema_json = schema
+        return schema
+
+    def get_tool(self, name: str) -> Callable:
+        """
+        Returns the tool registered under `name`, rejecting unknown names with a set lookup.
+        """
+        if name not in type(self)._TOOL_NAME_SET:
+            raise ToolError(f"Tool '{name}' not found in the digitalocean application.")
+        return self.tools_by_name[name]
+
+    def iter_log_lines(self, url: str) -> Iterator[str]:
+        """
+        Streams a log from one of the `historic_urls` or the `live_url` returned by the app log tools, yielding lines as they arrive instead of buffering the whole body.
+
+        Args:
+            url: A pre-signed log URL; it is fetched without the API credentials, which must not leak to the log host.
+
+        Returns:
+            Iterator[str]: The log lines, in order. A live log keeps yielding until the server closes the stream.
+        """
+        with httpx.stream('GET', url, timeout=httpx.Timeout(self.default_timeout, read=None)) as response:
+            response.raise_for_status()
+            yield from response.iter_lines()
+
+    def invoices_download_pdf(self, invoice_uuid: str, dest_path: str) -> str:
+        """
+        Streams an invoice PDF to `dest_path` in chunks instead of holding it in memory. It is not exposed as a tool, since that would let any MCP client write files on the server.
+
+        The body is written to a temporary file next to `dest_path`, which replaces the destination only once the download has completed, so a failed download never leaves a truncated PDF behind.
+
+        Args:
+            invoice_uuid: The invoice to download.
+            dest_path: Local file path the PDF is written to; an existing file is replaced.
+
+        Returns:
+            str: The path the PDF was written to.
+        """
+        _require(invoice_uuid=invoice_uuid, dest_path=dest_path)
+        response = self._send('GET', f"{self.base_url}/v2/customers/my/invoices/{invoice_uuid}/pdf", headers={'Accept': 'application/pdf'}, stream=True)
+        try:
+            response.raise_for_status()
+            directory = os.path.dirname(os.path.abspath(dest_path))
+            with tempfile.NamedTemporaryFile('wb', dir=directory, prefix='.', suffix='.part', delete=False) as file:
+                try:
+                    for chunk in response.iter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        file.write(chunk)
+                except BaseException:
+                    file.close()
+                    os.unlink(file.name)
+                    raise
+            os.replace(file.name, dest_path)
+        finally:
+            response.close()
+        return dest_path
+
+    async def fetch_many(self, requests: List[dict[str, Any]], concurrency: int = _FETCH_CONCURRENCY) -> List[Any]:
+        """
+        Sends many API requests concurrently over the asynchronous client, with at most `concurrency` in flight.
+
+        Args:
+            requests: One dict per request with a `path` below the API base URL (e.g. `/v2/apps/{id}/deployments`) and optional `method` (default `GET`), `query`, `body` and, for GETs, a cache `ttl` in seconds.
+            concurrency: Upper bound on simultaneous requests, so large batches do not flood the connection pool or the API rate limit.
+
+        Returns:
+            List[Any]: The decoded responses, in the order the requests were given.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(spec: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._acall(spec.get('method', 'GET'), spec['path'], query=spec.get('query'), body=spec.get('body'), ttl=spec.get('ttl'))
+
+        return list(await asyncio.gather(*(fetch(spec) for spec in requests)))
+
+    async def list_all(self, path: str, key: str, per_page: int = _MAX_PER_PAGE, **query: Any) -> List[Any]:
+        """
+        Collects every item of a paginated list endpoint, fetching the pages after the first concurrently.
+
+        Args:
+            path: List endpoint below the API base URL, e.g. `/v2/apps`.
+            key: Response key holding each page's items, e.g. `apps`.
+            per_page: Page size; the API caps it at 200.
+            **query: Further query parameters sent with every page.
+
+        Returns:
+            List[Any]: The items of every page, in order.
+        """
+        first = await self._acall('GET', path, query={**query, 'page': 1, 'per_page': per_page}) or {}
+        items = list(first.get(key) or ())
+        total = (first.get('meta') or {}).get('total') or len(items)
+        pages = -(-total // per_page)
+        rest = await self.fetch_many([
+            {'path': path, 'query': {**query, 'page': page, 'per_page': per_page}} for page in range(2, pages + 1)
+        ])
+        for body in rest:
+            items.extend((body or {}).get(key) or ())
+        return items
+
+    def paginate(self, tool: str, key: str, **kwargs: Any) -> Iterator[Any]:
+        """
+        Yields the items of a paginated list tool, fetching each page only when the previous one is exhausted.
+
+        Args:
+            tool: Name of a list tool that accepts a `page` argument, e.g. `registry_list_repository_tags`.
+            key: Response key holding each page's items, e.g. `tags`.
+            **kwargs: Further arguments passed to the tool for every page, e.g. `per_page`.
+
+        Returns:
+            Iterator[Any]: The items of every page, in order.
+        """
+        fetch = self.get_tool(tool)
+        page = kwargs.pop('page', None) or 1
+        while True:
+            body = fetch(page=page, **kwargs) or {}
+            yield from body.get(key) or ()
+            if not ((body.get('links') or {}).get('pages') or {}).get('next'):
+                return
+            page += 1